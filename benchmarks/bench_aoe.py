@@ -0,0 +1,58 @@
+"""
+Micro-benchmark of area of effect attacks on a pack of enemies
+(Weapon.get_targets + CombatManager.apply_damage).
+
+Run from the repository root:
+
+    python benchmarks/bench_aoe.py
+"""
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from combat.combat_manager import CombatManager
+from combat.factory import WeaponFactory
+from core.archetypes import EnemyArchetype
+from core.registry import Registry
+from core.spatial import SpatialIndex
+from entities.enemy import Enemy
+
+
+def main():
+    Registry._enemies = {"basic_enemy": EnemyArchetype("basic_enemy", health=10**9)}
+    rng = np.random.default_rng(0)
+    owner = SimpleNamespace(x=0, y=0, damage_mult=1.0)
+
+    for weapon_id in ("fireball_staff", "mega_hammer"):
+        weapon = WeaponFactory.create_weapon(weapon_id)
+        weapon.behavior_func = None
+        combat = CombatManager(owner)
+        combat.weapons.append(weapon)
+
+        # 1,000 enemies inside the blast, alone then among 9,000 more
+        radius = weapon.aoe_radius
+        angles = rng.uniform(0, 2 * np.pi, 1_000)
+        distances = radius * np.sqrt(rng.uniform(0, 1, 1_000))
+        pack = np.column_stack((2500 + distances * np.cos(angles), 2500 + distances * np.sin(angles)))
+        others = rng.uniform(0, 5000, (9_000, 2))
+        for positions in (pack, np.vstack((pack, others))):
+            enemies = [Enemy(None, x, y) for x, y in positions.tolist()]
+            primary = min(enemies, key=lambda e: (e.x - 2500) ** 2 + (e.y - 2500) ** 2)
+
+            def hit():
+                index = SpatialIndex(enemies)  # Includes building the tick's index
+                combat.apply_damage(weapon.get_targets(primary, index), weapon.damage, primary)
+
+            runs = 100
+            seconds = timeit.timeit(hit, number=runs) / runs
+            hits = len(weapon.get_targets(primary, enemies))
+            print(f"{weapon.name:15s} {hits:5d} hits out of {len(enemies):5d} enemies "
+                  f"{seconds * 1e3:7.3f} ms/attack")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Micro-benchmark of physics.check_collision and the batch check_collisions.
+
+Run from the repository root:
+
+    python benchmarks/bench_collision.py
+"""
+import os
+import sys
+import timeit
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from config.settings import BASE_DIR, CELL_SIZE, GRID_HEIGHT_PIX, GRID_WIDTH_PIX
+from core.physics import check_collision, check_collisions
+from core.registry import Registry
+from levels.loader import WorldLoader
+
+
+def legacy_check_collision(x, y, width, height, bounds, world):
+    """check_collision before the walkability bitmask, for reference."""
+    min_x, min_y, max_x, max_y = bounds
+    pixel_w = width * CELL_SIZE
+    pixel_h = height * CELL_SIZE
+    if x < min_x or x > max_x - pixel_w:
+        return True
+    if y < min_y or y > max_y - pixel_h:
+        return True
+    corners = [
+        (x, y),
+        (x + pixel_w - 0.1, y),
+        (x, y + pixel_h - 0.1),
+        (x + pixel_w - 0.1, y + pixel_h - 0.1),
+    ]
+    for cx, cy in corners:
+        grid_x = int((cx - min_x) / CELL_SIZE)
+        grid_y = int((cy - min_y) / CELL_SIZE)
+        cell_data = world.get_cell_full(grid_x, grid_y)
+        if cell_data:
+            cell, offset = cell_data
+            if not cell.walkable:
+                return (cell, grid_x - offset[0], grid_y - offset[1])
+    return False
+
+
+def main():
+    Registry.load_cells(os.path.join(BASE_DIR, "config", "environments.json"), load_textures=False)
+    loader = WorldLoader(seed=1)
+    world = loader.generate()
+    bounds = (0, 0, GRID_WIDTH_PIX, GRID_HEIGHT_PIX)
+
+    # Free spot in a room (the common case: moving without touching walls)
+    rx, ry, rw, rh = loader.rooms[0]
+    x, y = (rx + 1) * CELL_SIZE + 3, (ry + 1) * CELL_SIZE + 3
+    assert check_collision(x, y, 1, 1, bounds, world) is False
+
+    number = 200_000
+    for name, func in (("legacy", legacy_check_collision), ("bitmask", check_collision)):
+        seconds = timeit.timeit(lambda: func(x, y, 1, 1, bounds, world), number=number)
+        print(f"check_collision {name:8s} {seconds / number * 1e9:8.1f} ns/call")
+
+    rng = np.random.default_rng(0)
+    count = 10_000
+    boxes = np.column_stack((
+        rng.uniform(0, GRID_WIDTH_PIX - CELL_SIZE, count),
+        rng.uniform(0, GRID_HEIGHT_PIX - CELL_SIZE, count),
+        np.ones(count),  # Width and height in cells
+        np.ones(count),
+    ))
+    expected = [bool(check_collision(bx, by, bw, bh, bounds, world)) for bx, by, bw, bh in boxes]
+    assert check_collisions(boxes, bounds, world).tolist() == expected
+
+    runs = 200
+    seconds = timeit.timeit(lambda: check_collisions(boxes, bounds, world), number=runs)
+    print(f"check_collisions {count} boxes {seconds / runs * 1e3:8.3f} ms/batch "
+          f"({seconds / runs / count * 1e9:.1f} ns/box)")
+
+
+if __name__ == "__main__":
+    main()
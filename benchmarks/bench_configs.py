@@ -0,0 +1,107 @@
+"""
+Micro-benchmark of the compiled configs (core/archetypes.py): loading the
+JSON configs compiled vs from the cache, and spawning enemies and items
+from their archetypes vs the former per field config reads.
+
+Run from the repository root:
+
+    python benchmarks/bench_configs.py
+"""
+import json
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from config.settings import BASE_DIR, COLOR_ENEMY, COLOR_RARITY, ENEMY_DAMAGE, ENEMY_HEALTH, ENEMY_SPEED
+from core.archetypes import load_archetypes
+from core.registry import Registry
+from entities.base import GridObject
+from entities.enemy import Enemy
+from items.factory import ItemFactory
+from items.item import Item
+
+CONFIGS = (
+    ("environments", os.path.join(BASE_DIR, "config", "environments.json"), None),
+    ("enemies", os.path.join(BASE_DIR, "config", "enemies.json"), None),
+    ("weapons", os.path.join(BASE_DIR, "config", "weapons.json"), BASE_DIR),
+    ("items", os.path.join(BASE_DIR, "config", "items.json"), BASE_DIR),
+)
+
+
+def legacy_enemy_reset(enemy, game, x, y, enemy_type, config):
+    """Enemy.reset before the archetypes (per field config reads), for reference."""
+    GridObject.__init__(
+        enemy, x, y, config.get("width", 1), config.get("height", 1),
+        color=tuple(config.get("color", COLOR_ENEMY)),
+    )
+    enemy.game = game
+    enemy.speed = config.get("speed", ENEMY_SPEED)
+    enemy.health = enemy.max_health = config.get("health", ENEMY_HEALTH)
+    enemy.damage = config.get("damage", ENEMY_DAMAGE)
+    enemy.xp_value = config.get("xp_value", 10)
+    enemy.texture = config.get("texture")
+    enemy.enemy_type = enemy_type
+    enemy.generation = getattr(enemy, "generation", 0) + 1
+    enemy.last_update = None
+
+
+def legacy_item_reset(item, x, y, item_data):
+    """Item.reset before the archetypes, for reference."""
+    item.rarity_color = COLOR_RARITY.get(item_data["rarity"], (255, 255, 255))
+    item.item_color = item_data.get("color", item.rarity_color)
+    GridObject.__init__(item, x, y, 1.0, 1.0, color=item.item_color)
+    item.name = item_data["name"]
+    item.type = item_data["type"]
+    item.rarity = item_data["rarity"]
+    item.effects = item_data["effects"]
+    item.description = item_data["description"]
+    item.target_weapon = item_data.get("target_weapon", None)
+    item.target_tag = item_data.get("target_tag", None)
+    item.duration = item_data.get("duration", 0)
+    item.texture_path = item_data.get("texture_path", None)
+    item.image = None
+
+
+def main():
+    runs = 200
+    with tempfile.TemporaryDirectory() as cache_dir:
+        def load_all(use_cache):
+            for kind, path, base_dir in CONFIGS:
+                load_archetypes(kind, path, base_dir, cache_dir=cache_dir, use_cache=use_cache)
+
+        compiled = timeit.timeit(lambda: load_all(False), number=runs)
+        load_all(True)  # Fill the cache
+        cached = timeit.timeit(lambda: load_all(True), number=runs)
+    print(f"Loading the 4 configs  compiled {compiled / runs * 1e3:7.3f} ms  "
+          f"cached {cached / runs * 1e3:7.3f} ms")
+
+    Registry.load_enemies(os.path.join(BASE_DIR, "config", "enemies.json"))
+    ItemFactory.load_items()
+    with open(os.path.join(BASE_DIR, "config", "enemies.json")) as f:
+        raw_enemy = json.load(f)["basic_enemy"]
+    with open(os.path.join(BASE_DIR, "config", "items.json")) as f:
+        raw_item = json.load(f)[0]
+    raw_item = {**raw_item, "rarity": "common"}
+
+    archetype = Registry.get_enemy_config("basic_enemy")
+    Registry._enemy_textures["basic_enemy"] = None  # No display here
+    enemy = Enemy(None, 0, 0, "basic_enemy", archetype)
+    count = 100_000
+    legacy = timeit.timeit(lambda: legacy_enemy_reset(enemy, None, 0, 0, "basic_enemy", raw_enemy), number=count)
+    prototype = timeit.timeit(lambda: enemy.reset(None, 0, 0, "basic_enemy", archetype), number=count)
+    print(f"Enemy reset  config reads {legacy / count * 1e6:6.2f} us  "
+          f"archetype copy {prototype / count * 1e6:6.2f} us")
+
+    item_archetype = ItemFactory.get_item_data(raw_item["name"], "common")
+    item = Item(0, 0, item_archetype)
+    legacy = timeit.timeit(lambda: legacy_item_reset(item, 0, 0, raw_item), number=count)
+    prototype = timeit.timeit(lambda: item.reset(0, 0, item_archetype), number=count)
+    print(f"Item reset   config reads {legacy / count * 1e6:6.2f} us  "
+          f"archetype copy {prototype / count * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Level generation timings for every strategy in levels.generators.
+
+Run from the repository root:
+
+    python benchmarks/bench_generation.py [seeds]
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from config.settings import BASE_DIR
+from core.registry import Registry
+from levels.generators import GENERATORS
+from levels.loader import WorldLoader
+
+
+def main():
+    seeds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    Registry.load_cells(os.path.join(BASE_DIR, "config", "environments.json"), load_textures=False)
+
+    for name in sorted(GENERATORS):
+        timings = []
+        for seed in range(seeds):
+            loader = WorldLoader(seed, generator=name)
+            start = time.perf_counter()
+            loader.generate()
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        print(
+            f"{name:6s} mean {statistics.fmean(timings):8.2f} ms  "
+            f"p50 {timings[len(timings) // 2]:8.2f} ms  max {timings[-1]:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
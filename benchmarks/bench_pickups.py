@@ -0,0 +1,54 @@
+"""
+Micro-benchmark of the pickup magnet/collection pass (PickupStore.update).
+
+Run from the repository root:
+
+    python benchmarks/bench_pickups.py
+"""
+import os
+import sys
+import timeit
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from config.settings import CELL_SIZE
+from core.pickups import PickupStore
+from entities.xp_orb import XPOrb
+
+
+def legacy_pass(orbs, px, py, size, magnet_range):
+    """Per object pickup loop before PickupStore, for reference (without collection)."""
+    cx, cy = px + size / 2, py + size / 2
+    range_sq = magnet_range ** 2
+    touching = []
+    for orb in orbs:
+        dx = orb.x + (orb.w * CELL_SIZE) / 2 - cx
+        dy = orb.y + (orb.h * CELL_SIZE) / 2 - cy
+        dist_sq = dx * dx + dy * dy
+        if dist_sq <= range_sq:
+            orb.move_towards(px, py)
+        if dist_sq < (CELL_SIZE * 2) ** 2:
+            touching.append(orb)
+    return touching
+
+
+def main():
+    rng = np.random.default_rng(0)
+    px, py, magnet_range = 2500, 2500, 100
+    for count in (100, 1_000, 10_000):
+        positions = rng.uniform(0, 5000, (count, 2)).tolist()
+        orbs = [XPOrb(x, y, 1) for x, y in positions]
+        store = PickupStore([XPOrb(x, y, 1) for x, y in positions])
+
+        runs = 200
+        legacy = timeit.timeit(lambda: legacy_pass(orbs, px, py, CELL_SIZE, magnet_range), number=runs)
+        vectorized = timeit.timeit(
+            lambda: store.update(px, py, CELL_SIZE, CELL_SIZE, magnet_range), number=runs
+        )
+        print(f"{count:6d} pickups  legacy {legacy / runs * 1e3:8.3f} ms  "
+              f"PickupStore {vectorized / runs * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Micro-benchmark of one projectile tick (ProjectileStore.update): wall and
+enemy sweeps for hundreds of projectiles in flight through an enemy horde.
+
+Run from the repository root:
+
+    python benchmarks/bench_projectiles.py
+"""
+import os
+import sys
+import time
+from types import SimpleNamespace
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from combat.projectiles import ProjectileStore
+from config.settings import CELL_SIZE
+from core.spatial import SpatialIndex
+from core.world import World
+
+
+def main():
+    rng = np.random.default_rng(0)
+    world = World(200, 200)
+    size = world.width * CELL_SIZE
+    enemies = [
+        SimpleNamespace(x=x, y=y, health=1)
+        for x, y in rng.uniform(0, size, (2_000, 2)).tolist()
+    ]
+
+    for count in (100, 500, 2_000):
+        store = ProjectileStore()
+        for x, y, tx, ty in rng.uniform(0, size, (count, 4)).tolist():
+            store.fire(x, y, tx, ty, speed=12, damage=1, max_distance=10**6, pierce=10**6)
+
+        runs = 50
+        elapsed = 0.0
+        for _ in range(runs):
+            index = SpatialIndex(enemies)
+            start = time.perf_counter()
+            store.update(world, index)
+            elapsed += time.perf_counter() - start
+        print(f"{count:6d} projectiles, {len(enemies)} enemies  "
+              f"{elapsed / runs * 1e3:8.3f} ms/tick (index build included)")
+
+
+if __name__ == "__main__":
+    main()
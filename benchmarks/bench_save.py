@@ -0,0 +1,97 @@
+"""
+Micro-benchmark of saving and loading 10k entities: the legacy pickle of
+the live objects against the binary save format (core/save_format.py), and
+an autosave journal delta (core/save_journal.py) when 5% of them moved.
+
+Run from the repository root:
+
+    python benchmarks/bench_save.py
+"""
+import os
+import pickle
+import sys
+import time
+from types import SimpleNamespace
+import numpy as np
+import pygame
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from config.settings import BASE_DIR
+from core.camera import Camera
+from core.registry import Registry
+from core.save_format import encode, decode
+from core.save_journal import SaveJournal
+from core.save_manager import snapshot_game, restore_game
+from entities.enemy import Enemy
+from entities.player import Player
+from entities.xp_orb import XPOrb
+from items.factory import ItemFactory
+
+
+def best_of(func, runs=5):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def legacy_load(data):
+    loaded = pickle.loads(data)
+    for obj in loaded["gridObjects"]:
+        if hasattr(obj, "post_load"):
+            obj.post_load()
+    return loaded
+
+
+def main():
+    # A display, so that textures are converted and cached like in the game
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    Registry.load_enemies(os.path.join(BASE_DIR, "config", "enemies.json"))
+    ItemFactory.load_items()
+    rng = np.random.default_rng(0)
+
+    game = SimpleNamespace(gridObjects=[], camera=Camera())
+    game.player = Player(game, 0, 0, 1, 5)
+    positions = rng.uniform(0, 5000, (10_000, 2)).tolist()
+    for i, (x, y) in enumerate(positions):
+        if i % 2:
+            game.gridObjects.append(Enemy(game, x, y, "basic_enemy"))
+        elif i % 10:
+            game.gridObjects.append(XPOrb(x, y, 10))
+        else:
+            game.gridObjects.append(ItemFactory.create_random_item(x, y))
+
+    legacy = {"player": game.player, "gridObjects": game.gridObjects, "camera": game.camera}
+    save_legacy, legacy_data = best_of(lambda: pickle.dumps(legacy))
+    load_legacy, _ = best_of(lambda: legacy_load(legacy_data))
+
+    save_binary, binary_data = best_of(lambda: encode(snapshot_game(game)))
+    load_binary, _ = best_of(lambda: restore_game(game, decode(binary_data)[2]))
+
+    journal = SaveJournal()
+    journal.reset(snapshot_game(game), 1)
+    moved = game.gridObjects[::20]
+
+    def autosave():
+        for obj in moved:
+            obj.x += 1
+        return encode(journal.diff(snapshot_game(game)))
+
+    save_delta, delta_data = best_of(autosave)
+
+    print(f"{len(game.gridObjects)} entities")
+    print(f"  pickle  save {save_legacy * 1e3:7.1f} ms  load {load_legacy * 1e3:7.1f} ms  "
+          f"{len(legacy_data) / 1024:7.0f} KiB")
+    print(f"  binary  save {save_binary * 1e3:7.1f} ms  load {load_binary * 1e3:7.1f} ms  "
+          f"{len(binary_data) / 1024:7.0f} KiB")
+    print(f"  delta   save {save_delta * 1e3:7.1f} ms                    "
+          f"{len(delta_data) / 1024:7.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
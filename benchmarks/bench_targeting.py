@@ -0,0 +1,90 @@
+"""
+Micro-benchmark of nearest target queries (CombatManager targeting).
+
+The "per tick" columns include building the index: from the enemies,
+from the positions kept by the previous tick's LOD pass, or carrying the
+previous tick's index over when a quarter of the enemies moved a few
+pixels (GameLogic, as with most enemies in the far LOD tiers).
+
+Run from the repository root:
+
+    python benchmarks/bench_targeting.py
+"""
+import math
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from config.settings import GRID_HEIGHT_PIX, GRID_WIDTH_PIX
+from core.spatial import SpatialIndex
+
+
+def legacy_nearest(owner, enemies):
+    """CombatManager.find_nearest_target before the spatial index, for reference."""
+    nearest_enemy = None
+    min_distance = float("inf")
+    for enemy in enemies:
+        dx = owner.x - enemy.x
+        dy = owner.y - enemy.y
+        distance = math.sqrt(dx * dx + dy * dy)
+        if distance < min_distance:
+            min_distance = distance
+            nearest_enemy = enemy
+    return nearest_enemy
+
+
+def main():
+    rng = np.random.default_rng(0)
+    owner = SimpleNamespace(x=GRID_WIDTH_PIX / 2, y=GRID_HEIGHT_PIX / 2)
+    for count in (100, 1_000, 10_000):
+        enemies = [
+            SimpleNamespace(x=x, y=y)
+            for x, y in rng.uniform(0, (GRID_WIDTH_PIX, GRID_HEIGHT_PIX), (count, 2)).tolist()
+        ]
+        runs = 100
+        legacy = timeit.timeit(lambda: legacy_nearest(owner, enemies), number=runs) / runs
+
+        build = timeit.timeit(lambda: SpatialIndex(enemies)._build(), number=runs) / runs
+        index = SpatialIndex(enemies)
+        nearest = timeit.timeit(lambda: index.nearest(owner.x, owner.y), number=runs) / runs
+        in_range = timeit.timeit(lambda: index.nearest(owner.x, owner.y, 400), number=runs) / runs
+        assert index.nearest(owner.x, owner.y) is legacy_nearest(owner, enemies)
+
+        positions = index.positions
+        tick = timeit.timeit(
+            lambda: SpatialIndex(enemies).nearest(owner.x, owner.y), number=runs) / runs
+        kept_tick = timeit.timeit(
+            lambda: SpatialIndex(enemies, positions=positions).nearest(owner.x, owner.y), number=runs
+        ) / runs
+
+        # Positions after each tick's LOD pass: a quarter of the enemies moved
+        ticks = []
+        moved_positions = positions
+        for _ in range(runs):
+            moved = np.sort(rng.choice(count, count // 4, replace=False))
+            moved_positions = moved_positions.copy()
+            moved_positions[moved] += rng.uniform(-8, 8, (len(moved), 2))
+            ticks.append((moved, moved_positions))
+        carried = SpatialIndex(enemies, positions=positions)
+        carried.nearest(owner.x, owner.y)
+        pending = iter(ticks)
+
+        def carried_over():
+            carried.move(*next(pending))
+            return carried.nearest(owner.x, owner.y)
+
+        carried_tick = timeit.timeit(carried_over, number=runs) / runs
+
+        print(f"{count:6d} enemies  legacy scan {legacy * 1e3:7.3f} ms  "
+              f"index build {build * 1e3:7.3f} ms  nearest {nearest * 1e6:7.1f} us  "
+              f"nearest in range {in_range * 1e6:7.1f} us  "
+              f"per tick {tick * 1e3:7.3f} ms, kept positions {kept_tick * 1e3:7.3f} ms, "
+              f"carried over {carried_tick * 1e3:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
 import math
-from core.debug import debug
+from core.debug import debug, DEBUG, WARNING
 from core.vfx import vfx_manager, SlashEffect, ExplosionEffect
-from config.settings import CELL_SIZE
+from config.settings import (
+    CELL_SIZE,
+    PROJECTILE_RADIUS,
+    PROJECTILE_RANGE_FACTOR,
+    PROJECTILE_SPEED,
+)
 
 class WeaponBehaviors:
     """
@@ -16,17 +21,45 @@ class WeaponBehaviors:
         h = getattr(entity, 'h', getattr(entity, 'size', 1)) * CELL_SIZE
         return entity.x + w / 2, entity.y + h / 2
 
+    @staticmethod
+    def _fire_projectile(weapon, owner, target):
+        """
+        Fires the weapon's projectile at the target, if the weapon has
+        projectile settings and the game a projectile store. Returns False
+        when fired (the damage is dealt on impact), None otherwise.
+        """
+        settings = getattr(weapon, 'projectile', None)
+        projectiles = getattr(getattr(owner, 'game', None), 'projectiles', None)
+        if not settings or projectiles is None:
+            return None
+
+        ox, oy = WeaponBehaviors._get_center(owner)
+        tx, ty = WeaponBehaviors._get_center(target)
+        projectiles.fire(
+            ox, oy, tx, ty,
+            speed=settings.get("speed", PROJECTILE_SPEED),
+            damage=weapon.damage * getattr(owner, 'damage_mult', 1.0),
+            max_distance=weapon.range * PROJECTILE_RANGE_FACTOR,
+            radius=settings.get("radius", PROJECTILE_RADIUS),
+            pierce=settings.get("pierce", 1),
+            aoe_radius=weapon.aoe_radius if weapon.is_aoe else 0,
+            color=settings.get("color", (255, 255, 0)),
+            source=weapon.name,
+        )
+        return False
+
     @staticmethod
     def melee_swing(weapon, owner, target, enemies):
         """
         Standard melee attack.
         """
-        debug.log(f"{owner.__class__.__name__} swings {weapon.name} at {target.__class__.__name__}!")
+        debug.log("%s swings %s at %s!", type(owner).__name__, weapon.name, type(target).__name__,
+                  level=DEBUG, category="combat")
         
         ox, oy = WeaponBehaviors._get_center(owner)
         tx, ty = WeaponBehaviors._get_center(target)
         
-        vfx_manager.add_effect(SlashEffect(ox, oy, tx, ty, width=3, color=(200, 200, 200)))
+        vfx_manager.spawn(SlashEffect, ox, oy, tx, ty, width=3, color=(200, 200, 200))
         return True
 
     @staticmethod
@@ -34,12 +67,16 @@ class WeaponBehaviors:
         """
         Casts a fireball that explodes on the target.
         """
-        debug.log(f"{owner.__class__.__name__} casts a fireball from {weapon.name}!")
+        debug.log("%s casts a fireball from %s!", type(owner).__name__, weapon.name,
+                  level=DEBUG, category="combat")
         
+        if WeaponBehaviors._fire_projectile(weapon, owner, target) is False:
+            return False  # Explodes on impact
+
         tx, ty = WeaponBehaviors._get_center(target)
         
         # Simulate explosion at target
-        vfx_manager.add_effect(ExplosionEffect(tx, ty, radius=weapon.aoe_radius, color=(255, 100, 0)))
+        vfx_manager.spawn(ExplosionEffect, tx, ty, radius=weapon.aoe_radius, color=(255, 100, 0))
         
         return True
 
@@ -48,13 +85,17 @@ class WeaponBehaviors:
         """
         Fires a projectile.
         """
-        debug.log(f"{owner.__class__.__name__} shoots an arrow from {weapon.name}!")
+        debug.log("%s shoots an arrow from %s!", type(owner).__name__, weapon.name,
+                  level=DEBUG, category="combat")
         
+        if WeaponBehaviors._fire_projectile(weapon, owner, target) is False:
+            return False
+
         ox, oy = WeaponBehaviors._get_center(owner)
         tx, ty = WeaponBehaviors._get_center(target)
         
-        # Just a line for now, could be a projectile
-        vfx_manager.add_effect(SlashEffect(ox, oy, tx, ty, width=2, color=(255, 255, 0), duration=100))
+        # No projectile settings: instant hit, shown as a line
+        vfx_manager.spawn(SlashEffect, ox, oy, tx, ty, width=2, color=(255, 255, 0), duration=100)
         return True
 
     @staticmethod
@@ -62,10 +103,11 @@ class WeaponBehaviors:
         """
         Smashes the ground dealing heavy AOE.
         """
-        debug.log(f"{owner.__class__.__name__} smashes the ground with {weapon.name}!")
+        debug.log("%s smashes the ground with %s!", type(owner).__name__, weapon.name,
+                  level=DEBUG, category="combat")
         
         ox, oy = WeaponBehaviors._get_center(owner)
-        vfx_manager.add_effect(ExplosionEffect(ox, oy, radius=weapon.aoe_radius, color=(100, 50, 0)))
+        vfx_manager.spawn(ExplosionEffect, ox, oy, radius=weapon.aoe_radius, color=(100, 50, 0))
         return True
 
     @staticmethod
@@ -76,5 +118,5 @@ class WeaponBehaviors:
         if hasattr(WeaponBehaviors, behavior_name):
             return getattr(WeaponBehaviors, behavior_name)
         else:
-            debug.log(f"Warning: Behavior '{behavior_name}' not found. Using default.")
+            debug.log("Warning: Behavior '%s' not found. Using default.", behavior_name, level=WARNING)
             return WeaponBehaviors.melee_swing
@@ -2,18 +2,29 @@ import math
 import pygame
 from core.debug import debug
 from combat.weapon import Weapon
+from core.spatial import SpatialIndex
+from entities.base import EntityHandle
 from config.settings import MAX_WEAPONS, TARGET_CHECK_INTERVAL
-from config.constants import OP_ADD, OP_MULTIPLY
 
 class CombatManager:
     def __init__(self, owner):
         self.owner = owner
         self.weapons = []
         self.current_weapon_index = 0
-        self.target = None
+        self._target = None  # EntityHandle, see `target`
         self.last_target_check_time = 0
         self.target_check_interval = TARGET_CHECK_INTERVAL  # Check for target every 500ms
 
+    @property
+    def target(self):
+        """Current target, None once it died or was recycled."""
+        handle = getattr(self, "_target", None)
+        return handle.get() if handle else None
+
+    @target.setter
+    def target(self, enemy):
+        self._target = EntityHandle(enemy) if enemy is not None else None
+
     @property
     def current_weapon(self):
         if not self.weapons:
@@ -23,9 +34,9 @@ class CombatManager:
     def add_weapon(self, weapon: Weapon):
         if len(self.weapons) < MAX_WEAPONS:
             self.weapons.append(weapon)
-            debug.log(f"Added {weapon.name} to inventory")
+            debug.log("Added %s to inventory", weapon.name, category="combat")
         else:
-            debug.log(f"Inventory full! Cannot add {weapon.name}")
+            debug.log("Inventory full! Cannot add %s", weapon.name, category="combat")
 
     def apply_upgrade(self, item):
         target_name = getattr(item, 'target_weapon', None)
@@ -41,7 +52,7 @@ class CombatManager:
         if hasattr(item, 'target_tag'): target_tag = item.target_tag
 
         if not target_name and not target_tag:
-            debug.log(f"Upgrade {item.name} has no target weapon or tag specified.")
+            debug.log("Upgrade %s has no target weapon or tag specified.", item.name, category="combat")
             return
 
         upgraded_count = 0
@@ -51,67 +62,72 @@ class CombatManager:
             matches_tag = (target_tag and target_tag in weapon.tags)
             
             if matches_id or matches_tag:
-                debug.log(f"Upgrading {weapon.name} (ID: {weapon.id}) with {item.name}")
+                debug.log("Upgrading %s (ID: %s) with %s", weapon.name, weapon.id, item.name, category="combat")
                 for effect, data in item.effects.items():
                     op = data["op"]
                     val = data["value"]
                     
-                    if hasattr(weapon, effect):
-                        current_val = getattr(weapon, effect)
-                        if op == OP_ADD:
-                            setattr(weapon, effect, current_val + val)
-                        elif op == OP_MULTIPLY:
-                            setattr(weapon, effect, current_val * (1 + val))
-                            
-                        debug.log(f"  -> {effect} modified (Op: {op}, Val: {val}). New: {getattr(weapon, effect)}")
+                    if effect in weapon.stats:
+                        weapon.stats.add_modifier(effect, op, val)
+                        debug.log("  -> %s modified (Op: %s, Val: %s). New: %s", effect, op, val,
+                                  getattr(weapon, effect), category="combat")
                     else:
-                        debug.log(f"  -> Weapon has no attribute '{effect}'")
+                        debug.log("  -> Weapon has no attribute '%s'", effect, category="combat")
                 upgraded_count += 1
         
         if upgraded_count == 0:
-            debug.log(f"Target weapon {target_name} or tag {target_tag} not found in inventory.")
+            debug.log("Target weapon %s or tag %s not found in inventory.", target_name, target_tag,
+                      category="combat")
 
     def switch_weapon(self):
         if not self.weapons:
             return
         self.current_weapon_index = (self.current_weapon_index + 1) % len(self.weapons)
-        debug.log(f"Switched to {self.current_weapon.name}")
+        debug.log("Switched to %s", self.current_weapon.name, category="combat")
 
     def update(self, enemies, current_time):
         if not self.current_weapon:
             return
 
+        if not isinstance(enemies, SpatialIndex):
+            enemies = SpatialIndex(enemies)
+
         # Auto-Targeting Logic (not every frame)
         if current_time - self.last_target_check_time > self.target_check_interval:
             self.target = self.find_nearest_target(enemies)
             self.last_target_check_time = current_time
 
         # Auto-Attacking Logic
-        if self.target:
-            # Check if target is still alive/valid (if enemies list changes)
-            if self.target not in enemies:
-                self.target = None
+        handle = getattr(self, "_target", None)
+        target = handle.get() if handle else None
+        if target is None:
+            if handle is None:
+                return
+            # Target died since the last check: take the nearest one in range
+            self.target = target = enemies.nearest(
+                self.owner.x, self.owner.y, self.current_weapon.range
+            )
+            if target is None:
                 return
 
-            distance = self.get_distance_to(self.target)
-            if distance <= self.current_weapon.range:
-                if self.current_weapon.can_attack(current_time):
-                    self.attack(self.target, enemies, current_time)
-            else:
-                # If target is out of range clear target
-                pass
-
-    def find_nearest_target(self, enemies):
-        nearest_enemy = None
-        min_distance = float('inf')
-
-        for enemy in enemies:
-            distance = self.get_distance_to(enemy)
-            if distance < min_distance:
-                min_distance = distance
-                nearest_enemy = enemy
-        
-        return nearest_enemy
+        distance = self.get_distance_to(target)
+        if distance <= self.current_weapon.range:
+            if self.current_weapon.can_attack(current_time):
+                self.attack(target, enemies, current_time)
+
+    def find_nearest_target(self, enemies, max_distance=math.inf):
+        if not isinstance(enemies, SpatialIndex):
+            enemies = SpatialIndex(enemies)
+        return enemies.nearest(self.owner.x, self.owner.y, max_distance)
+
+    def find_nearest_targets(self, enemies, k, max_distance=math.inf):
+        """The `k` nearest enemies within `max_distance`, nearest first."""
+        if not isinstance(enemies, SpatialIndex):
+            enemies = SpatialIndex(enemies)
+        return [
+            enemies.objects[i]
+            for i in enemies.k_nearest(self.owner.x, self.owner.y, k, max_distance)
+        ]
 
     def get_distance_to(self, target):
         dx = self.owner.x - target.x
@@ -119,12 +135,40 @@ class CombatManager:
         return math.sqrt(dx * dx + dy * dy)
 
     def attack(self, target, enemies, current_time):
-        self.current_weapon.attack(current_time, owner=self.owner, target=target, enemies=enemies)
-        
+        if self.current_weapon.attack(current_time, owner=self.owner, target=target, enemies=enemies) is False:
+            return  # Damage is dealt on impact
+
         targets_hit = self.current_weapon.get_targets(target, enemies)
-        
-        for hit_target in targets_hit:
-            # debug.log(f"Hit enemy with {self.current_weapon.name} for {self.current_weapon.damage} damage!")
-            if hasattr(hit_target, 'take_damage'):
-                damage = self.current_weapon.damage * self.owner.damage_mult
-                hit_target.take_damage(damage)
+        damage = self.current_weapon.damage * self.owner.damage_mult
+        self.apply_damage(targets_hit, damage, target)
+
+    def apply_damage(self, targets, damage, primary_target, source=None):
+        """
+        Applies `damage` to every target of one attack at once: a single
+        damage text (at the primary target, an entity or an (x, y) point)
+        and log for the whole attack instead of one per enemy hit. Each
+        enemy still takes the damage through take_damage, so kills go
+        through die() and are dropped/recycled by the game logic. Returns
+        the number of enemies killed.
+        """
+        hit = 0
+        killed = 0
+        for enemy in targets:
+            if not hasattr(enemy, 'take_damage'):
+                continue
+            was_alive = enemy.health > 0
+            enemy.take_damage(damage, show_text=False)
+            hit += 1
+            if was_alive and enemy.health <= 0:
+                killed += 1
+        if not hit:
+            return 0
+
+        game = getattr(self.owner, 'game', None)
+        if game is not None:
+            x, y = primary_target if isinstance(primary_target, tuple) else (primary_target.x, primary_target.y)
+            game.damage_texts.spawn(x, y - 10, damage, count=hit)
+        if killed:
+            debug.log("%s hit %s enemies, %s killed", source or self.current_weapon.name, hit, killed,
+                      category="combat")
+        return killed
@@ -1,51 +1,63 @@
-import json
 import os
+from dataclasses import replace
 from combat.weapon import Weapon
 from combat.behaviors import WeaponBehaviors
 from config.settings import BASE_DIR
-from config.constants import BEHAVIOR_MELEE_SWING
+from core.archetypes import load_archetypes
 
 class WeaponFactory:
-    _weapons_data = None
+    _weapons_data = None  # weapon id -> WeaponArchetype, behavior resolved
 
     @staticmethod
     def load_weapons():
         if WeaponFactory._weapons_data is None:
-            path = os.path.join(BASE_DIR, 'config', 'weapons.json')
-            try:
-                with open(path, 'r') as f:
-                    WeaponFactory._weapons_data = json.load(f)
-            except FileNotFoundError:
-                print(f"Error: Could not find weapons.json at {path}")
-                WeaponFactory._weapons_data = {}
+            WeaponFactory.reload_weapons()
 
     @staticmethod
-    def create_weapon(weapon_id: str) -> Weapon:
+    def reload_weapons():
+        """Loads weapons.json again. Raises ValueError if it isn't valid JSON."""
+        path = os.path.join(BASE_DIR, 'config', 'weapons.json')
+        try:
+            archetypes = load_archetypes("weapons", path, base_dir=BASE_DIR)
+        except FileNotFoundError:
+            print(f"Error: Could not find weapons.json at {path}")
+            archetypes = []
+        # Behaviors are looked up once per weapon type, not per weapon
+        WeaponFactory._weapons_data = {
+            archetype.id: replace(
+                archetype, behavior_func=WeaponBehaviors.get_behavior(archetype.behavior_name)
+            )
+            for archetype in archetypes
+        }
+
+    @staticmethod
+    def get_archetype(weapon_id):
+        """WeaponArchetype of `weapon_id`, None if the config has no such weapon."""
         WeaponFactory.load_weapons()
-        
-        if weapon_id not in WeaponFactory._weapons_data:
-            raise ValueError(f"Weapon ID '{weapon_id}' not found in configuration.")
+        return WeaponFactory._weapons_data.get(weapon_id)
 
-        data = WeaponFactory._weapons_data[weapon_id]
-        
-        # Get behavior name
-        behavior_name = data.get("behavior", BEHAVIOR_MELEE_SWING)
+    @staticmethod
+    def create_weapon(weapon_id: str) -> Weapon:
+        archetype = WeaponFactory.get_archetype(weapon_id)
+        if archetype is None:
+            raise ValueError(f"Weapon ID '{weapon_id}' not found in configuration.")
 
         # Create the weapon instance
         weapon = Weapon(
             id=weapon_id,
-            name=data["name"],
-            damage=data["damage"],
-            range=data["range"],
-            cooldown=data["cooldown"],
-            is_aoe=data.get("is_aoe", False),
-            aoe_radius=data.get("aoe_radius", 0),
-            tags=data.get("tags", []),
-            texture_path=data.get("texture_path", None),
-            behavior_name=behavior_name
+            name=archetype.name,
+            damage=archetype.damage,
+            range=archetype.range,
+            cooldown=archetype.cooldown,
+            is_aoe=archetype.is_aoe,
+            aoe_radius=archetype.aoe_radius,
+            tags=list(archetype.tags),
+            texture_path=archetype.texture_path,
+            behavior_name=archetype.behavior_name,
+            projectile=archetype.projectile
         )
         
         # Attach the behavior function
-        weapon.behavior_func = WeaponBehaviors.get_behavior(behavior_name)
+        weapon.behavior_func = archetype.behavior_func
         
         return weapon
@@ -0,0 +1,184 @@
+import math
+import numpy as np
+import pygame
+from config.settings import CELL_SIZE
+from entities.base import EntityHandle
+
+_FIELDS = ("x", "y", "vx", "vy", "travel_left", "damage", "radius", "aoe_radius")
+
+
+class ProjectileStore:
+    """
+    Projectiles in flight, one row per projectile in NumPy arrays.
+
+    Every tick each projectile sweeps the segment from its position to its
+    next position, against the walls (walkability grid) and the enemies (a
+    SpatialIndex). A projectile hits up to `pierce` enemies, never the same
+    one twice; one with an `aoe_radius` explodes on its first impact
+    instead. Projectiles stop at walls and after `travel_left` pixels.
+    """
+
+    def __init__(self):
+        self.count = 0
+        capacity = 64
+        for name in _FIELDS:
+            setattr(self, name, np.empty(capacity))
+        self.pierce_left = np.empty(capacity, dtype=np.int64)
+        self.colors = []
+        self.sources = []  # Weapon name, for logs
+        self.hit_ids = []  # Per projectile, EntityHandles of the enemies already hit
+
+    def __len__(self):
+        return self.count
+
+    def fire(self, x, y, target_x, target_y, speed, damage, max_distance,
+             radius=4, pierce=1, aoe_radius=0, color=(255, 255, 0), source=None):
+        """Launches a projectile from (x, y) towards (target_x, target_y)."""
+        dx, dy = target_x - x, target_y - y
+        dist = math.hypot(dx, dy) or 1.0
+
+        if self.count == len(self.x):
+            for name in _FIELDS + ("pierce_left",):
+                array = getattr(self, name)
+                setattr(self, name, np.concatenate((array, np.empty_like(array))))
+        i = self.count
+        self.x[i], self.y[i] = x, y
+        self.vx[i], self.vy[i] = dx / dist * speed, dy / dist * speed
+        self.travel_left[i] = max_distance
+        self.damage[i] = damage
+        self.radius[i] = radius
+        self.aoe_radius[i] = aoe_radius
+        self.pierce_left[i] = max(1, pierce)
+        self.colors.append(tuple(color))
+        self.sources.append(source)
+        self.hit_ids.append(set())
+        self.count += 1
+        return i
+
+    def update(self, world, enemies):
+        """
+        Moves every projectile by one tick.
+
+        :param enemies: SpatialIndex of the enemies
+        :return: impacts as (x, y, damage, targets, aoe_radius, source);
+                 the damage is left to the caller
+        """
+        n = self.count
+        if not n:
+            return []
+
+        start = np.column_stack((self.x[:n], self.y[:n]))
+        step = np.column_stack((self.vx[:n], self.vy[:n]))
+        speed = np.hypot(step[:, 0], step[:, 1])
+        # Don't fly past the remaining distance
+        scale = np.minimum(1.0, np.divide(
+            self.travel_left[:n], speed, out=np.ones(n), where=speed > 0
+        ))
+        step *= scale[:, None]
+        end = start + step
+
+        wall_t = self._sweep_walls(world, start, step)
+
+        # Enemies are hit when their cell's center is within projectile
+        # radius + half a cell of the swept segment
+        half = CELL_SIZE / 2
+        segment, entity, t = enemies.query_segments(
+            start - half, end - half, self.radius[:n] + half
+        )
+
+        impacts = []
+        stop_t = wall_t.copy()  # Where each projectile ends this tick
+        dead = wall_t < 1.0
+        objects = enemies.objects
+        for i, e, hit_t in zip(segment.tolist(), entity.tolist(), t.tolist()):
+            if hit_t > stop_t[i]:
+                continue
+            enemy = objects[e]
+            if enemy.health <= 0:
+                continue
+            handle = EntityHandle(enemy)
+            if handle in self.hit_ids[i]:
+                continue
+            if self.aoe_radius[i] > 0:
+                stop_t[i] = hit_t
+                dead[i] = True
+                continue  # Explodes below
+            self.hit_ids[i].add(handle)
+            impacts.append((
+                float(start[i, 0] + step[i, 0] * hit_t),
+                float(start[i, 1] + step[i, 1] * hit_t),
+                float(self.damage[i]), [enemy], 0.0, self.sources[i],
+            ))
+            self.pierce_left[i] -= 1
+            if self.pierce_left[i] <= 0:
+                stop_t[i] = hit_t
+                dead[i] = True
+
+        # Explosions, on an enemy or on a wall
+        for i in np.flatnonzero(dead & (self.aoe_radius[:n] > 0)).tolist():
+            x = float(start[i, 0] + step[i, 0] * stop_t[i])
+            y = float(start[i, 1] + step[i, 1] * stop_t[i])
+            hits = enemies.query_radius(x - half, y - half, self.aoe_radius[i])
+            impacts.append((
+                x, y, float(self.damage[i]), [objects[e] for e in hits.tolist()],
+                float(self.aoe_radius[i]), self.sources[i],
+            ))
+
+        moved = np.minimum(stop_t, 1.0)
+        self.x[:n] = start[:, 0] + step[:, 0] * moved
+        self.y[:n] = start[:, 1] + step[:, 1] * moved
+        self.travel_left[:n] -= speed * scale * moved
+        dead |= self.travel_left[:n] <= 0
+        if dead.any():
+            self._compact(~dead)
+        return impacts
+
+    def _sweep_walls(self, world, start, step):
+        """Fraction of each step travelled before the first wall, 1.0 if none."""
+        n = len(start)
+        wall_t = np.ones(n)
+        # Sample every half cell along the steps
+        samples = max(1, int(math.ceil(float(np.abs(step).max()) / (CELL_SIZE / 2))))
+        mask = world.walkable_mask
+        for s in range(1, samples + 1):
+            frac = s / samples
+            points = start + step * frac
+            cx = np.floor(points[:, 0] / CELL_SIZE).astype(np.intp)
+            cy = np.floor(points[:, 1] / CELL_SIZE).astype(np.intp)
+            inside = (cx >= 0) & (cx < world.width) & (cy >= 0) & (cy < world.height)
+            blocked = ~inside
+            if mask is not None:
+                blocked[inside] = mask[cy[inside], cx[inside]] == 0
+            else:
+                # Chunked worlds have no global bitmask
+                for i in np.flatnonzero(inside).tolist():
+                    cell = world.get_cell(int(cx[i]), int(cy[i]))
+                    blocked[i] = cell is None or not cell.walkable
+            newly = blocked & (wall_t == 1.0)
+            # Stop at the last free sample
+            wall_t[newly] = (s - 1) / samples
+        return wall_t
+
+    def _compact(self, keep):
+        kept = int(keep.sum())
+        for name in _FIELDS + ("pierce_left",):
+            array = getattr(self, name)
+            array[:kept] = array[:self.count][keep]
+        keep = keep.tolist()
+        self.colors = [c for c, k in zip(self.colors, keep) if k]
+        self.sources = [s for s, k in zip(self.sources, keep) if k]
+        self.hit_ids = [h for h, k in zip(self.hit_ids, keep) if k]
+        self.count = kept
+
+    def clear(self):
+        self.count = 0
+        self.colors.clear()
+        self.sources.clear()
+        self.hit_ids.clear()
+
+    def draw(self, surface):
+        for x, y, radius, color in zip(
+            self.x[:self.count].tolist(), self.y[:self.count].tolist(),
+            self.radius[:self.count].tolist(), self.colors,
+        ):
+            pygame.draw.circle(surface, color, (x, y), radius)
@@ -1,10 +1,17 @@
-import math
 import os
-import pygame
 from config.settings import BASE_DIR
+from core.assets import image_cache
+from core.spatial import SpatialIndex
+from core.stats import Stat, StatBlock
 
 class Weapon:
-    def __init__(self, id: str, name: str, damage: int, range: float, cooldown: int, is_aoe: bool = False, aoe_radius: float = 0, tags: list = None, texture_path: str = None, behavior_name: str = None):
+    # Upgradable stats, with the modifier stacks of the upgrades
+    damage = Stat()
+    range = Stat()
+    cooldown = Stat()
+    aoe_radius = Stat()
+
+    def __init__(self, id: str, name: str, damage: int, range: float, cooldown: int, is_aoe: bool = False, aoe_radius: float = 0, tags: list = None, texture_path: str = None, behavior_name: str = None, projectile: dict = None):
         """
         Initialize a new Weapon.
         
@@ -18,9 +25,11 @@ class Weapon:
         :param tags: List of tags associated with the weapon
         :param texture_path: Path to the weapon's texture file
         :param behavior_name: Name of the behavior function to use
+        :param projectile: Projectile settings (speed, radius, pierce, color) for behaviors that fire projectiles
         """
         self.id = id
         self.name = name
+        self.stats = StatBlock(damage=damage, range=range, cooldown=cooldown, aoe_radius=aoe_radius)
         self.damage = damage
         self.range = range
         self.cooldown = cooldown
@@ -31,6 +40,7 @@ class Weapon:
         self.behavior_name = behavior_name
         self.behavior_func = None # Assigned by factory or reload
         self.texture_path = texture_path
+        self.projectile = projectile
         
         # Texture handling
         self.image = None
@@ -38,7 +48,7 @@ class Weapon:
             full_path = os.path.join(BASE_DIR, texture_path)
             if os.path.exists(full_path):
                 try:
-                    loaded_image = pygame.image.load(full_path).convert_alpha()
+                    loaded_image = image_cache.load(full_path)
                     self.image = loaded_image
                 except Exception as e:
                      print(f"Failed to load weapon texture {texture_path}: {e}")
@@ -53,9 +63,11 @@ class Weapon:
         """Register an attack and reset cooldown."""
         self.last_attack_time = current_time
         
-        # Execute custom behavior if defined
+        # Execute custom behavior if defined. Returns False when the behavior
+        # deals the damage itself later (e.g. projectiles)
         if self.behavior_func:
-            self.behavior_func(self, owner, target, enemies)
+            return self.behavior_func(self, owner, target, enemies)
+        return True
 
     def get_targets(self, primary_target, all_enemies):
         """
@@ -64,24 +76,21 @@ class Weapon:
         """
         if not self.is_aoe:
             return [primary_target]
-        
-        targets = []
-        for enemy in all_enemies:
-            # Calculate distance from primary_target to enemy (Circular AOE around target)
-            dx = primary_target.x - enemy.x
-            dy = primary_target.y - enemy.y
-            dist = math.sqrt(dx*dx + dy*dy)
-            
-            if dist <= self.aoe_radius:
-                targets.append(enemy)
-        
-        return targets
+
+        # Circular AOE around the target, one radius query over the enemies
+        if not isinstance(all_enemies, SpatialIndex):
+            all_enemies = SpatialIndex(all_enemies)
+        hits = all_enemies.query_radius(primary_target.x, primary_target.y, self.aoe_radius)
+        objects = all_enemies.objects
+        return [objects[i] for i in hits.tolist()]
         
     def __getstate__(self):
         state = self.__dict__.copy()
         # Exclude image and behavior function
         state['image'] = None
         state['behavior_func'] = None 
+        if self.projectile is not None:
+            state['projectile'] = dict(self.projectile)  # Shared read-only settings
         return state
 
     def __setstate__(self, state):
@@ -89,12 +98,29 @@ class Weapon:
         self.image = None
         self.behavior_func = None
 
+    def apply_archetype(self, archetype):
+        """
+        Applies a reloaded WeaponArchetype in place. Upgrades stay stacked on
+        the new base stats.
+        """
+        self.name = archetype.name
+        for stat in ("damage", "range", "cooldown", "aoe_radius"):
+            self.stats.set_base(stat, getattr(archetype, stat))
+        self.is_aoe = archetype.is_aoe
+        self.tags = list(archetype.tags)
+        self.projectile = archetype.projectile
+        self.behavior_name = archetype.behavior_name
+        self.behavior_func = archetype.behavior_func
+        self.texture_path = archetype.texture_path
+        self.image = None
+        self.reload_texture()
+
     def reload_texture(self):
         if self.texture_path:
              full_path = os.path.join(BASE_DIR, self.texture_path)
              if os.path.exists(full_path):
                  try:
-                     self.image = pygame.image.load(full_path).convert_alpha()
+                     self.image = image_cache.load(full_path)
                  except Exception as e:
                      print(f"Failed to reload weapon texture {self.texture_path}: {e}")
 
@@ -108,16 +134,13 @@ class Weapon:
             # Fallback: Recover from Factory using ID
             try:
                 from combat.factory import WeaponFactory
-                # Ensure data is loaded
-                WeaponFactory.load_weapons()
-                if self.id in WeaponFactory._weapons_data:
-                    data = WeaponFactory._weapons_data[self.id]
-                    from config.constants import BEHAVIOR_MELEE_SWING
-                    recalled_behavior = data.get("behavior", BEHAVIOR_MELEE_SWING)
+                archetype = WeaponFactory.get_archetype(self.id)
+                if archetype is not None:
+                    recalled_behavior = archetype.behavior_name
                     
                     # Store it for next save
                     self.behavior_name = recalled_behavior
-                    self.behavior_func = WeaponBehaviors.get_behavior(recalled_behavior)
+                    self.behavior_func = archetype.behavior_func
                     print(f"DEBUG: Recovered behavior '{recalled_behavior}' for weapon '{self.name}'")
             except Exception as e:
                 print(f"Failed to recover behavior for {self.name}: {e}")
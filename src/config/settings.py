@@ -12,13 +12,26 @@ SCREEN_WIDTH_PIX = SCREEN_WIDTH * CELL_SIZE
 SCREEN_HEIGHT = 20
 SCREEN_HEIGHT_PIX = SCREEN_HEIGHT * CELL_SIZE
 
+# LEVEL GENERATION
+LEVEL_GENERATOR = "maze"  # Strategy from levels.generators: "maze" or "cave"
+
 # MAZE GENERATION
 ROOM_AMOUNT = 30
 ROOM_EXTRA_SIZE = 3
 
+# CAVE GENERATION (cellular automata)
+CAVE_FILL_RATIO = 0.45  # Initial share of walls
+CAVE_ITERATIONS = 5
+CAVE_MIN_REGION = 12  # Smaller pockets are filled in
+CAVE_ROOM_SIZE = 5  # Side of the open squares reported as rooms
+
 FPS = 60
 TARGET_CHECK_INTERVAL = 500
 DEBUG_MODE = True
+DEBUG_LOG_LEVEL = "info"  # "debug", "info", "warning" or "error"
+DEBUG_LOG_CATEGORIES = None  # None logs every category, else e.g. {"combat", "save"}
+DEBUG_LOG_DEDUPE_WINDOW = 1.0  # In seconds, repeats of a message are merged
+DEBUG_LOG_BUFFER_LINES = 1000  # Console lines waiting to be written at most
 
 # Colors
 COLOR_BACKGROUND = "black"
@@ -38,6 +51,10 @@ PLAYER_INVULNERABILITY_DURATION = 1000
 
 # Weapons Settings
 MAX_WEAPONS = 3
+# Projectile defaults, overridden by a weapon's "projectile" settings
+PROJECTILE_SPEED = 12  # Pixels per tick
+PROJECTILE_RADIUS = 4
+PROJECTILE_RANGE_FACTOR = 1.5  # Flight distance, relative to the weapon range
 
 # Enemy Settings
 ENEMY_SPEED = 0.5
@@ -62,10 +79,78 @@ UI_WEAPON_BAR_Y = 5
 # Base directory of the project (src/)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Textures are decoded by a pool of threads (see core/assets.py)
+ASSET_DECODE_WORKERS = 4
+
+# Compiled configs (JSON configs keyed by file modification time, see core/archetypes.py)
+CONFIG_CACHE_ENABLED = True
+CONFIG_CACHE_DIR = os.path.join(BASE_DIR, ".config_cache")
+
+# Hot reload: configs and textures edited while playing are applied live
+HOT_RELOAD_ENABLED = False  # Turn on while editing configs or textures
+HOT_RELOAD_INTERVAL = 500  # ms between two checks of the files
+
+# Level cache (generated worlds keyed by seed + generation settings)
+LEVEL_CACHE_ENABLED = True
+LEVEL_CACHE_DIR = os.path.join(BASE_DIR, ".level_cache")
+LEVEL_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Background pregeneration of upcoming levels
+PREGEN_ENABLED = True
+PREGEN_WORKERS = 1
+PREGEN_LOOKAHEAD = 1  # Levels generated ahead of the current one
+PREGEN_WAIT_TIMEOUT = 0.25  # Seconds to wait for a worker before generating in place
+
+# Spawn placement
+SPAWN_INDEX_BUCKET_SIZE = 8  # In cells, granularity of the spawn sampling buckets
+SPAWN_RADIUS = 24  # In cells, around the player
+
+# Spawn director (enemies spawned while holding SPACE)
+SPAWN_MAX_ENEMIES = 200  # Live enemy budget
+SPAWN_WINDOW = 1000  # In ms
+SPAWN_MAX_PER_WINDOW = 30  # Enemies spawned per SPAWN_WINDOW at most
+SPAWN_BATCH_SIZE = 5  # Enemies created per tick at most
+SPAWN_VIEW_MARGIN = 1  # In cells, kept clear around the camera view
+
+# Chunked world: generate the map chunk by chunk around the player
+CHUNKED_WORLD = False
+CHUNK_SIZE = 25  # In cells, odd so that chunk borders are walls
+CHUNK_ROOM_AMOUNT = 4
+CHUNK_LOAD_RADIUS = 1  # Chunks kept loaded around the player's chunk
+CHUNK_EVICT_RADIUS = 2  # Chunks further than this are swapped out to disk
+CHUNK_SWAP_DIR = os.path.join(BASE_DIR, ".chunk_swap")
+
+# Spatial index of the enemies (targeting, area of effect)
+SPATIAL_CELL_SIZE = 4 * CELL_SIZE  # In pixels
+
+# Enemy update LOD: (max distance to the player in cells, update every N ticks).
+# Far enemies are updated less often, with a proportionally longer step.
+ENEMY_LOD_TIERS = (
+    (20, 1),  # On screen
+    (40, 2),
+    (float("inf"), 4),
+)
+
+# Object pools (enemies, XP orbs, items, damage texts, VFX)
+POOL_MAX_SIZE = 256  # Free objects kept per class
+
+
+# Saves
+SAVE_IN_BACKGROUND = True  # Serialize and write saves in a worker thread
+SAVE_COMPRESSION_LEVEL = 1  # zlib level of save files, 0 to store them uncompressed
+# Off by default: autosaves go to the save file, which is loaded (paused) at startup
+AUTOSAVE_ENABLED = False
+AUTOSAVE_INTERVAL = 5000  # ms of play between autosaves
+AUTOSAVE_COMPACT_EVERY = 12  # Autosaves journaled as deltas before a full save
 
 # Item Settings
 GLOBAL_DROP_CHANCE = 0.3
 
+# XP orb merging
+XP_MERGE_INTERVAL = 250  # In ms, between two merge passes
+XP_MERGE_BUCKET_SIZE = CELL_SIZE  # In pixels, orbs in the same bucket are merged
+XP_MAX_ORBS = 200  # Live orb cap, buckets grow until it is met
+
 from config.constants import RARITY_COMMON, RARITY_RARE, RARITY_LEGENDARY
 
 RARITY_WEIGHTS = {RARITY_COMMON: 70, RARITY_RARE: 25, RARITY_LEGENDARY: 5}
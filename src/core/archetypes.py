@@ -0,0 +1,387 @@
+"""
+Compiled configuration.
+
+Each JSON config (environments, enemies, weapons, items) is validated once
+and compiled into frozen archetypes: defaults filled in, texture paths
+resolved, item effects scaled for each allowed rarity. Entities are then
+created by copying their archetype's `state` (the attributes an entity
+starts with) instead of reading the config entry field by field.
+
+The compiled form of each file is cached in `CONFIG_CACHE_DIR` as JSON,
+keyed by the file's modification time and size, `CONFIG_VERSION` and the
+settings the compilation depends on. An unchanged file is loaded from the
+cache without being validated or compiled again.
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from config.constants import (
+    BEHAVIOR_MELEE_SWING,
+    ITEM_TYPE_STAT,
+    ITEM_TYPE_WEAPON,
+    OP_ADD,
+    OP_MULTIPLY,
+)
+from config.settings import (
+    COLOR_ENEMY,
+    COLOR_RARITY,
+    CONFIG_CACHE_DIR,
+    CONFIG_CACHE_ENABLED,
+    ENEMY_DAMAGE,
+    ENEMY_HEALTH,
+    ENEMY_SPEED,
+    RARITY_SCALING,
+)
+
+CONFIG_VERSION = 1  # Bump when the archetypes or the compilation change
+
+
+class ConfigError(Exception):
+    pass
+
+
+def _frozen(value):
+    """Read-only copy of a JSON value: dicts become mapping proxies, lists tuples."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: _frozen(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(item) for item in value)
+    return value
+
+
+def _freeze_fields(archetype, *names):
+    for name in names:
+        object.__setattr__(archetype, name, _frozen(getattr(archetype, name)))
+
+
+@dataclass(frozen=True, slots=True)
+class EnvironmentArchetype:
+    name: str
+    walkable: bool = True
+    texture_path: str = ""
+    texture_file: str = None  # Full path of the texture
+    color: tuple = (255, 255, 255)
+    width: int = 1
+    height: int = 1
+    trigger: str = None
+
+    def __post_init__(self):
+        _freeze_fields(self, "color")
+
+
+@dataclass(frozen=True, slots=True)
+class EnemyArchetype:
+    name: str
+    width: float = 1
+    height: float = 1
+    color: tuple = COLOR_ENEMY
+    speed: float = ENEMY_SPEED
+    health: float = ENEMY_HEALTH
+    damage: float = ENEMY_DAMAGE
+    xp_value: int = 10
+    texture_file: str = None
+    state: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        _freeze_fields(self, "color")
+        # Attributes every enemy of this type starts with. A plain dict, for
+        # the fast path of __dict__.update; not to be modified
+        object.__setattr__(self, "state", {
+            "w": self.width,
+            "h": self.height,
+            "color": self.color,
+            "speed": self.speed,
+            "health": self.health,
+            "max_health": self.health,
+            "damage": self.damage,
+            "xp_value": self.xp_value,
+        })
+
+
+@dataclass(frozen=True, slots=True)
+class WeaponArchetype:
+    id: str
+    name: str
+    damage: float
+    range: float
+    cooldown: float
+    is_aoe: bool = False
+    aoe_radius: float = 0
+    tags: tuple = ()
+    texture_path: str = None
+    behavior_name: str = BEHAVIOR_MELEE_SWING
+    projectile: MappingProxyType = None
+    behavior_func: object = field(default=None, compare=False)  # Resolved by WeaponFactory
+
+    def __post_init__(self):
+        _freeze_fields(self, "tags", "projectile")
+
+
+@dataclass(frozen=True, slots=True)
+class ItemArchetype:
+    """One rarity variant of an item, its effects already scaled."""
+
+    name: str
+    type: str
+    rarity: str
+    effects: MappingProxyType
+    description: str = ""
+    color: tuple = None  # Rarity color if None
+    target_weapon: str = None
+    target_tag: str = None
+    duration: int = 0
+    texture_path: str = None
+    state: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        _freeze_fields(self, "effects", "color")
+        rarity_color = COLOR_RARITY.get(self.rarity, (255, 255, 255))
+        object.__setattr__(self, "state", {
+            "w": 1.0,
+            "h": 1.0,
+            "rarity_color": rarity_color,
+            "item_color": self.color or rarity_color,
+            "color": self.color or rarity_color,
+            "name": self.name,
+            "type": self.type,
+            "rarity": self.rarity,
+            "effects": self.effects,
+            "description": self.description,
+            "target_weapon": self.target_weapon,
+            "target_tag": self.target_tag,
+            "duration": self.duration,
+            "texture_path": self.texture_path,
+        })
+
+
+# Validation
+
+
+def _number(entry, key, default=None):
+    value = entry.get(key, default)
+    if value is None:
+        raise ConfigError(f"missing '{key}'")
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ConfigError(f"'{key}' must be a number, got {value!r}")
+    return value
+
+
+def _color(entry, key, default):
+    value = entry.get(key, default)
+    if value is None or isinstance(value, str):
+        return value  # Named pygame color
+    if (not isinstance(value, (list, tuple)) or len(value) not in (3, 4)
+            or not all(isinstance(c, int) and 0 <= c <= 255 for c in value)):
+        raise ConfigError(f"'{key}' must be a color, got {value!r}")
+    return tuple(value)
+
+
+def _string(entry, key, default=None):
+    value = entry.get(key, default)
+    if value is not None and not isinstance(value, str):
+        raise ConfigError(f"'{key}' must be a string, got {value!r}")
+    return value
+
+
+def _texture_file(base_dir, texture_path):
+    return os.path.normpath(os.path.join(base_dir, texture_path)) if texture_path else None
+
+
+# Compilers: (key, JSON entry, directory texture paths are relative to) -> archetypes
+
+
+def _compile_environment(name, entry, base_dir):
+    texture_path = _string(entry, "texture_path", "") or ""
+    yield EnvironmentArchetype(
+        name=name,
+        walkable=bool(entry.get("walkable", True)),
+        texture_path=texture_path,
+        texture_file=_texture_file(base_dir, texture_path),
+        color=_color(entry, "color", (255, 255, 255)),
+        width=_number(entry, "width", 1),
+        height=_number(entry, "height", 1),
+        trigger=_string(entry, "trigger"),
+    )
+
+
+def _compile_enemy(name, entry, base_dir):
+    yield EnemyArchetype(
+        name=name,
+        width=_number(entry, "width", 1),
+        height=_number(entry, "height", 1),
+        color=_color(entry, "color", COLOR_ENEMY),
+        speed=_number(entry, "speed", ENEMY_SPEED),
+        health=_number(entry, "health", ENEMY_HEALTH),
+        damage=_number(entry, "damage", ENEMY_DAMAGE),
+        xp_value=_number(entry, "xp_value", 10),
+        texture_file=_texture_file(base_dir, _string(entry, "texture_path")),
+    )
+
+
+def _compile_weapon(weapon_id, entry, base_dir):
+    projectile = entry.get("projectile")
+    if projectile is not None and not isinstance(projectile, dict):
+        raise ConfigError(f"'projectile' must be an object, got {projectile!r}")
+    tags = entry.get("tags") or []
+    if not all(isinstance(tag, str) for tag in tags):
+        raise ConfigError(f"'tags' must be strings, got {tags!r}")
+    yield WeaponArchetype(
+        id=weapon_id,
+        name=_string(entry, "name", weapon_id),
+        damage=_number(entry, "damage"),
+        range=_number(entry, "range"),
+        cooldown=_number(entry, "cooldown"),
+        is_aoe=bool(entry.get("is_aoe", False)),
+        aoe_radius=_number(entry, "aoe_radius", 0),
+        tags=tags,
+        texture_path=_string(entry, "texture_path") or None,
+        behavior_name=_string(entry, "behavior", BEHAVIOR_MELEE_SWING),
+        projectile=projectile,
+    )
+
+
+def _compile_item(index, entry, base_dir):
+    """One archetype per allowed rarity."""
+    name = _string(entry, "name")
+    if not name:
+        raise ConfigError("missing 'name'")
+    item_type = entry.get("type")
+    if item_type not in (ITEM_TYPE_STAT, ITEM_TYPE_WEAPON):
+        raise ConfigError(f"unknown type {item_type!r}")
+    effects = entry.get("effects")
+    if not isinstance(effects, dict):
+        raise ConfigError("'effects' must be an object")
+    for effect, effect_data in effects.items():
+        if effect_data.get("op") not in (OP_ADD, OP_MULTIPLY):
+            raise ConfigError(f"effect '{effect}' has an unknown op {effect_data.get('op')!r}")
+        _number(effect_data, "value")
+
+    rarities = entry.get("allowed_rarities") or []
+    if not rarities and "rarity" in entry:
+        rarities = [entry["rarity"]]  # Legacy single rarity
+    for rarity in rarities:
+        multiplier = RARITY_SCALING.get(rarity, 1.0)
+        yield ItemArchetype(
+            name=name,
+            type=item_type,
+            rarity=rarity,
+            # Rounded to 2 decimal places to avoid floating point mess
+            effects={
+                effect: {**effect_data, "value": round(effect_data["value"] * multiplier, 2)}
+                for effect, effect_data in effects.items()
+            },
+            description=_string(entry, "description", ""),
+            color=_color(entry, "color", None),
+            target_weapon=_string(entry, "target_weapon"),
+            target_tag=_string(entry, "target_tag"),
+            duration=_number(entry, "duration", 0),
+            texture_path=_string(entry, "texture_path") or None,
+        )
+
+
+_KINDS = {
+    # kind: (archetype class, entry compiler, settings the compilation depends on)
+    "environments": (EnvironmentArchetype, _compile_environment, ()),
+    "enemies": (EnemyArchetype, _compile_enemy, (COLOR_ENEMY, ENEMY_SPEED, ENEMY_HEALTH, ENEMY_DAMAGE)),
+    "weapons": (WeaponArchetype, _compile_weapon, ()),
+    "items": (ItemArchetype, _compile_item, (sorted(RARITY_SCALING.items()), sorted(COLOR_RARITY.items()))),
+}
+
+
+def _compile(kind, data, base_dir, path):
+    """Archetypes of every valid entry of `data`; invalid entries are skipped."""
+    compiler = _KINDS[kind][1]
+    entries = data.items() if isinstance(data, dict) else enumerate(data)
+    archetypes = []
+    for key, entry in entries:
+        try:
+            if not isinstance(entry, dict):
+                raise ConfigError("not an object")
+            archetypes.extend(compiler(key, entry, base_dir))
+        except (ConfigError, AttributeError, TypeError) as e:
+            print(f"Skipping invalid {kind} entry {key!r} in {path}: {e}")
+    return archetypes
+
+
+# Cache
+
+
+def _cache_key(kind, path, base_dir):
+    stat = os.stat(path)
+    h = hashlib.sha256()
+    h.update(f"v{CONFIG_VERSION}".encode())
+    h.update(repr((kind, os.path.abspath(path), stat.st_mtime_ns, stat.st_size, base_dir)).encode())
+    h.update(repr(_KINDS[kind][2]).encode())
+    return h.hexdigest()
+
+
+def _cache_path(kind, path, directory):
+    digest = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:12]
+    return os.path.join(directory, f"{kind}-{digest}.json")
+
+
+def _init_fields(cls):
+    # Fields read from the config, not the derived ones (state, behavior_func)
+    return [f.name for f in fields(cls) if f.init and f.compare]
+
+
+def _read_cache(kind, cache_path, key):
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("key") != key:
+        return None
+    cls = _KINDS[kind][0]
+    names = _init_fields(cls)
+    try:
+        return [cls(**dict(zip(names, row))) for row in cached["rows"]]
+    except (KeyError, TypeError) as e:
+        print(f"Ignoring invalid config cache {cache_path}: {e}")
+        return None
+
+
+def _write_cache(kind, cache_path, key, archetypes):
+    names = _init_fields(_KINDS[kind][0])
+    rows = [[getattr(archetype, name) for name in names] for archetype in archetypes]
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump({"key": key, "rows": rows}, f, default=dict)  # Mapping proxies as objects
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Failed to write config cache {cache_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_archetypes(kind, path, base_dir=None, cache_dir=CONFIG_CACHE_DIR, use_cache=CONFIG_CACHE_ENABLED):
+    """
+    Archetypes of the `kind` config file at `path` ("environments",
+    "enemies", "weapons" or "items"), from the cache when the file hasn't
+    changed. Texture paths are resolved relative to `base_dir` (by default
+    the file's directory). Raises OSError and ValueError like reading the
+    JSON file would; invalid entries are skipped with a message.
+    """
+    if base_dir is None:
+        base_dir = os.path.dirname(path)
+    base_dir = os.path.normpath(base_dir)
+
+    key = cache_path = None
+    if use_cache:
+        key = _cache_key(kind, path, base_dir)
+        cache_path = _cache_path(kind, path, cache_dir)
+        archetypes = _read_cache(kind, cache_path, key)
+        if archetypes is not None:
+            return archetypes
+
+    with open(path, "r") as f:
+        data = json.load(f)
+    archetypes = _compile(kind, data, base_dir, path)
+    if use_cache:
+        _write_cache(kind, cache_path, key, archetypes)
+    return archetypes
@@ -0,0 +1,96 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from config.settings import ASSET_DECODE_WORKERS
+
+
+def texture_paths(config_path, base_dir):
+    """Full paths of the "texture_path" entries of a JSON config, relative to `base_dir`."""
+    with open(config_path, "r") as f:
+        data = json.load(f)
+    entries = data.values() if isinstance(data, dict) else data
+    return [
+        os.path.normpath(os.path.join(base_dir, entry["texture_path"]))
+        for entry in entries
+        if isinstance(entry, dict) and entry.get("texture_path")
+    ]
+
+
+class ImageCache:
+    """
+    Images shared by path, decoded at most once.
+
+    `preload` decodes images in a thread pool (pygame releases the GIL while
+    decoding), in parallel with each other and with the game. `load` returns
+    the image converted for the display, waiting for its decoding if it was
+    preloaded, or decoding it right away otherwise. Conversion needs the
+    display, so it happens in `load`, on the main thread. `scaled` keeps
+    the copies of an image scaled to a sprite size, so drawing doesn't
+    scale it again every frame.
+    """
+
+    def __init__(self, workers=ASSET_DECODE_WORKERS):
+        self.workers = workers
+        self._executor = None
+        self._decoding = {}  # path -> Future of the decoded Surface
+        self._images = {}  # path -> converted Surface
+        self._scaled = {}  # (Surface, (width, height)) -> scaled copy
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="decode")
+        return self._executor
+
+    def preload(self, paths):
+        """Starts decoding `paths` in the background; missing files are skipped."""
+        for path in paths:
+            path = os.path.normpath(path)
+            if path in self._images or path in self._decoding or not os.path.exists(path):
+                continue
+            self._decoding[path] = self._get_executor().submit(pygame.image.load, path)
+
+    def load(self, path):
+        """The image at `path`, converted with alpha. Raises like pygame.image.load."""
+        path = os.path.normpath(path)
+        image = self._images.get(path)
+        if image is not None:
+            return image
+        future = self._decoding.pop(path, None)
+        image = future.result() if future is not None else pygame.image.load(path)
+        image = image.convert_alpha()
+        self._images[path] = image
+        return image
+
+    def scaled(self, image, size):
+        """`image` scaled to `size` (width, height in pixels), scaled once per size."""
+        key = (image, size)
+        scaled = self._scaled.get(key)
+        if scaled is None:
+            scaled = self._scaled[key] = pygame.transform.scale(image, size)
+        return scaled
+
+    def clear_scaled(self):
+        """Forgets every scaled copy, e.g. once sprite sizes changed."""
+        self._scaled.clear()
+
+    def invalidate(self, path):
+        """Forgets the image at `path`: the next `load` decodes the file again."""
+        path = os.path.normpath(path)
+        image = self._images.pop(path, None)
+        if image is not None:
+            self._scaled = {key: scaled for key, scaled in self._scaled.items() if key[0] is not image}
+        future = self._decoding.pop(path, None)
+        if future is not None:
+            future.cancel()
+
+    def shutdown(self):
+        if self._executor is not None:
+            # Waits for the images being decoded, drops the queued ones
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._decoding.clear()
+
+
+# Global accessor
+image_cache = ImageCache()
@@ -1,42 +1,69 @@
 import pygame
+from core.pool import pool_manager
+from core.scheduler import scheduler
 
 
 class DamageText:
-    def __init__(self, x, y, amount):
+    _font = None  # Shared by every text
+    DURATION = 1000  # In ms
+    RISE_SPEED = 0.06  # Pixels per ms (1 pixel per frame at 60 FPS)
+
+    def __init__(self, x, y, amount, count=1, now=0):
+        self.reset(x, y, amount, count, now)
+
+    def reset(self, x, y, amount, count=1, now=0):
         self.x = x
         self.y = y
         self.amount = amount
-        self.timer = 60  # last 60 frames
-        self.font = pygame.font.SysFont(None, 24)
+        self.count = count  # Enemies hit by the same attack
+        self.start_time = now  # Game time (ms)
+        if DamageText._font is None:
+            DamageText._font = pygame.font.SysFont(None, 24)
+        self.font = DamageText._font
         self.color = (255, 0, 0)
 
-    def update(self):
-        self.y -= 1  # upward movement
-        self.timer -= 1
-
-    def draw(self, screen, camera):
+    def draw(self, screen, camera, now):
+        # Upward movement, derived from the age of the text
+        elapsed = min(max(now - self.start_time, 0), self.DURATION)
         screen_x = self.x - camera.x
-        screen_y = self.y - camera.y
-        text = self.font.render(f"-{self.amount}", True, self.color)
+        screen_y = self.y - elapsed * self.RISE_SPEED - camera.y
+        label = f"-{self.amount}" if self.count == 1 else f"-{self.amount} x{self.count}"
+        text = self.font.render(label, True, self.color)
         screen.blit(text, (screen_x, screen_y))
 
-    def is_alive(self):
-        return self.timer > 0
-
 
 class DamageTexts:
-    def __init__(self):
-        self.texts = []
+    """
+    Floating damage texts. They age with the game's `current_time` as of
+    the last logic update (`update`), so they stay still while paused.
+    """
 
-    def spawn(self, x, y, amount):
-        self.texts.append(DamageText(x, y, amount))
+    def __init__(self, game):
+        self.game = game
+        self.now = game.current_time
+        self.texts = {}  # id(text) -> (text, expiry Timer), in spawn order
 
     def update(self):
-        for text in self.texts[:]:
-            text.update()
-            if not text.is_alive():
-                self.texts.remove(text)
+        """Called by the game logic, i.e. only while playing."""
+        self.now = self.game.current_time
+
+    def spawn(self, x, y, amount, count=1):
+        self.now = self.game.current_time
+        text = pool_manager.acquire(DamageText, x, y, amount, count, self.now)
+        timer = scheduler.schedule(text.start_time + DamageText.DURATION, self._expire, text)
+        self.texts[id(text)] = (text, timer)
+
+    def _expire(self, text):
+        del self.texts[id(text)]
+        pool_manager.release(text)
+
+    def clear(self):
+        """Drops every text, e.g. when the game is restarted or loaded."""
+        for text, timer in self.texts.values():
+            timer.cancel()
+            pool_manager.release(text)
+        self.texts.clear()
 
     def draw(self, screen, camera):
-        for text in self.texts:
-            text.draw(screen, camera)
+        for text, _ in self.texts.values():
+            text.draw(screen, camera, self.now)
@@ -1,25 +1,167 @@
-import pygame
+import atexit
+import sys
+import threading
 import time
-from config.settings import DEBUG_MODE
+from collections import deque
+import pygame
+from config.settings import (
+    DEBUG_MODE,
+    DEBUG_LOG_LEVEL,
+    DEBUG_LOG_CATEGORIES,
+    DEBUG_LOG_DEDUPE_WINDOW,
+    DEBUG_LOG_BUFFER_LINES,
+)
+
+# Log levels
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+
+
+class ConsoleSink:
+    """
+    Buffered console writer: lines are queued by the game loop and written
+    in batches by a background thread, so logging never waits on stdout.
+    When more than `max_lines` are waiting, the oldest are dropped.
+    """
+
+    def __init__(self, stream=None, interval=0.05, max_lines=DEBUG_LOG_BUFFER_LINES):
+        self.stream = stream
+        self.interval = interval
+        self.lines = deque(maxlen=max_lines)  # Full: appending drops the oldest
+        self.max_lines = max_lines
+        self.dropped = 0
+        self._wake = threading.Event()
+        self._lock = threading.Lock()  # Guards lines and dropped
+        self._write_lock = threading.Lock()  # One writer at a time
+        self._thread = None
+        self._closed = False
+
+    def write(self, line):
+        with self._lock:
+            if len(self.lines) == self.max_lines:
+                self.dropped += 1
+            self.lines.append(line)
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._run, name="debug-console", daemon=True)
+            self._thread.start()
+
+    def flush(self):
+        """Writes every queued line now."""
+        with self._write_lock:
+            # Only take the batch under the lock, so writing to the stream
+            # doesn't hold up the game loop's write()
+            with self._lock:
+                batch = list(self.lines)
+                self.lines.clear()
+                dropped, self.dropped = self.dropped, 0
+            if dropped:
+                batch.append(f"[DEBUG] {dropped} log lines dropped")
+            if batch:
+                stream = self.stream or sys.stdout
+                stream.write("\n".join(batch) + "\n")
+                stream.flush()
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.flush()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self.flush()
+
 
 class DebugOverlay:
+    """
+    Debug messages, shown in the overlay and written to the console.
+
+    Messages below `level` or outside `categories` are dropped before being
+    formatted: pass a %-format string and its arguments (or a callable
+    returning the text) so that the caller doesn't pay for formatting
+    either. A message repeated within `dedupe_window` seconds only refreshes
+    its overlay line (with a repeat count) and isn't written again; callables
+    are a new object on each call, so they are keyed on the text they return.
+    """
+
     _instance = None
+    MAX_MESSAGES = 20  # Overlay lines
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(DebugOverlay, cls).__new__(cls)
-            cls._instance.messages = []
+            cls._instance.messages = []  # [text, expiration] lists
             cls._instance.font = None
+            cls._instance.level = LEVELS.get(DEBUG_LOG_LEVEL, INFO)
+            cls._instance.categories = DEBUG_LOG_CATEGORIES  # None: every category
+            cls._instance.dedupe_window = DEBUG_LOG_DEDUPE_WINDOW
+            cls._instance.recent = {}  # key -> [first time, repeats, text, overlay message]
+            cls._instance.sink = ConsoleSink()
+            atexit.register(cls._instance.sink.close)
         return cls._instance
 
-    def log(self, text, duration=3.0):
+    def enabled(self, level=INFO, category="general"):
+        """Whether a message of this level and category would be logged."""
+        return DEBUG_MODE and level >= self.level and (
+            self.categories is None or category in self.categories
+        )
+
+    def log(self, text, *args, duration=3.0, level=INFO, category="general"):
         """Adds a message to the debug overlay."""
-        if not DEBUG_MODE:
+        if not DEBUG_MODE or level < self.level:
             return
+        if self.categories is not None and category not in self.categories:
+            return
+
+        now = time.time()
+        if callable(text):
+            text, args = text(), ()
+        try:
+            key = (category, text, args)
+            state = self.recent.get(key)
+        except TypeError:  # Unhashable arguments: no deduplication
+            key, state = None, None
+
+        if state is not None and now - state[0] < self.dedupe_window:
+            # Repeated: refresh the overlay line instead of adding one
+            state[1] += 1
+            message = state[3]
+            message[0] = f"{state[2]} (x{state[1] + 1})"
+            message[1] = now + duration
+            if message not in self.messages:
+                self.messages.append(message)
+            return
+
+        if args:
+            text = text % args
+        message = [text, now + duration]
+        self.messages.append(message)
+        if len(self.messages) > self.MAX_MESSAGES:
+            del self.messages[0]
 
-        expiration = time.time() + duration
-        self.messages.append((text, expiration))
-        print(f"[DEBUG] {text}")  # Also print to console
+        line = f"[DEBUG] {text}"  # Also print to console
+        if state is not None and state[1]:
+            line += f" (repeated {state[1]} more times)"
+        self.sink.write(line)
+
+        if key is not None:
+            if len(self.recent) > 1024:
+                self._prune(now)
+            self.recent[key] = [now, 0, text, message]
+
+    def _prune(self, now):
+        self.recent = {
+            key: state for key, state in self.recent.items()
+            if now - state[0] < self.dedupe_window
+        }
+
+    def flush(self):
+        self.sink.flush()
 
     def draw(self, surface):
         """Draws active messages to the surface."""
@@ -36,16 +178,16 @@ class DebugOverlay:
         y_offset = 10
         for text, _ in self.messages:
             text_surface = self.font.render(str(text), True, (255, 255, 255))
-            
+
             # Draw background for better readability
             bg_rect = text_surface.get_rect(topleft=(10, y_offset))
             bg_surface = pygame.Surface((bg_rect.width + 4, bg_rect.height + 4))
             bg_surface.set_alpha(180) # Semi-transparent
             bg_surface.fill((0, 0, 0))
-            
+
             surface.blit(bg_surface, (8, y_offset - 2))
             surface.blit(text_surface, (10, y_offset))
-            
+
             y_offset += 25
 
 # Global accessor
@@ -6,39 +6,52 @@ from core.renderer import GameRenderer
 from core.logic import GameLogic
 from config.settings import FPS
 from core.damages_text import DamageTexts
+from core.hot_reload import HotReloader
+from core.profiler import profiler, startup_trace
 
 
 class Game:
 
     def __init__(self):
         # Initialize Pygame
-        pygame.init()
+        with startup_trace.phase("pygame.init"):
+            pygame.init()
         self.player = None
+        self.world = None
 
-        # Perform initial setup
+        from core.save_manager import SaveManager
+
+        # Perform initial setup. A saved game brings its own level: don't
+        # generate one only to replace it
+        print(f"DEBUG: Checking for save file at {SaveManager.SAVE_FILE_PATH}")
+        has_save = SaveManager.has_save_file()
         self.setup = GameSetup(self)
-        self.setup.perform_setup()
+        with startup_trace.phase("setup"):
+            self.setup.perform_setup(new_game=not has_save)
 
         # Initialize subsystems
-        self.renderer = GameRenderer(self)
-        self.logic = GameLogic(self)
+        with startup_trace.phase("subsystems"):
+            self.renderer = GameRenderer(self)
+            self.logic = GameLogic(self)
+            self.hot_reloader = HotReloader(self)
         self.current_time = 0
         self.camera = Camera()
-        self.damage_texts = DamageTexts()
+        self.damage_texts = DamageTexts(self)
         self.enemies = []
 
         self.paused = False
 
         # Auto-load logic
-        from core.save_manager import SaveManager
-
-        print(f"DEBUG: Checking for save file at {SaveManager.SAVE_FILE_PATH}")
-        if SaveManager.has_save_file():
+        if has_save:
             print("DEBUG: Save file found. Auto-loading...")
-            if SaveManager.load_game(self):
+            self.setup.preload_assets()  # The saved entities need them
+            with startup_trace.phase("load save"):
+                loaded = SaveManager.load_game(self)
+            if loaded:
                 self.paused = True  # Start in pause menu as requested
             else:
                 print("DEBUG: Load failed. Starting fresh.")
+                self.setup.new_game()
                 self.paused = False
         else:
             print("DEBUG: No save file. Starting fresh.")
@@ -51,7 +64,10 @@ class Game:
         self.paused = False
 
     def run(self):
+        from core.save_manager import SaveManager
+
         running = True
+        first_frame = True  # Traced as the last startup phase
         # Main game loop
         while running:
             self.current_time = pygame.time.get_ticks()
@@ -72,14 +88,20 @@ class Game:
 
             if not self.paused:
                 self.logic.update()
-                self.damage_texts.update()
                 self.camera.update(self.player)
 
-            self.renderer.draw(self.camera)
+            if first_frame:
+                first_frame = False
+                with startup_trace.phase("first frame"):
+                    self.renderer.draw(self.camera)
+                startup_trace.mark_first_frame()
+                self.setup.preload_assets()  # In the background, while playing
+            else:
+                self.renderer.draw(self.camera)
+            SaveManager.poll()  # Report background saves
+            self.hot_reloader.poll(self.current_time)  # Configs and textures edited live
 
             self.clock.tick(FPS)
-            print(self.clock.get_fps())
+            profiler.count("fps", round(self.clock.get_fps(), 1))  # Logged with O
+        self.setup.shutdown()
         pygame.quit()
-
-
-gameInstance = Game()
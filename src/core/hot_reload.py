@@ -0,0 +1,162 @@
+"""
+Hot reload of the configs and textures.
+
+`HotReloader.poll` checks the config files, and the textures they use, for
+changes every `HOT_RELOAD_INTERVAL` ms by polling their modification time
+and size. A changed file only rebuilds what depends on it:
+
+    environments.json   cells patched in place, world baked again
+    enemies.json        enemy archetypes, live enemies patched in place
+    weapons.json        weapon archetypes, the player's weapons patched in
+                        place (upgrades kept)
+    items.json          item archetypes, items on the ground patched
+    a texture           the image decoded again, then the config using it
+                        reloaded as above
+
+Only the changed config is compiled again (see core/archetypes.py). A file
+that fails to load (e.g. saved halfway) is reported and the previous
+configuration kept.
+"""
+import os
+from config.settings import BASE_DIR, HOT_RELOAD_ENABLED, HOT_RELOAD_INTERVAL
+from core.archetypes import load_archetypes
+from core.assets import image_cache
+from core.debug import debug, WARNING
+from core.registry import Registry
+
+CONFIG_DIR = os.path.join(BASE_DIR, "config")
+
+
+class FileWatcher:
+    """Polls files for changes of their modification time or size."""
+
+    def __init__(self, paths=()):
+        self._stats = {}  # path -> (mtime, size), None if missing
+        for path in paths:
+            self.watch(path)
+
+    @staticmethod
+    def _stat(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def watch(self, path):
+        path = os.path.normpath(path)
+        if path not in self._stats:
+            self._stats[path] = self._stat(path)
+
+    def changed(self):
+        """Paths modified, created or deleted since the previous call."""
+        changed = []
+        for path, previous in self._stats.items():
+            current = self._stat(path)
+            if current != previous:
+                self._stats[path] = current
+                changed.append(path)
+        return changed
+
+
+class HotReloader:
+    def __init__(self, game, interval=HOT_RELOAD_INTERVAL, enabled=HOT_RELOAD_ENABLED):
+        self.game = game
+        self.interval = interval
+        self.enabled = enabled
+        self.last_poll = 0
+        # config path -> (kind, directory of its texture paths, reload function)
+        self.configs = {
+            os.path.join(CONFIG_DIR, "environments.json"): ("environments", CONFIG_DIR, self.reload_environments),
+            os.path.join(CONFIG_DIR, "enemies.json"): ("enemies", CONFIG_DIR, self.reload_enemies),
+            os.path.join(CONFIG_DIR, "weapons.json"): ("weapons", BASE_DIR, self.reload_weapons),
+            os.path.join(CONFIG_DIR, "items.json"): ("items", BASE_DIR, self.reload_items),
+        }
+        # texture path -> configs using it. Listing the textures compiles
+        # every config, so it waits for the first poll (startup loads them
+        # lazily)
+        self.textures = None
+        self.watcher = FileWatcher(self.configs if enabled else ())
+
+    def _watch_textures(self):
+        # Sprite sizes may have changed too
+        image_cache.clear_scaled()
+        self.textures = {}
+        for path, (kind, base_dir, _) in self.configs.items():
+            try:
+                archetypes = load_archetypes(kind, path, base_dir)
+            except (OSError, ValueError):
+                continue
+            for archetype in archetypes:
+                texture = getattr(archetype, "texture_file", None)
+                if texture is None and archetype.texture_path:
+                    texture = os.path.normpath(os.path.join(base_dir, archetype.texture_path))
+                if texture:
+                    self.textures.setdefault(texture, set()).add(path)
+                    self.watcher.watch(texture)
+
+    def poll(self, now):
+        """Reloads what changed since the previous poll; called every frame."""
+        if not self.enabled or now - self.last_poll < self.interval:
+            return
+        self.last_poll = now
+        if self.textures is None:
+            self._watch_textures()
+
+        reloads = []  # Config paths, each reloaded once
+        for path in self.watcher.changed():
+            if path in self.configs:
+                users = [path]
+            else:
+                image_cache.invalidate(path)
+                users = sorted(self.textures.get(path, ()))
+            reloads.extend(config for config in users if config not in reloads)
+        if not reloads:
+            return
+
+        for path in reloads:
+            name = os.path.basename(path)
+            try:
+                self.configs[path][2](path)
+            except (OSError, ValueError) as e:
+                debug.log("Failed to reload %s: %s", name, e, level=WARNING, category="reload")
+            else:
+                debug.log("Reloaded %s", name, category="reload")
+        self._watch_textures()  # The configs may use other textures now
+
+    def reload_environments(self, path):
+        Registry.load_cells(path)
+        renderer = getattr(self.game, "renderer", None)
+        if renderer is not None:
+            renderer.invalidate()
+
+    def reload_enemies(self, path):
+        from entities.enemy import Enemy
+
+        Registry.load_enemies(path)
+        for obj in self.game.gridObjects:
+            if isinstance(obj, Enemy):
+                config = Registry.get_enemy_config(obj.enemy_type)
+                if config is not None:
+                    obj.apply_archetype(config)
+
+    def reload_weapons(self, path):
+        from combat.factory import WeaponFactory
+
+        WeaponFactory.reload_weapons()
+        for weapon in self.game.player.combat.weapons:
+            archetype = WeaponFactory.get_archetype(weapon.id)
+            if archetype is not None:
+                weapon.apply_archetype(archetype)
+
+    def reload_items(self, path):
+        from items.factory import ItemFactory
+        from items.item import Item, clear_textures
+
+        ItemFactory.load_items()
+        clear_textures()
+        for obj in self.game.gridObjects:
+            if isinstance(obj, Item):
+                archetype = ItemFactory.get_item_data(obj.name, obj.rarity)
+                if archetype is not None:
+                    obj.reset(obj.x, obj.y, archetype)
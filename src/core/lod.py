@@ -0,0 +1,85 @@
+import numpy as np
+from operator import attrgetter
+from config.settings import CELL_SIZE, ENEMY_LOD_TIERS
+from core.profiler import profiler
+
+_get_x = attrgetter("x")
+_get_y = attrgetter("y")
+
+
+class UpdateLOD:
+    """
+    Distance-based update tiers for enemies.
+
+    Each tier is (max distance in cells, interval): enemies in a tier are
+    updated every `interval` ticks, with a timestep covering the ticks
+    since their last update. Each enemy gets a fixed phase so that a far
+    tier is spread evenly over its interval instead of updating all at once.
+    """
+
+    def __init__(self, tiers=ENEMY_LOD_TIERS):
+        self.limits_sq = np.array([(limit * CELL_SIZE) ** 2 for limit, _ in tiers])
+        self.intervals = np.array([interval for _, interval in tiers], dtype=np.int64)
+        self.max_interval = int(self.intervals.max())
+        self.reset()
+
+    def reset(self):
+        """Forgets the previous ticks, e.g. when a save replaces the enemies."""
+        self.tick = 0
+        self.counts = [0] * len(self.intervals)
+        # Enemies of the last update, their (N, 2) positions after it and
+        # the indices of those it moved, reused by the next tick's
+        # SpatialIndex (see GameLogic)
+        self.enemies = []
+        self.positions = np.empty((0, 2))
+        self.moved = np.empty(0, dtype=np.intp)
+
+    def update(self, enemies, target_pos):
+        """Updates the enemies due this tick; returns how many were updated."""
+        self.tick += 1
+        count = len(enemies)
+        updated = 0
+        if count:
+            xs = np.fromiter(map(_get_x, enemies), dtype=np.float64, count=count)
+            ys = np.fromiter(map(_get_y, enemies), dtype=np.float64, count=count)
+            dist_sq = (xs - target_pos[0]) ** 2 + (ys - target_pos[1]) ** 2
+            tiers = np.minimum(
+                np.searchsorted(self.limits_sq, dist_sq), len(self.intervals) - 1
+            )
+            intervals = self.intervals[tiers]
+            due = np.flatnonzero((self.tick + self._phases(enemies)) % intervals == 0)
+
+            tick = self.tick
+            moved = [enemies[i] for i in due.tolist()]
+            for enemy in moved:
+                last = getattr(enemy, "last_update", None)
+                dt = 1 if last is None else min(max(tick - last, 1), self.max_interval)
+                enemy.last_update = tick
+                enemy.update(target_pos, dt)
+            updated = len(due)
+            self.counts = np.bincount(tiers, minlength=len(self.intervals)).tolist()
+
+            # Only the updated enemies moved
+            if updated:
+                xs[due] = np.fromiter(map(_get_x, moved), dtype=np.float64, count=updated)
+                ys[due] = np.fromiter(map(_get_y, moved), dtype=np.float64, count=updated)
+            self.positions = np.column_stack((xs, ys))
+            self.moved = due
+        else:
+            self.counts = [0] * len(self.intervals)
+            self.positions = np.empty((0, 2))
+            self.moved = np.empty(0, dtype=np.intp)
+        self.enemies = enemies
+
+        for tier, tier_count in enumerate(self.counts):
+            profiler.count(f"lod.tier{tier}", tier_count)
+        profiler.count("lod.updated", updated)
+        return updated
+
+    @staticmethod
+    def _phases(enemies):
+        # Stable per object (pooled enemies keep their address), and well
+        # mixed: allocation addresses are sequential multiples of 16
+        ids = np.fromiter(map(id, enemies), dtype=np.uint64, count=len(enemies))
+        mixed = (ids >> np.uint64(4)) * np.uint64(0x9E3779B1)
+        return ((mixed >> np.uint64(16)) & np.uint64(0xFFFF)).astype(np.int64)
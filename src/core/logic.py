@@ -1,30 +1,56 @@
 import pygame
 import random
-from random import randint, choice
+import numpy as np
 from entities.enemy import Enemy
 from items.item import Item
 from items.factory import ItemFactory
-from entities.xp_orb import XPOrb
-from config.settings import CELL_SIZE, GLOBAL_DROP_CHANCE, SCREEN_HEIGHT_PIX, SCREEN_WIDTH_PIX
-from core.debug import debug
+from entities.xp_orb import XPOrb, merge_orbs
+from config.settings import (
+    CELL_SIZE,
+    GLOBAL_DROP_CHANCE,
+    XP_MAX_ORBS,
+    XP_MERGE_BUCKET_SIZE,
+    XP_MERGE_INTERVAL,
+)
+from core.debug import debug, DEBUG
 from core.triggers import execute_trigger
-from core.vfx import vfx_manager
-from core.registry import Registry
+from core.vfx import vfx_manager, ExplosionEffect
+from core.pool import pool_manager
+from core.spawner import SpawnDirector
+from core.spatial import SpatialIndex
+from core.lod import UpdateLOD
+from core.profiler import profiler
+from core.scheduler import scheduler
+from core.save_manager import SaveManager
 
 
 class GameLogic:
     def __init__(self, game):
         self.game = game
+        self.spawner = SpawnDirector(game)
+        self.lod = UpdateLOD()
+        self.enemy_index = None  # Last tick's SpatialIndex, see _enemy_index
+        self.next_orb_merge = 0
+        # Upper bound of the live XP orbs (exact after each merge pass)
+        self.xp_orb_count = 0
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_q:
                 self.game.player.combat.switch_weapon()
+            elif event.key == pygame.K_p:
+                for name, stats in pool_manager.stats().items():
+                    debug.log("Pool %s: %s", name, stats, duration=5.0, category="profiler")
+            elif event.key == pygame.K_o:
+                debug.log("Profiler: %s", profiler.stats(), duration=5.0, category="profiler")
 
     def update(self):
-        vfx_manager.update()
+        # Effect expiry, invulnerability, VFX and damage texts
+        scheduler.update(self.game.current_time)
+        self.game.damage_texts.update()
         
         self._handle_player_movement()
+        self.game.world.update_focus(self.game.player.x, self.game.player.y)
         self._handle_combat()
         
         # Check for game over (restart)
@@ -34,9 +60,12 @@ class GameLogic:
 
         self._handle_pickups()
         self._handle_spawning_and_drops()
+        self._handle_orb_merging()
 
-        for obj in self.game.gridObjects:
-            obj.update((self.game.player.x, self.game.player.y))
+        self._update_objects()
+
+        with profiler.section("logic.autosave"):
+            SaveManager.autosave(self.game, self.game.current_time)
 
         self._handle_input()
         self._handle_debug_input()
@@ -64,7 +93,6 @@ class GameLogic:
             new_rect = pygame.Rect(screen_w//2 - btn_w//2, new_y, btn_w, btn_h)
             
             if save_rect.collidepoint(mouse_pos):
-                from core.save_manager import SaveManager
                 SaveManager.save_game(self.game)
                 # Ensure we don't spam save
                 
@@ -73,7 +101,6 @@ class GameLogic:
                 pygame.event.post(pygame.event.Event(pygame.QUIT))
             
             elif new_rect.collidepoint(mouse_pos):
-                from core.save_manager import SaveManager
                 SaveManager.delete_save_file()
                 self.game.restart_game()
 
@@ -88,7 +115,10 @@ class GameLogic:
         # Update player combat logic
         # Filter enemies from gridObjects
         enemies = [obj for obj in self.game.gridObjects if isinstance(obj, Enemy)]
-        self.game.player.update(enemies)
+        # One spatial index per tick, shared by every targeting/AoE query
+        index = self._enemy_index(enemies)
+        self.game.player.update(index)
+        self._handle_projectiles(index)
 
         # Check for collisions between player and enemies
         player_rect = pygame.Rect(self.game.player.x, self.game.player.y, self.game.player.w * CELL_SIZE, self.game.player.h * CELL_SIZE)
@@ -97,50 +127,81 @@ class GameLogic:
             if player_rect.colliderect(enemy_rect):
                 self.game.player.take_damage(enemy.damage)
 
+    def _enemy_index(self, enemies):
+        """
+        The tick's SpatialIndex of `enemies`. Enemies only move in the LOD
+        pass, so the positions it left them at are still valid. When the
+        enemies are the same as last tick, last tick's index is carried
+        over, re-bucketing only the enemies the LOD pass moved; when some
+        were spawned since, the index is built from the LOD positions plus
+        theirs. Any other change (deaths, a load) reads them all again.
+        """
+        known = self.lod.enemies
+        count = len(known)
+        previous, self.enemy_index = self.enemy_index, None
+        if not count or enemies[:count] != known:
+            index = SpatialIndex(enemies)
+        elif len(enemies) == count and previous is not None and previous.objects == known:
+            previous.move(self.lod.moved, self.lod.positions)
+            index = previous
+        else:
+            positions = self.lod.positions
+            if len(enemies) > count:
+                spawned = enemies[count:]
+                positions = np.concatenate((positions, [(enemy.x, enemy.y) for enemy in spawned]))
+            index = SpatialIndex(enemies, positions=positions)
+        self.enemy_index = index
+        return index
+
+    def _handle_projectiles(self, enemies):
+        impacts = self.game.projectiles.update(self.game.world, enemies)
+        combat = self.game.player.combat
+        for x, y, damage, targets, aoe_radius, source in impacts:
+            if aoe_radius:
+                vfx_manager.spawn(ExplosionEffect, x, y, radius=aoe_radius, color=(255, 100, 0))
+            combat.apply_damage(targets, damage, (x, y), source)
+
     def _handle_pickups(self):
-        # Pickup System (Items & XP)
-        pickupables = [obj for obj in self.game.gridObjects if isinstance(obj, (Item, XPOrb))]
-        
-        # Pre-calculate player center and range squared
-        px = self.game.player.x + (self.game.player.w * CELL_SIZE) / 2
-        py = self.game.player.y + (self.game.player.h * CELL_SIZE) / 2
-        pickup_range_sq = self.game.player.pickup_range ** 2
-        
-        player_rect = pygame.Rect(self.game.player.x, self.game.player.y, self.game.player.w * CELL_SIZE, self.game.player.h * CELL_SIZE)
-        
-        for obj in pickupables:
-            # Magnet Logic (Optimized)
-            ox = obj.x + (obj.w * CELL_SIZE)/2
-            oy = obj.y + (obj.h * CELL_SIZE)/2
-            
-            dx = ox - px
-            dy = oy - py
-            dist_sq = dx*dx + dy*dy
-            
-            if dist_sq <= pickup_range_sq:
-                if hasattr(obj, 'move_towards'):
-                    obj.move_towards(self.game.player.x, self.game.player.y)
-            
-            # Collision/Collection Logic
-            # Optimization: Only check collision if close enough (e.g. < 2 tiles)
-            if dist_sq < (CELL_SIZE * 2) ** 2:
-                obj_rect = pygame.Rect(obj.x, obj.y, obj.w * CELL_SIZE, obj.h * CELL_SIZE)
-                if player_rect.colliderect(obj_rect):
-                    if isinstance(obj, Item):
-                        self.game.player.collect_item(obj)
-                    elif isinstance(obj, XPOrb):
-                        self.game.player.gain_xp(obj.value)
-                    
-                    if obj in self.game.gridObjects: # Check existence to avoid double removal
-                        self.game.gridObjects.remove(obj)
+        # Pickup System (Items & XP): one vectorized magnet/collection pass
+        player = self.game.player
+        collected = self.game.pickups.update(
+            player.x,
+            player.y,
+            player.w * CELL_SIZE,
+            player.h * CELL_SIZE,
+            player.pickup_range,
+        )
+        if not len(collected):
+            return
+
+        collected = self.game.pickups.pop(collected)
+        for obj in collected:
+            if isinstance(obj, Item):
+                player.collect_item(obj)
+            elif isinstance(obj, XPOrb):
+                player.gain_xp(obj.value)
+
+        collected_ids = {id(obj) for obj in collected}
+        self.game.gridObjects = [
+            obj for obj in self.game.gridObjects if id(obj) not in collected_ids
+        ]
+        for obj in collected:
+            # Timed items stay referenced by the player's active effects
+            if not getattr(obj, "duration", 0):
+                pool_manager.release(obj)
+
+    def _add_pickup(self, obj):
+        self.game.gridObjects.append(obj)
+        self.game.pickups.add(obj)
 
     def _handle_spawning_and_drops(self):
         # Remove dead enemies and Drop System
         dead_enemies = [obj for obj in self.game.gridObjects if isinstance(obj, Enemy) and obj.health <= 0]
         for enemy in dead_enemies:
             # Drop XP
-            xp_orb = XPOrb(enemy.x, enemy.y, enemy.xp_value)
-            self.game.gridObjects.append(xp_orb)
+            xp_orb = pool_manager.acquire(XPOrb, enemy.x, enemy.y, enemy.xp_value)
+            self._add_pickup(xp_orb)
+            self.xp_orb_count += 1
 
             # Apply luck to drop chance
             current_drop_chance = GLOBAL_DROP_CHANCE * self.game.player.luck_mult
@@ -149,9 +210,40 @@ class GameLogic:
                 # Pass luck to item factory for better rarity chances
                 item = ItemFactory.create_random_item(enemy.x, enemy.y, luck=self.game.player.luck_mult)
                 if item:
-                    self.game.gridObjects.append(item)
-                    debug.log(f"Item dropped: {item.name}")
+                    self._add_pickup(item)
+                    debug.log("Item dropped: %s", item.name, category="items")
             self.game.gridObjects.remove(enemy)
+            pool_manager.release(enemy)
+
+    def _handle_orb_merging(self):
+        # Low frequency, unless the orb cap is exceeded
+        now = self.game.current_time
+        if now < self.next_orb_merge and self.xp_orb_count <= XP_MAX_ORBS:
+            return
+        self.next_orb_merge = now + XP_MERGE_INTERVAL
+
+        orbs = [obj for obj in self.game.gridObjects if isinstance(obj, XPOrb)]
+        merged = merge_orbs(orbs, XP_MERGE_BUCKET_SIZE, XP_MAX_ORBS)
+        self.xp_orb_count = len(orbs) - len(merged)
+        if merged:
+            merged_ids = {id(orb) for orb in merged}
+            self.game.gridObjects = [
+                obj for obj in self.game.gridObjects if id(obj) not in merged_ids
+            ]
+            self.game.pickups.remove(merged)
+            pool_manager.release_all(merged)
+
+    def _update_objects(self):
+        target = (self.game.player.x, self.game.player.y)
+        enemies = []
+        for obj in self.game.gridObjects:
+            if isinstance(obj, Enemy):
+                enemies.append(obj)
+            else:
+                obj.update(target)
+        # Far enemies are updated less often
+        with profiler.section("logic.enemies"):
+            self.lod.update(enemies, target)
 
     def _handle_input(self):
         pass
@@ -159,16 +251,6 @@ class GameLogic:
     def _handle_debug_input(self):
         keystate = pygame.key.get_pressed()
         if keystate[pygame.K_SPACE]:
-            min_x, min_y, max_x, max_y = 0, 0, SCREEN_WIDTH_PIX, SCREEN_HEIGHT_PIX
-            enemy_types = Registry.get_enemy_types()
-            if enemy_types:
-                enemy_type = choice(enemy_types)
-                self.game.gridObjects.append(
-                    Enemy(
-                        self.game,
-                        randint(min_x, max_x - CELL_SIZE),
-                        randint(min_y, max_y - CELL_SIZE),
-                        enemy_type=enemy_type
-                    )
-                )
-                debug.log(f"Spawned {enemy_type}")
+            spawned = self.spawner.update(self.game.current_time)
+            if spawned:
+                debug.log("Spawned %s enemies", len(spawned), level=DEBUG, category="spawn")
@@ -1,7 +1,15 @@
+import numpy as np
 from config.settings import CELL_SIZE
 
 
 def check_collision(x, y, width, height, bounds, world):
+    """
+    Tests one box against the bounds and the world.
+
+    x and y are in pixels, width and height in cells (like entities' w, h).
+    Returns True out of bounds, the blocking (cell, origin_x, origin_y), or
+    False.
+    """
     min_x, min_y, max_x, max_y = bounds
 
     pixel_w = width * CELL_SIZE
@@ -13,18 +21,32 @@ def check_collision(x, y, width, height, bounds, world):
     if y < min_y or y > max_y - pixel_h:
         return True
 
-    # Check corners against world grid
-    corners = [
-        (x, y),
-        (x + pixel_w - 0.1, y),
-        (x, y + pixel_h - 0.1),
-        (x + pixel_w - 0.1, y + pixel_h - 0.1),
-    ]
+    # Grid span of the box corners
+    left = int((x - min_x) / CELL_SIZE)
+    top = int((y - min_y) / CELL_SIZE)
+    right = int((x + pixel_w - 0.1 - min_x) / CELL_SIZE)
+    bottom = int((y + pixel_h - 0.1 - min_y) / CELL_SIZE)
+
+    # Fast path: all four corners on walkable cells, read straight from the
+    # world's bitmask without allocating
+    walkable = world.walkable
+    if walkable is not None and right < world.width and bottom < world.height:
+        row_top = top * world.width
+        row_bottom = bottom * world.width
+        if (
+            walkable[row_top + left]
+            and walkable[row_top + right]
+            and walkable[row_bottom + left]
+            and walkable[row_bottom + right]
+        ):
+            return False
+
+    return _blocking_cell(world, left, top, right, bottom)
 
-    for cx, cy in corners:
-        grid_x = int((cx - min_x) / CELL_SIZE)
-        grid_y = int((cy - min_y) / CELL_SIZE)
 
+def _blocking_cell(world, left, top, right, bottom):
+    """Slow path: the first non-walkable corner cell and its origin."""
+    for grid_x, grid_y in ((left, top), (right, top), (left, bottom), (right, bottom)):
         cell_data = world.get_cell_full(grid_x, grid_y)
         if cell_data:
             cell, offset = cell_data
@@ -35,3 +57,47 @@ def check_collision(x, y, width, height, bounds, world):
                 return (cell, origin_x, origin_y)
 
     return False
+
+
+def check_collisions(boxes, bounds, world):
+    """
+    Batch query for many AABBs at once. Vectorized over a World's
+    walkable_mask; worlds without one (ChunkedWorld) test each box with
+    check_collision.
+
+    :param boxes: (N, 4) array of x, y in pixels and width, height in
+                  cells, the units of check_collision
+    :return: (N,) bool array, True where the box leaves the bounds or
+             overlaps a non-walkable cell
+    """
+    min_x, min_y, max_x, max_y = bounds
+    boxes = np.asarray(boxes, dtype=np.float64)
+    mask = world.walkable_mask
+    if mask is None:
+        return np.fromiter(
+            (check_collision(*box, bounds, world) is not False for box in boxes.tolist()),
+            dtype=bool,
+            count=len(boxes),
+        )
+
+    x, y = boxes[:, 0], boxes[:, 1]
+    w = boxes[:, 2] * CELL_SIZE
+    h = boxes[:, 3] * CELL_SIZE
+
+    blocked = (x < min_x) | (x > max_x - w) | (y < min_y) | (y > max_y - h)
+
+    left = ((x - min_x) / CELL_SIZE).astype(np.intp)
+    top = ((y - min_y) / CELL_SIZE).astype(np.intp)
+    right = ((x + w - 0.1 - min_x) / CELL_SIZE).astype(np.intp)
+    bottom = ((y + h - 0.1 - min_y) / CELL_SIZE).astype(np.intp)
+
+    # Boxes out of the grid are already blocked, clip them for the lookup
+    np.clip(left, 0, world.width - 1, out=left)
+    np.clip(right, 0, world.width - 1, out=right)
+    np.clip(top, 0, world.height - 1, out=top)
+    np.clip(bottom, 0, world.height - 1, out=bottom)
+
+    walkable = (
+        mask[top, left] & mask[top, right] & mask[bottom, left] & mask[bottom, right]
+    )
+    return blocked | (walkable == 0)
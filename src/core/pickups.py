@@ -0,0 +1,100 @@
+import numpy as np
+from config.settings import CELL_SIZE
+from entities.pickup import Pickup
+
+
+class PickupStore:
+    """
+    Pickups (items, XP orbs) with their positions and sizes in NumPy arrays.
+
+    The arrays are the source of truth for the magnet/collection pass, which
+    runs over every pickup at once; moved objects get their new position
+    written back for drawing and saving.
+    """
+
+    def __init__(self, objects=()):
+        self.objects = []
+        self.count = 0
+        self.x = np.empty(64)
+        self.y = np.empty(64)
+        self.w = np.empty(64)  # In pixels
+        self.h = np.empty(64)
+        for obj in objects:
+            if isinstance(obj, Pickup):
+                self.add(obj)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, obj):
+        if self.count == len(self.x):
+            for name in ("x", "y", "w", "h"):
+                array = getattr(self, name)
+                setattr(self, name, np.concatenate((array, np.empty(len(array)))))
+        i = self.count
+        self.x[i] = obj.x
+        self.y[i] = obj.y
+        self.w[i] = obj.w * CELL_SIZE
+        self.h[i] = obj.h * CELL_SIZE
+        self.objects.append(obj)
+        self.count += 1
+        return i
+
+    def pop(self, indices):
+        """Removes the pickups at `indices`, returns them."""
+        if not len(indices):
+            return []
+        keep = np.ones(self.count, dtype=bool)
+        keep[indices] = False
+        removed = [self.objects[i] for i in indices]
+        self.objects = [obj for obj, kept in zip(self.objects, keep) if kept]
+        for name in ("x", "y", "w", "h"):
+            array = getattr(self, name)
+            kept = array[:self.count][keep]
+            array[:len(kept)] = kept
+        self.count = len(self.objects)
+        return removed
+
+    def remove(self, objs):
+        ids = {id(obj) for obj in objs}
+        return self.pop([i for i, obj in enumerate(self.objects) if id(obj) in ids])
+
+    def update(self, player_x, player_y, player_w, player_h, magnet_range):
+        """
+        Pulls the pickups within `magnet_range` pixels (center to center)
+        towards the player and returns the indices of the pickups touching
+        the player's rect (x, y, w, h in pixels) this tick.
+        """
+        n = self.count
+        if not n:
+            return np.empty(0, dtype=np.intp)
+        x, y, w, h = self.x[:n], self.y[:n], self.w[:n], self.h[:n]
+
+        dx = x + w / 2 - (player_x + player_w / 2)
+        dy = y + h / 2 - (player_y + player_h / 2)
+        dist_sq = dx * dx + dy * dy
+
+        # Magnet: move towards the player's top left corner
+        pulled = np.flatnonzero(dist_sq <= magnet_range * magnet_range)
+        if len(pulled):
+            to_x = player_x - x[pulled]
+            to_y = player_y - y[pulled]
+            dist = np.hypot(to_x, to_y)
+            step = np.divide(
+                np.minimum(dist, Pickup.magnet_speed), dist,
+                out=np.zeros_like(dist), where=dist > 0,
+            )
+            x[pulled] += to_x * step
+            y[pulled] += to_y * step
+            for i in pulled.tolist():
+                obj = self.objects[i]
+                obj.x = float(x[i])
+                obj.y = float(y[i])
+
+        # Collection: only close pickups (< 2 tiles) touching the player
+        touching = (
+            (dist_sq < (CELL_SIZE * 2) ** 2)
+            & (x < player_x + player_w) & (x + w > player_x)
+            & (y < player_y + player_h) & (y + h > player_y)
+        )
+        return np.flatnonzero(touching)
@@ -0,0 +1,89 @@
+from config.settings import POOL_MAX_SIZE
+
+
+class ObjectPool:
+    """
+    Free list of reusable objects of one class.
+
+    The class must accept its constructor arguments in `reset(...)` too:
+    `acquire` reuses a released object through `reset` and only constructs
+    a new one when the pool is empty. A released object must not be used
+    by its previous owner anymore.
+    """
+
+    def __init__(self, cls, max_size=POOL_MAX_SIZE):
+        self.cls = cls
+        self.max_size = max_size
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0  # Released while the pool was full
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+            return obj
+        self.misses += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+        else:
+            self.dropped += 1
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            "free": len(self.free),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "dropped": self.dropped,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class PoolManager:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PoolManager, cls).__new__(cls)
+            cls._instance.pools = {}
+        return cls._instance
+
+    def get_pool(self, cls):
+        pool = self.pools.get(cls)
+        if pool is None:
+            pool = self.pools[cls] = ObjectPool(cls)
+        return pool
+
+    def acquire(self, cls, *args, **kwargs):
+        return self.get_pool(cls).acquire(*args, **kwargs)
+
+    def release(self, obj):
+        """Returns `obj` to the pool of its class, if it is poolable."""
+        if hasattr(obj, "reset"):
+            self.get_pool(type(obj)).release(obj)
+
+    def release_all(self, objs):
+        for obj in objs:
+            self.release(obj)
+
+    def stats(self):
+        """Per class name: free objects, hits, misses and hit rate."""
+        return {cls.__name__: pool.stats() for cls, pool in self.pools.items()}
+
+    def clear(self):
+        self.pools.clear()
+
+
+# Global accessor
+pool_manager = PoolManager()
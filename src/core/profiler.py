@@ -0,0 +1,99 @@
+import time
+from contextlib import contextmanager
+
+
+class Profiler:
+    """
+    Per-frame counters and section timings.
+
+    Counters hold the last value reported (e.g. enemies per LOD tier);
+    sections keep an exponential moving average of their duration in ms.
+    """
+
+    def __init__(self, smoothing=0.1):
+        self.smoothing = smoothing
+        self.counters = {}
+        self.timings = {}
+
+    def count(self, name, value):
+        self.counters[name] = value
+
+    @contextmanager
+    def section(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            previous = self.timings.get(name)
+            if previous is None:
+                self.timings[name] = elapsed
+            else:
+                self.timings[name] = previous + (elapsed - previous) * self.smoothing
+
+    def stats(self):
+        stats = dict(self.counters)
+        for name, ms in self.timings.items():
+            stats[name] = f"{ms:.3f} ms"
+        return stats
+
+    def reset(self):
+        self.counters.clear()
+        self.timings.clear()
+
+
+class StartupTrace:
+    """
+    Wall clock time of the startup phases, up to the first frame. Phases
+    may nest; the report lists them in the order they started. Timing is
+    always on (a few calls), the report is only printed when `enabled`
+    (python main.py --startup-trace).
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()  # Imported first thing by main.py
+        self.enabled = False
+        self.phases = []  # [depth, name, ms], ms is None while running
+        self.depth = 0
+        self.first_frame = None  # ms from start to the first frame
+
+    @contextmanager
+    def phase(self, name):
+        if self.first_frame is not None:
+            yield  # Started: later setups (restarts) aren't traced
+            return
+        entry = [self.depth, name, None]
+        self.phases.append(entry)
+        self.depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry[2] = (time.perf_counter() - start) * 1000
+            self.depth -= 1
+
+    def mark_first_frame(self):
+        """Called once the first frame is on screen."""
+        if self.first_frame is not None:
+            return
+        self.first_frame = (time.perf_counter() - self.start) * 1000
+        if self.enabled:
+            print(self.report())
+
+    def report(self):
+        total = self.first_frame if self.first_frame is not None else (time.perf_counter() - self.start) * 1000
+        lines = [f"Startup: {total:.1f} ms to the first frame"]
+        measured = 0.0
+        for depth, name, ms in self.phases:
+            if ms is None:
+                continue
+            if depth == 0:
+                measured += ms
+            lines.append(f"  {'  ' * depth}{name:<{32 - 2 * depth}} {ms:8.1f} ms")
+        lines.append(f"  {'(other)':<32} {total - measured:8.1f} ms")
+        return "\n".join(lines)
+
+
+# Global accessors
+profiler = Profiler()
+startup_trace = StartupTrace()
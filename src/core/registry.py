@@ -1,40 +1,42 @@
-import json
 import os
 import pygame
+from core.archetypes import load_archetypes
+from core.assets import image_cache
 from core.world import Cell
 
 class Registry:
     _cells = {}
-    _enemies = {}
+    _cell_ids = {}  # name -> compact integer id, in load order
+    _enemies = {}  # name -> EnemyArchetype
+    _enemy_textures = {}  # name -> texture (None if it has none), loaded on first use
 
     @staticmethod
-    def load_cells(filepath):
+    def load_cells(filepath, load_textures=True):
+        # load_textures=False is for headless use (e.g. generation workers)
         if not os.path.exists(filepath):
             print(f"Error: Environment file not found at {filepath}")
             return
 
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        
-        base_path = os.path.dirname(filepath)
-
-        for name, props in data.items():
-            cell = Cell(
-                name=name,
-                walkable=props.get('walkable', True),
-                texture_path=props.get('texture_path', ""),
-                color=tuple(props.get('color', (255, 255, 255))),
-                width=props.get('width', 1),
-                height=props.get('height', 1),
-                trigger=props.get('trigger', None)
-            )
+        for archetype in load_archetypes("environments", filepath):
+            name = archetype.name
+            # Reloads patch the cells in place: worlds hold references to them.
+            # Walkability is copied into each world's bitmask when its cells
+            # are set, so a change only applies to levels built afterwards
+            cell = Registry._cells.get(name) or Cell(name)
+            cell.walkable = archetype.walkable
+            cell.texture_path = archetype.texture_path
+            cell.color = archetype.color
+            cell.width = archetype.width
+            cell.height = archetype.height
+            cell.trigger = archetype.trigger
+            cell.texture = None
             
             # Load texture if path is provided
-            if cell.texture_path:
-                full_path = os.path.normpath(os.path.join(base_path, cell.texture_path))
+            full_path = archetype.texture_file
+            if full_path and load_textures:
                 if os.path.exists(full_path):
                     try:
-                        cell.texture = pygame.image.load(full_path).convert_alpha()
+                        cell.texture = image_cache.load(full_path)
                         print(f"Loaded texture for {name} from {full_path}")
                     except pygame.error as e:
                         print(f"Failed to load texture for {name} from {full_path}: {e}")
@@ -42,6 +44,7 @@ class Registry:
                     print(f"Texture not found for {name}: {full_path}")
 
             Registry._cells[name] = cell
+            Registry._cell_ids.setdefault(name, len(Registry._cell_ids))
             
         print(f"Loaded {len(Registry._cells)} cells.")
 
@@ -51,29 +54,11 @@ class Registry:
             print(f"Error: Enemy file not found at {filepath}")
             return
 
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        
-        base_path = os.path.dirname(filepath)
-
-        for name, props in data.items():
-            # Store raw properties, textures will be loaded when needed or pre-loaded here
-            # For now, let's pre-load the texture if it exists
-            texture = None
-            texture_path = props.get('texture_path', "")
-            if texture_path:
-                full_path = os.path.normpath(os.path.join(base_path, texture_path))
-                if os.path.exists(full_path):
-                    try:
-                        texture = pygame.image.load(full_path).convert_alpha()
-                        print(f"Loaded texture for enemy {name} from {full_path}")
-                    except pygame.error as e:
-                        print(f"Failed to load texture for enemy {name} from {full_path}: {e}")
-                else:
-                    print(f"Texture not found for enemy {name}: {full_path}")
-            
-            props['texture'] = texture
-            Registry._enemies[name] = props
+        # Textures are loaded when the first enemy of the type is created
+        # (see get_enemy_texture)
+        for archetype in load_archetypes("enemies", filepath):
+            Registry._enemies[archetype.name] = archetype
+            Registry._enemy_textures.pop(archetype.name, None)
             
         print(f"Loaded {len(Registry._enemies)} enemy types.")
 
@@ -81,10 +66,43 @@ class Registry:
     def get_cell(name):
         return Registry._cells.get(name)
 
+    @staticmethod
+    def get_cell_id(name):
+        """Compact id of a cell type, -1 if unknown (e.g. the world's Empty cell)."""
+        return Registry._cell_ids.get(name, -1)
+
+    @staticmethod
+    def get_cell_palette():
+        """List of cells indexed by their id."""
+        palette = [None] * len(Registry._cell_ids)
+        for name, cell_id in Registry._cell_ids.items():
+            palette[cell_id] = Registry._cells[name]
+        return palette
+
     @staticmethod
     def get_enemy_config(name):
+        """EnemyArchetype of an enemy type, None if unknown."""
         return Registry._enemies.get(name)
 
+    @staticmethod
+    def get_enemy_texture(name):
+        """Texture of an enemy type, loaded on first use."""
+        if name in Registry._enemy_textures:
+            return Registry._enemy_textures[name]
+        archetype = Registry._enemies.get(name)
+        full_path = archetype.texture_file if archetype else None
+        texture = None
+        if full_path and not os.path.exists(full_path):
+            print(f"Texture not found for enemy {name}: {full_path}")
+        elif full_path:
+            try:
+                texture = image_cache.load(full_path)
+                print(f"Loaded texture for enemy {name} from {full_path}")
+            except pygame.error as e:
+                print(f"Failed to load texture for enemy {name} from {full_path}: {e}")
+        Registry._enemy_textures[name] = texture
+        return texture
+
     @staticmethod
     def get_enemy_types():
         return list(Registry._enemies.keys())
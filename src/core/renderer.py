@@ -5,6 +5,7 @@ from core.debug import debug
 from core.vfx import vfx_manager
 from combat.weapon import Weapon
 from combat.combat_manager import CombatManager
+from levels.chunked import ChunkedWorld
 from config.settings import (
     COLOR_BACKGROUND, 
     COLOR_HEALTH_BAR_BG, 
@@ -31,15 +32,32 @@ class GameRenderer:
         self.rendering_surface = pygame.Surface((GRID_WIDTH_PIX, GRID_HEIGHT_PIX))
         self.font = pygame.font.SysFont("Arial", 24)
 
-        self.background_world = pygame.Surface((GRID_WIDTH_PIX, GRID_HEIGHT_PIX))
-        self.background_world.fill(COLOR_BACKGROUND)
-        self._draw_world()
+        # Chunked worlds are baked chunk by chunk: key -> (version, Surface)
+        self.chunk_surfaces = {}
+        # Other worlds are baked whole, on the first frame that shows them
+        self.background_world = None
+        self.baked_world = None
+
+    def invalidate(self):
+        """Bakes the world again on the next frame, e.g. after cell colors or textures changed."""
+        self.baked_world = None
+        self.chunk_surfaces.clear()
 
     def draw(self, camera : Camera):
         self.game.screen.fill(COLOR_BACKGROUND)
-        self.rendering_surface.blit(self.background_world, (0,0))
-
         self.cam_rect = camera.get_subregion()
+        if isinstance(self.game.world, ChunkedWorld):
+            self._draw_chunks(camera)
+        else:
+            if self.baked_world is not self.game.world:
+                self.background_world = pygame.Surface((GRID_WIDTH_PIX, GRID_HEIGHT_PIX))
+                self.background_world.fill(COLOR_BACKGROUND)
+                self._draw_world()
+                self.baked_world = self.game.world
+            # Only the visible part: the rest of the surface is never shown
+            visible = pygame.Rect(self.cam_rect.topleft, (SCREEN_WIDTH_PIX, SCREEN_HEIGHT_PIX))
+            self.rendering_surface.blit(self.background_world, visible.topleft, area=visible)
+
         self._draw_entities()
 
         self.game.screen.blit(self.rendering_surface, (0,0), area=self.cam_rect)
@@ -145,34 +163,89 @@ class GameRenderer:
         pygame.draw.rect(self.game.screen, (255, 255, 255), (health_x, health_y + bar_height + 30, bar_width, 10), 1)
 
     def _draw_world(self):
-        skip = 0
-        for y in range(self.game.world.height):
-            for x in range(self.game.world.width):
-                cell = self.game.world.get_cell(x, y)
-                if cell:
-                    rect = pygame.Rect(
-                        x * CELL_SIZE,
-                        y * CELL_SIZE,
-                        CELL_SIZE,
-                        CELL_SIZE,
-                    )
-                    if cell.texture:
-                        if (
-                            cell.texture.get_width() != CELL_SIZE
-                            or cell.texture.get_height() != CELL_SIZE
-                        ):
-                            cell.texture = pygame.transform.scale(
-                                cell.texture, (CELL_SIZE, CELL_SIZE)
-                            )
-                        self.background_world.blit(cell.texture, rect)
-                    else:
-                        pygame.draw.rect(self.background_world, cell.color, rect)
-        print("SKIP", skip)
+        surface = self.background_world
+        textures = {}  # Cell -> scaled texture, or None to fill with its color
+        textured = []
+        filled = {}  # Color -> positions of the untextured cells
+        for y, row in enumerate(self.game.world.grid):
+            for x, (cell, _) in enumerate(row):
+                texture = textures.get(cell, False)
+                if texture is False:
+                    texture = textures[cell] = self._cell_texture(cell)
+                if texture:
+                    textured.append((texture, (x * CELL_SIZE, y * CELL_SIZE)))
+                else:
+                    filled.setdefault(cell.color, []).append((x * CELL_SIZE, y * CELL_SIZE))
+
+        # The most common color fills the whole surface at once
+        if filled:
+            background = max(filled, key=lambda color: len(filled[color]))
+            surface.fill(background)
+            del filled[background]
+        for color, positions in filled.items():
+            for x, y in positions:
+                surface.fill(color, (x, y, CELL_SIZE, CELL_SIZE))
+        # One call for every textured cell
+        surface.blits(textured, doreturn=False)
+
+    def _cell_texture(self, cell):
+        if cell.texture and (
+            cell.texture.get_width() != CELL_SIZE
+            or cell.texture.get_height() != CELL_SIZE
+        ):
+            cell.texture = pygame.transform.scale(
+                cell.texture, (CELL_SIZE, CELL_SIZE)
+            )
+            # Opaque textures blit about twice as fast without per-pixel alpha
+            if pygame.mask.from_surface(cell.texture, 254).count() == CELL_SIZE * CELL_SIZE:
+                cell.texture = cell.texture.convert()
+        return cell.texture
+
+    def _draw_cell(self, surface, cell, rect):
+        texture = self._cell_texture(cell)
+        if texture:
+            surface.blit(texture, rect)
+        else:
+            pygame.draw.rect(surface, cell.color, rect)
+
+    def _bake_chunk(self, chunk):
+        world = chunk.world
+        surface = pygame.Surface((world.width * CELL_SIZE, world.height * CELL_SIZE))
+        surface.fill(COLOR_BACKGROUND)
+        for y in range(world.height):
+            for x in range(world.width):
+                rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+                self._draw_cell(surface, world.get_cell(x, y), rect)
+        return surface
+
+    def _draw_chunks(self, camera):
+        world = self.game.world
+        chunk_pix = world.chunk_size * CELL_SIZE
+
+        # Forget surfaces of chunks the world swapped out
+        for key in list(self.chunk_surfaces):
+            if key not in world.chunks:
+                del self.chunk_surfaces[key]
+
+        min_cx = max(0, int(camera.x // chunk_pix))
+        min_cy = max(0, int(camera.y // chunk_pix))
+        max_cx = min(world.chunks_x - 1, int((camera.x + SCREEN_WIDTH_PIX) // chunk_pix))
+        max_cy = min(world.chunks_y - 1, int((camera.y + SCREEN_HEIGHT_PIX) // chunk_pix))
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                chunk = world.get_chunk(cx, cy)
+                version = world.versions[(cx, cy)]
+                cached = self.chunk_surfaces.get((cx, cy))
+                if cached is None or cached[0] != version:
+                    cached = (version, self._bake_chunk(chunk))
+                    self.chunk_surfaces[(cx, cy)] = cached
+                self.rendering_surface.blit(cached[1], (cx * chunk_pix, cy * chunk_pix))
 
     def _draw_entities(self):
         self.game.player.draw(self.rendering_surface)
         for obj in self.game.gridObjects:
             obj.draw(self.rendering_surface)
+        self.game.projectiles.draw(self.rendering_surface)
 
     def draw_pause_menu(self):
         # Semi-transparent overlay
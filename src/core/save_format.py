@@ -0,0 +1,129 @@
+"""
+Versioned binary save format.
+
+A save is a set of named tables, each a dict of equally long columns: NumPy
+arrays, or lists of strings. Layout (little endian):
+
+    header        magic "NBSV", version u16, flags u16, table count u32
+                  (with FLAG_ZLIB, the rest of the file is zlib compressed)
+    string table  count u32, byte lengths u32[count], UTF-8 bytes
+    tables        name u32, rows u32, column count u32, then per column:
+                  name u32, dtype u32, byte size u64, raw column bytes
+
+Names, dtypes (NumPy dtype strings, or "str") and string values are ids in
+the string table. Columns are self-described, so a reader can skip the
+ones it doesn't know and default the ones missing from older saves.
+"""
+import struct
+import zlib
+import numpy as np
+
+MAGIC = b"NBSV"
+VERSION = 1
+FLAG_ZLIB = 1  # Everything after the header is zlib compressed
+
+_HEADER = struct.Struct("<4sHHI")
+_TABLE = struct.Struct("<III")
+_COLUMN = struct.Struct("<IIQ")
+_STRING_DTYPE = "str"
+
+
+class SaveFormatError(Exception):
+    pass
+
+
+def encode(tables, flags=0, compress_level=0):
+    """
+    Serializes `tables` ({name: {column: values}}) to bytes, zlib
+    compressed at `compress_level` (1-9) if given.
+    """
+    strings = {}
+
+    def string_id(text):
+        sid = strings.get(text)
+        if sid is None:
+            sid = strings[text] = len(strings)
+        return sid
+
+    body = []
+    for name, columns in tables.items():
+        rows = None
+        parts = []
+        for column, values in columns.items():
+            if isinstance(values, np.ndarray):
+                array = np.ascontiguousarray(values)
+                dtype = array.dtype.str
+            else:
+                array = np.fromiter(map(string_id, values), dtype="<u4", count=len(values))
+                dtype = _STRING_DTYPE
+            if rows is None:
+                rows = len(array)
+            elif len(array) != rows:
+                raise SaveFormatError(f"Column {name}.{column} has {len(array)} rows, expected {rows}")
+            data = array.tobytes()
+            parts.append(_COLUMN.pack(string_id(column), string_id(dtype), len(data)))
+            parts.append(data)
+        body.append(_TABLE.pack(string_id(name), rows or 0, len(columns)))
+        body.extend(parts)
+
+    encoded = [text.encode("utf-8") for text in strings]
+    lengths = np.array([len(text) for text in encoded], dtype="<u4")
+    payload = b"".join([struct.pack("<I", len(encoded)), lengths.tobytes(), *encoded, *body])
+    flags &= ~FLAG_ZLIB  # Reserved, set from compress_level
+    if compress_level:
+        flags |= FLAG_ZLIB
+        payload = zlib.compress(payload, compress_level)
+    return _HEADER.pack(MAGIC, VERSION, flags, len(tables)) + payload
+
+
+def decode(data):
+    """
+    Parses bytes written by `encode`. Returns (version, flags, tables);
+    string columns come back as lists, numeric ones as read-only arrays.
+    """
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise SaveFormatError("Truncated header")
+    magic, version, flags, table_count = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise SaveFormatError("Not a save file")
+    if version > VERSION:
+        raise SaveFormatError(f"Save version {version} is newer than supported ({VERSION})")
+
+    try:
+        offset = _HEADER.size
+        if flags & FLAG_ZLIB:
+            view = memoryview(zlib.decompress(view[offset:]))
+            offset = 0
+        (count,) = struct.unpack_from("<I", view, offset)
+        offset += 4
+        lengths = np.frombuffer(view, dtype="<u4", count=count, offset=offset)
+        offset += 4 * count
+        strings = []
+        for length in lengths.tolist():
+            strings.append(bytes(view[offset:offset + length]).decode("utf-8"))
+            offset += length
+
+        tables = {}
+        for _ in range(table_count):
+            name, rows, column_count = _TABLE.unpack_from(view, offset)
+            offset += _TABLE.size
+            columns = {}
+            for _ in range(column_count):
+                column, dtype, size = _COLUMN.unpack_from(view, offset)
+                offset += _COLUMN.size
+                if offset + size > len(view):
+                    raise SaveFormatError("Truncated column")
+                dtype = strings[dtype]
+                if dtype == _STRING_DTYPE:
+                    ids = np.frombuffer(view, dtype="<u4", count=rows, offset=offset)
+                    columns[strings[column]] = [strings[i] for i in ids.tolist()]
+                else:
+                    columns[strings[column]] = np.frombuffer(
+                        view, dtype=np.dtype(dtype), count=rows, offset=offset
+                    )
+                offset += size
+            tables[strings[name]] = columns
+    except (struct.error, zlib.error, ValueError, IndexError, UnicodeDecodeError) as e:
+        raise SaveFormatError(f"Corrupted save: {e}") from e
+    return version, flags, tables
@@ -0,0 +1,212 @@
+"""
+Incremental saves.
+
+An autosave doesn't rewrite the save file: `SaveJournal.diff` compares the
+save tables with those of the previous checkpoint and returns a delta
+holding only what changed, which is appended to a journal next to the save.
+Loading replays the journal over the save. Deltas hold:
+
+    player          the player fields that changed (one row)
+    <entities>      the enemies, XP orbs and items added or changed since the
+                    previous checkpoint, all columns, identified by "key"
+    <entities>.removed
+                    the keys of those that are gone
+    other tables    (camera, weapons, stats, ...) whole, when they changed
+
+The journal is a sequence of records (u32 byte length, then a save_format
+encoded delta). Each delta has a "meta" table with the generation of the
+save it applies to and its sequence number, so records left over from an
+older save, or a record torn by a crash, are ignored.
+"""
+import os
+import struct
+import numpy as np
+from core.save_format import encode, decode, SaveFormatError
+
+ENTITY_TABLES = ("enemies", "xp_orbs", "items")
+REMOVED = ".removed"
+_RECORD = struct.Struct("<I")
+
+
+def _as_array(values):
+    if isinstance(values, np.ndarray):
+        return values
+    return np.array(values, dtype=str)
+
+
+def _sorted_by_key(table):
+    keys = table["key"]
+    order = np.argsort(keys, kind="stable")
+    return {name: _as_array(values)[order] for name, values in table.items()}
+
+
+def _to_columns(table):
+    """Back to save columns: string arrays become lists."""
+    return {
+        name: values.tolist() if values.dtype.kind == "U" else values
+        for name, values in table.items()
+    }
+
+
+def _same_column(a, b):
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return isinstance(a, np.ndarray) and isinstance(b, np.ndarray) and np.array_equal(a, b)
+    return a == b
+
+
+def _diff_entities(previous, current):
+    """(upserted rows, removed keys) between two key sorted entity tables."""
+    previous_keys, keys = previous["key"], current["key"]
+    if not len(previous_keys):
+        return current, previous_keys
+    index = np.minimum(np.searchsorted(previous_keys, keys), len(previous_keys) - 1)
+    changed = previous_keys[index] != keys
+    for name, values in current.items():
+        old = previous.get(name)
+        if old is None:
+            changed[:] = True
+            break
+        if name != "key":
+            changed |= old[index] != values
+    removed = previous_keys[~np.isin(previous_keys, keys, assume_unique=True)]
+    return {name: values[changed] for name, values in current.items()}, removed
+
+
+class SaveJournal:
+    """Tables of the last checkpoint, to diff the next one against."""
+
+    def __init__(self):
+        self.generation = None  # Save the journal applies to; None: no save yet
+        self.sequence = 0  # Deltas appended since the save
+        self.tables = {}
+
+    def reset(self, tables, generation):
+        """Starts over from a full save of `tables`."""
+        self.generation = generation
+        self.sequence = 0
+        self.tables = self._checkpoint(tables)
+
+    def diff(self, tables):
+        """
+        The delta from the previous checkpoint to `tables`, or None if
+        nothing changed. `tables` becomes the new checkpoint.
+        """
+        current = self._checkpoint(tables)
+        delta = {}
+        for name, columns in current.items():
+            previous = self.tables.get(name)
+            if name in ENTITY_TABLES:
+                if previous is None:
+                    upserted, removed = columns, np.empty(0, dtype=columns["key"].dtype)
+                else:
+                    upserted, removed = _diff_entities(previous, columns)
+                if len(upserted["key"]):
+                    delta[name] = _to_columns(upserted)
+                if len(removed):
+                    delta[name + REMOVED] = {"key": removed}
+            elif name == "player":
+                changed = {
+                    field: values for field, values in columns.items()
+                    if previous is None or not _same_column(previous.get(field), values)
+                }
+                if changed:
+                    delta[name] = changed
+            elif name != "meta" and (previous is None or previous.keys() != columns.keys() or not all(
+                _same_column(previous[field], values) for field, values in columns.items()
+            )):
+                delta[name] = columns
+        self.tables = current
+        if not delta:
+            return None
+        self.sequence += 1
+        delta["meta"] = {
+            "generation": np.array([self.generation], dtype="<u8"),
+            "sequence": np.array([self.sequence], dtype="<u4"),
+        }
+        return delta
+
+    @staticmethod
+    def _checkpoint(tables):
+        return {
+            name: _sorted_by_key(columns) if name in ENTITY_TABLES else columns
+            for name, columns in tables.items()
+        }
+
+
+def apply_delta(tables, delta):
+    """Applies a delta returned by `SaveJournal.diff` to full save tables, in place."""
+    for name, columns in delta.items():
+        if name == "meta" or name.endswith(REMOVED):
+            continue
+        if name == "player":
+            tables["player"] = {**tables["player"], **columns}
+        elif name in ENTITY_TABLES:
+            continue  # Below, with their removals
+        else:
+            tables[name] = columns
+
+    for name in ENTITY_TABLES:
+        upserted = delta.get(name)
+        removed = delta.get(name + REMOVED)
+        if upserted is None and removed is None:
+            continue
+        table = {column: _as_array(values) for column, values in tables[name].items()}
+        dropped = [removed["key"]] if removed is not None else []
+        if upserted is not None:
+            dropped.append(upserted["key"])
+        keep = ~np.isin(table["key"], np.concatenate(dropped))
+        if upserted is not None:
+            upserted = {column: _as_array(values) for column, values in upserted.items()}
+            table = {
+                column: np.concatenate((values[keep], upserted[column]))
+                for column, values in table.items()
+            }
+        else:
+            table = {column: values[keep] for column, values in table.items()}
+        tables[name] = _to_columns(table)
+
+
+def append_record(path, delta, compress_level=0):
+    """Appends a delta to the journal at `path`; returns the bytes written."""
+    data = encode(delta, compress_level=compress_level)
+    with open(path, "ab") as f:
+        f.write(_RECORD.pack(len(data)))
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    return _RECORD.size + len(data)
+
+
+def replay(tables, path):
+    """
+    Applies the journal at `path` to the save `tables`, in place. Stops at
+    the first record that doesn't follow (older save, torn write). Returns
+    the number of deltas applied.
+    """
+    meta = tables.get("meta")
+    if meta is None or "key" not in tables.get("enemies", {}) or not os.path.exists(path):
+        return 0
+    generation = meta["generation"][0].item()
+    with open(path, "rb") as f:
+        data = f.read()
+
+    applied = 0
+    offset = 0
+    while offset + _RECORD.size <= len(data):
+        (length,) = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        if offset + length > len(data):
+            break  # Torn write
+        try:
+            _, _, delta = decode(data[offset:offset + length])
+        except SaveFormatError:
+            break
+        offset += length
+        record = delta.get("meta")
+        if record is None or record["generation"][0].item() != generation:
+            break
+        if record["sequence"][0].item() != applied + 1:
+            break
+        apply_delta(tables, delta)
+        applied += 1
+    return applied
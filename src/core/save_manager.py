@@ -1,85 +1,571 @@
-import pickle
+import gc
 import os
-from config.settings import BASE_DIR
-from core.debug import debug
+import time
+import numpy as np
+from pygame.math import Vector2
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby, islice
+from operator import attrgetter
+from config.settings import (
+    BASE_DIR,
+    SAVE_COMPRESSION_LEVEL,
+    SAVE_IN_BACKGROUND,
+    AUTOSAVE_ENABLED,
+    AUTOSAVE_INTERVAL,
+    AUTOSAVE_COMPACT_EVERY,
+)
+from core.debug import debug, DEBUG, INFO, ERROR
+from core.save_format import encode, decode
+from core.save_journal import SaveJournal, append_record, replay
 
-SAVE_FILE_NAME = "savegame.pkl"
+# Pickle saves (savegame.pkl) of older versions are deliberately not read:
+# unpickling a file can run arbitrary code
+SAVE_FILE_NAME = "savegame.sav"
 SAVE_FILE_PATH = os.path.join(BASE_DIR, SAVE_FILE_NAME)
+JOURNAL_FILE_PATH = SAVE_FILE_PATH + ".journal"  # Autosave deltas over the save file
+
+# Saved player fields and their column dtypes
+PLAYER_FIELDS = (
+    ("x", "<f8"),
+    ("y", "<f8"),
+    ("w", "<f8"),
+    ("speed", "<f8"),
+    ("health", "<f8"),
+    ("max_health", "<i8"),
+    ("invulnerable", "u1"),
+    ("invulnerability_duration", "<i8"),
+    ("last_hit_time", "<i8"),
+    ("xp", "<i8"),
+    ("level", "<i8"),
+    ("xp_to_next_level", "<i8"),
+)
+ENEMY_FIELDS = ("x", "y", "health", "max_health", "speed", "damage", "xp_value")
+PLAYER_OWNER = -1  # Owner of the player's stats in the stats/modifiers tables
+
+
+def _column(objects, attr, dtype="<f8"):
+    return np.fromiter(map(attrgetter(attr), objects), dtype=dtype, count=len(objects))
+
+
+def _keys(objects):
+    """Identifies entities across the checkpoints of a session (see save_journal)."""
+    return np.fromiter(map(id, objects), dtype="<u8", count=len(objects))
+
+
+def _stat_rows(owner, stats, rows, modifiers):
+    for stat, base in stats.base.items():
+        rows.append((owner, stat, base))
+    for stat, stack in stats.modifiers.items():
+        for token, (op, value) in stack.items():
+            modifiers.append((owner, stat, op, value, token))
+
+
+def snapshot_game(game):
+    """The save tables of `game`, taken from the live objects."""
+    from entities.enemy import Enemy
+    from entities.xp_orb import XPOrb
+    from items.item import Item
+
+    player = game.player
+    enemies, orbs, items = [], [], []
+    for obj in game.gridObjects:
+        if isinstance(obj, Enemy):
+            enemies.append(obj)
+        elif isinstance(obj, XPOrb):
+            orbs.append(obj)
+        elif isinstance(obj, Item):
+            items.append(obj)
+
+    weapons = player.combat.weapons
+    stat_rows, modifier_rows = [], []
+    _stat_rows(PLAYER_OWNER, player.stats, stat_rows, modifier_rows)
+    for index, weapon in enumerate(weapons):
+        _stat_rows(index, weapon.stats, stat_rows, modifier_rows)
+
+    effects = player.active_effects
+    effect_tokens = [
+        (index, token)
+        for index, effect_data in enumerate(effects)
+        for token in effect_data["modifiers"]
+    ]
+
+    player_table = {
+        name: np.array([getattr(player, name)], dtype=dtype) for name, dtype in PLAYER_FIELDS
+    }
+    player_table["current_weapon_index"] = np.array([player.combat.current_weapon_index], dtype="<i8")
+    player_table["next_token"] = np.array([player.stats.next_token], dtype="<i8")
+
+    tables = {
+        "player": player_table,
+        "camera": {
+            "x": np.array([game.camera.x], dtype="<f8"),
+            "y": np.array([game.camera.y], dtype="<f8"),
+        },
+        "weapons": {
+            "id": [weapon.id for weapon in weapons],
+            "last_attack_time": _column(weapons, "last_attack_time", "<i8"),
+            "next_token": np.array([weapon.stats.next_token for weapon in weapons], dtype="<i8"),
+        },
+        "stats": {
+            "owner": np.array([row[0] for row in stat_rows], dtype="<i4"),
+            "stat": [row[1] for row in stat_rows],
+            "base": np.array([row[2] for row in stat_rows], dtype="<f8"),
+        },
+        "modifiers": {
+            "owner": np.array([row[0] for row in modifier_rows], dtype="<i4"),
+            "stat": [row[1] for row in modifier_rows],
+            "op": [row[2] for row in modifier_rows],
+            "value": np.array([row[3] for row in modifier_rows], dtype="<f8"),
+            "token": np.array([row[4] for row in modifier_rows], dtype="<i8"),
+        },
+        "effects": {
+            "item": [effect_data["item"].name for effect_data in effects],
+            "rarity": [effect_data["item"].rarity for effect_data in effects],
+            "start_time": np.array([e["start_time"] for e in effects], dtype="<i8"),
+            "duration": np.array([e["duration"] for e in effects], dtype="<i8"),
+        },
+        "effect_modifiers": {
+            "effect": np.array([row[0] for row in effect_tokens], dtype="<i4"),
+            "token": np.array([row[1] for row in effect_tokens], dtype="<i8"),
+        },
+        "enemies": {
+            "key": _keys(enemies),
+            "type": [enemy.enemy_type for enemy in enemies],
+            **{field: _column(enemies, field) for field in ENEMY_FIELDS},
+        },
+        "xp_orbs": {
+            "key": _keys(orbs),
+            "x": _column(orbs, "x"),
+            "y": _column(orbs, "y"),
+            "value": _column(orbs, "value", "<i8"),
+        },
+        "items": {
+            "key": _keys(items),
+            "name": [item.name for item in items],
+            "rarity": [item.rarity for item in items],
+            "x": _column(items, "x"),
+            "y": _column(items, "y"),
+        },
+    }
+    _snapshot_level(game, tables)
+    return tables
+
+
+def _snapshot_level(game, tables):
+    """
+    Adds the level to the save tables: the packed level (see WorldLoader.pack)
+    or, for chunked worlds, the seed and the packed chunks modified since
+    they were generated (the others are generated again from the seed).
+    """
+    from levels.chunked import ChunkedWorld
+
+    world = getattr(game, "world", None)
+    if isinstance(world, ChunkedWorld):
+        keys, chunks = [], []
+        for key, packed in world.dirty_chunks():
+            keys.append(key)
+            chunks.append(packed)
+        sizes = np.array([len(packed) for packed in chunks], dtype="<i8")
+        tables["chunked_world"] = {"seed": np.array([world.seed], dtype="<i8")}
+        tables["chunks"] = {
+            "cx": np.array([key[0] for key in keys], dtype="<i4"),
+            "cy": np.array([key[1] for key in keys], dtype="<i4"),
+            "size": sizes,
+        }
+        tables["chunk_data"] = {
+            "data": np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int32),
+        }
+        return
+
+    loader = getattr(getattr(game, "setup", None), "world_loader", None)
+    if world is not None and loader is not None and loader.world is world:
+        tables["level"] = {"data": loader.pack()}
+
+
+def restore_level(tables):
+    """
+    The level of save tables: a WorldLoader or a ChunkedWorld, ready for
+    GameSetup.use_level, or None if the save has none (older saves).
+    """
+    from levels.chunked import ChunkedWorld
+    from levels.loader import WorldLoader
+
+    if "level" in tables:
+        data = np.array(tables["level"]["data"])  # Writable copy, regions are a view on it
+        return WorldLoader.from_packed(data)
+
+    if "chunked_world" in tables:
+        world = ChunkedWorld(tables["chunked_world"]["seed"][0].item())
+        table = tables["chunks"]
+        data = tables["chunk_data"]["data"]
+        offset = 0
+        for cx, cy, size in zip(table["cx"].tolist(), table["cy"].tolist(), table["size"].tolist()):
+            world.restore_chunk((cx, cy), data[offset:offset + size])
+            offset += size
+        return world
+    return None
+
+
+def _clones(prototype, fields, rows, objects):
+    """
+    Appends to `objects` a copy of `prototype` per row of `rows`, with
+    `fields` set to the row's values, without running __init__.
+    """
+    cls = type(prototype)
+    base = prototype.__dict__
+    new = object.__new__
+    append = objects.append
+    for values in rows:
+        obj = new(cls)
+        state = base.copy()
+        state.update(zip(fields, values))
+        obj.__dict__ = state
+        append(obj)
+
+
+def _restore_stats(stats, owner, tables):
+    table = tables["stats"]
+    for row_owner, stat, base in zip(table["owner"].tolist(), table["stat"], table["base"].tolist()):
+        if row_owner == owner and stat in stats:
+            stats.set_base(stat, base)
+    table = tables["modifiers"]
+    for row_owner, stat, op, value, token in zip(
+        table["owner"].tolist(), table["stat"], table["op"],
+        table["value"].tolist(), table["token"].tolist(),
+    ):
+        if row_owner == owner and stat in stats:
+            stats.add_modifier(stat, op, value, token)
+
+
+def restore_game(game, tables):
+    """
+    Rebuilds the player, camera and entities of `game` from save tables.
+    Weapons and items are recreated from the current configuration;
+    those it doesn't have anymore are dropped.
+    """
+    from combat.factory import WeaponFactory
+    from core.camera import Camera
+    from entities.player import Player
+    from items.factory import ItemFactory
+    from items.item import Item
+
+    row = {name: values[0].item() for name, values in tables["player"].items()}
+    player = Player(game, row["x"], row["y"], row["w"], row["speed"])
+    for name, _ in PLAYER_FIELDS:
+        if name in row:
+            setattr(player, name, row[name])
+    player.invulnerable = bool(player.invulnerable)
+    _restore_stats(player.stats, PLAYER_OWNER, tables)
+    player.stats.next_token = max(player.stats.next_token, row.get("next_token", 1))
+
+    weapons = []
+    table = tables["weapons"]
+    for index, (weapon_id, last_attack_time, next_token) in enumerate(zip(
+        table["id"], table["last_attack_time"].tolist(), table["next_token"].tolist()
+    )):
+        try:
+            weapon = WeaponFactory.create_weapon(weapon_id)
+        except ValueError as e:
+            debug.log("Dropped saved weapon: %s", e, category="save")
+            continue
+        weapon.last_attack_time = last_attack_time
+        _restore_stats(weapon.stats, index, tables)
+        weapon.stats.next_token = max(weapon.stats.next_token, next_token)
+        weapons.append(weapon)
+    player.combat.weapons = weapons
+    player.combat.current_weapon_index = min(row.get("current_weapon_index", 0), max(len(weapons) - 1, 0))
+
+    table = tables["effects"]
+    tokens = {}
+    effect_table = tables["effect_modifiers"]
+    for effect, token in zip(effect_table["effect"].tolist(), effect_table["token"].tolist()):
+        tokens.setdefault(effect, []).append(token)
+    player.active_effects = []
+    for index, (name, rarity, start_time, duration) in enumerate(zip(
+        table["item"], table["rarity"], table["start_time"].tolist(), table["duration"].tolist()
+    )):
+        item_data = ItemFactory.get_item_data(name, rarity)
+        if item_data is None:
+            # Unknown item: drop its effect for good
+            for token in tokens.get(index, ()):
+                player.stats.remove_modifier(token)
+            continue
+        player.active_effects.append({
+            "item": Item(player.x, player.y, item_data),
+            "start_time": start_time,
+            "duration": duration,
+            "modifiers": tokens.get(index, []),
+        })
+
+    camera = Camera()
+    camera.x = tables["camera"]["x"][0].item()
+    camera.y = tables["camera"]["y"][0].item()
+
+    objects = []
+    # Bulk allocation: no point in collection passes over half built objects
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        _restore_entities(game, tables, objects)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return player, camera, objects
+
+
+def _restore_entities(game, tables, objects):
+    from core.pool import pool_manager
+    from entities.enemy import Enemy
+    from entities.xp_orb import XPOrb
+    from items.factory import ItemFactory
+    from items.item import Item
+
+    table = tables["enemies"]
+    rows = zip(*(table[field].tolist() for field in ENEMY_FIELDS))
+    # One enemy built per type, the others copy its attributes (a run of
+    # enemies of the same type at a time, keeping their order)
+    prototypes = {}
+    for enemy_type, run in groupby(table["type"]):
+        prototype = prototypes.get(enemy_type)
+        if prototype is None:
+            prototype = prototypes[enemy_type] = Enemy(game, 0, 0, enemy_type)
+        _clones(prototype, ENEMY_FIELDS, islice(rows, sum(1 for _ in run)), objects)
+
+    table = tables["xp_orbs"]
+    base = XPOrb(0, 0, 0).__dict__
+    new = object.__new__
+    append = objects.append
+    for x, y, value in zip(table["x"].tolist(), table["y"].tolist(), table["value"].tolist()):
+        orb = new(XPOrb)
+        orb.__dict__ = {**base, "x": x, "y": y, "value": value, "velocity": Vector2(0, 0)}
+        append(orb)
+
+    table = tables["items"]
+    for name, rarity, x, y in zip(table["name"], table["rarity"], table["x"].tolist(), table["y"].tolist()):
+        item_data = ItemFactory.get_item_data(name, rarity)
+        if item_data is not None:
+            objects.append(pool_manager.acquire(Item, x, y, item_data))
+
+
+def write_save_file(path, tables, compress_level=SAVE_COMPRESSION_LEVEL):
+    """
+    Encodes `tables` and replaces the file at `path` atomically: the data is
+    written and fsynced to a temporary file first, then renamed over the
+    old save, so a crash mid-write leaves the previous save intact.
+    Returns the number of bytes written.
+    """
+    data = encode(tables, compress_level=compress_level)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    try:
+        # Persist the rename itself
+        directory = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+    except OSError:
+        pass  # Not supported on every platform
+    return len(data)
+
+
+def _write_snapshot(tables):
+    """Writes a full save; the journal of the previous one no longer applies."""
+    size = write_save_file(SAVE_FILE_PATH, tables)
+    if os.path.exists(JOURNAL_FILE_PATH):
+        os.remove(JOURNAL_FILE_PATH)
+    return size
+
 
 class SaveManager:
     SAVE_FILE_PATH = SAVE_FILE_PATH # Expose for debug
-    
+    _executor = None
+    _pending = []  # (Future, start time, message, level) of the saves in flight
+    _journal = SaveJournal()
+    _next_autosave = None
+
+    @staticmethod
+    def _get_executor():
+        if SaveManager._executor is None:
+            # One worker: saves are written in the order they were taken
+            SaveManager._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        return SaveManager._executor
+
+    @staticmethod
+    def _submit(write, args, message, level, background=SAVE_IN_BACKGROUND):
+        start = time.perf_counter()
+        if background:
+            future = SaveManager._get_executor().submit(write, *args)
+            SaveManager._pending.append((future, start, message, level))
+            return future
+        try:
+            size = write(*args)
+        except Exception as e:
+            debug.log("Failed to save game: %s", e, level=ERROR, category="save")
+        else:
+            SaveManager._report(message, level, size, start)
+        return None
+
     @staticmethod
-    def save_game(game):
+    def _report(message, level, size, start):
+        elapsed = (time.perf_counter() - start) * 1000
+        debug.log("%s (%.1f KiB, %.0f ms)", message, size / 1024, elapsed, level=level, category="save")
+
+    @staticmethod
+    def save_game(game, background=SAVE_IN_BACKGROUND, message="Game Saved Successfully!", level=INFO):
         """
-        Serializes and saves the current game state.
-        We explicitly choose what to save to avoid pickling the entire Game object 
-        (which contains non-serializable Pygame surfaces).
+        Saves the current game state.
+        We explicitly choose what to save (see snapshot_game): the snapshot
+        is taken right away, then encoded, compressed and written to disk in
+        a worker thread. Completion is reported by `poll`.
         """
-        data = {
-            "player": game.player,
-            "gridObjects": game.gridObjects,
-            "camera": game.camera,
-            "level": game.player.level,
-            "xp": game.player.xp    
-        }
-        
         try:
-            with open(SAVE_FILE_PATH, "wb") as f:
-                pickle.dump(data, f)
-            debug.log("Game Saved Successfully!")
+            tables = snapshot_game(game)
         except Exception as e:
-            debug.log(f"Failed to save game: {e}")
+            debug.log("Failed to save game: %s", e, level=ERROR, category="save")
+            return None
+
+        generation = time.time_ns()
+        tables["meta"] = {"generation": np.array([generation], dtype="<u8")}
+        SaveManager._journal.reset(tables, generation)
+        return SaveManager._submit(_write_snapshot, (tables,), message, level, background)
+
+    @staticmethod
+    def autosave(game, now):
+        """
+        Called every frame by the game logic. With AUTOSAVE_ENABLED, every
+        AUTOSAVE_INTERVAL ms, appends what changed since the previous
+        autosave to the journal; the first autosave and every
+        AUTOSAVE_COMPACT_EVERY-th are full saves instead, which start a new
+        journal. Autosaves are loaded at startup like manual saves.
+        """
+        if not AUTOSAVE_ENABLED:
+            return
+        if SaveManager._next_autosave is None:
+            SaveManager._next_autosave = now + AUTOSAVE_INTERVAL
+        if now < SaveManager._next_autosave:
+            return
+        SaveManager._next_autosave = now + AUTOSAVE_INTERVAL
+
+        journal = SaveManager._journal
+        if journal.generation is None or journal.sequence >= AUTOSAVE_COMPACT_EVERY:
+            SaveManager.save_game(game, message="Autosaved", level=DEBUG)
+            return
+        try:
+            delta = journal.diff(snapshot_game(game))
+        except Exception as e:
+            debug.log("Failed to autosave: %s", e, level=ERROR, category="save")
+            return
+        if delta is not None:
+            SaveManager._submit(
+                append_record, (JOURNAL_FILE_PATH, delta, SAVE_COMPRESSION_LEVEL), "Autosave journaled", DEBUG
+            )
+
+    @staticmethod
+    def poll():
+        """Reports the background saves finished since the last call (main thread)."""
+        while SaveManager._pending and SaveManager._pending[0][0].done():
+            future, start, message, level = SaveManager._pending.pop(0)
+            try:
+                size = future.result()
+            except Exception as e:
+                debug.log("Failed to save game: %s", e, level=ERROR, category="save")
+            else:
+                SaveManager._report(message, level, size, start)
+
+    @staticmethod
+    def wait():
+        """Blocks until every background save is written, and reports them."""
+        for future, *_ in SaveManager._pending:
+            try:
+                future.result()
+            except Exception:
+                pass  # Reported by poll
+        SaveManager.poll()
+
+    @staticmethod
+    def shutdown():
+        SaveManager.wait()
+        if SaveManager._executor is not None:
+            SaveManager._executor.shutdown()
+            SaveManager._executor = None
 
     @staticmethod
     def load_game(game):
         """
         Loads the game state from the save file and restores it into the given game instance.
         """
+        SaveManager.wait()  # Don't read a save still being written
         if not os.path.exists(SAVE_FILE_PATH):
             debug.log("No save file found.")
             return False
 
         try:
             with open(SAVE_FILE_PATH, "rb") as f:
-                data = pickle.load(f)
-            
-            # Restore state
-            game.player = data["player"]
-            game.gridObjects = data["gridObjects"]
-            game.camera = data["camera"]
-            
-            # Clear old VFX
-            from core.vfx import vfx_manager
-            vfx_manager.effects.clear()
-            
-            # Re-link game reference and restore transients
-            # Player
-            game.player.game = game
-            if hasattr(game.player, 'post_load'):
-                game.player.post_load()
-            
-            # Entities
-            for obj in game.gridObjects:
-                if hasattr(obj, 'game'):
-                    obj.game = game
-                
-                # Restore textures/behaviors
-                if hasattr(obj, 'post_load'):
-                    obj.post_load()
-            
-            debug.log("Game Loaded Successfully!")
-            return True
+                _, _, tables = decode(f.read())
+            replayed = replay(tables, JOURNAL_FILE_PATH)
+            level = restore_level(tables)
+            player, camera, objects = restore_game(game, tables)
         except Exception as e:
-            debug.log(f"Failed to load game: {e}")
+            debug.log("Failed to load game: %s", e, level=ERROR, category="save")
             return False
 
+        # Restore state
+        previous_objects = getattr(game, "gridObjects", [])
+        if getattr(game, "player", None) is not None:
+            game.player.cancel_timers()
+        if level is not None:
+            game.setup.use_level(level)
+        elif getattr(game, "world", None) is None:
+            game.setup.new_level()  # The save predates saved levels
+        game.player = player
+        game.gridObjects = objects
+        from core.pickups import PickupStore
+        game.pickups = PickupStore(game.gridObjects)
+        game.camera = camera
+
+        # Clear old VFX and damage texts
+        from core.vfx import vfx_manager
+        vfx_manager.clear()
+        if getattr(game, "damage_texts", None) is not None:
+            game.damage_texts.clear()
+        from combat.projectiles import ProjectileStore
+        game.projectiles = ProjectileStore()  # Projectiles in flight are not saved
+
+        # Loaded enemies start with no LOD update (last_update None), so the
+        # LOD ticks start over too
+        logic = getattr(game, "logic", None)
+        if logic is not None:
+            logic.lod.reset()
+
+        # Timed effects and invulnerability expire again
+        game.player.post_load()
+        game.world.update_focus(player.x, player.y)
+
+        # The replaced entities go back to their pools
+        from core.pool import pool_manager
+        pool_manager.release_all(previous_objects)
+
+        # Entity keys are only valid within a session: the next autosave is a full save
+        SaveManager._journal = SaveJournal()
+
+        debug.log("Game Loaded Successfully! (%d autosaves replayed)", replayed)
+        return True
+
     @staticmethod
     def has_save_file():
         return os.path.exists(SAVE_FILE_PATH)
 
     @staticmethod
     def delete_save_file():
+        SaveManager.wait()
+        SaveManager._journal = SaveJournal()
+        if os.path.exists(JOURNAL_FILE_PATH):
+            os.remove(JOURNAL_FILE_PATH)
         if os.path.exists(SAVE_FILE_PATH):
             os.remove(SAVE_FILE_PATH)
             debug.log("Save file deleted.")
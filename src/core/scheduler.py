@@ -0,0 +1,73 @@
+import heapq
+import itertools
+
+
+class Timer:
+    """A scheduled callback; `cancel()` it to drop it before it fires."""
+
+    __slots__ = ("deadline", "callback", "args", "pending", "scheduler")
+
+    def __init__(self, deadline, callback, args, scheduler):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.pending = True
+        self.scheduler = scheduler
+
+    def cancel(self):
+        if self.pending:
+            self.pending = False
+            self.scheduler._cancelled += 1
+
+
+class Scheduler:
+    """
+    Fires callbacks once their deadline (in pygame ticks, ms) has passed.
+
+    Timers are kept in a heap, so a tick only looks at the timers that
+    expire: its cost depends on the number of expirations, not on the
+    number of pending timers. Cancelled timers are dropped lazily.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._sequence = itertools.count()  # FIFO among equal deadlines
+        self._cancelled = 0
+
+    def __len__(self):
+        return len(self._heap) - self._cancelled
+
+    def schedule(self, deadline, callback, *args):
+        timer = Timer(deadline, callback, args, self)
+        heapq.heappush(self._heap, (deadline, next(self._sequence), timer))
+        return timer
+
+    def update(self, now):
+        """Fires every timer due at `now`; returns how many fired."""
+        heap = self._heap
+        fired = 0
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            if not timer.pending:
+                self._cancelled -= 1
+                continue
+            timer.pending = False
+            timer.callback(*timer.args)
+            fired += 1
+
+        # Don't let cancelled timers pile up
+        if self._cancelled > 64 and self._cancelled * 2 > len(heap):
+            self._heap = [entry for entry in heap if entry[2].pending]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+        return fired
+
+    def clear(self):
+        for _, _, timer in self._heap:
+            timer.pending = False
+        self._heap = []
+        self._cancelled = 0
+
+
+# Global accessor
+scheduler = Scheduler()
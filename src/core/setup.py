@@ -1,5 +1,8 @@
+from collections import deque
 from random import randint
 from levels.loader import WorldLoader
+from levels.pregen import LevelPregenerator
+from levels.chunked import ChunkedWorld
 import pygame
 import os
 from typing import List
@@ -13,10 +16,17 @@ from config.settings import (
 )
 from config.settings import (
     BASE_DIR,
+    CHUNKED_WORLD,
     PLAYER_SIZE,
     PLAYER_SPEED,
 )
+from core.assets import image_cache, texture_paths
 from core.registry import Registry
+from core.pool import pool_manager
+from core.pickups import PickupStore
+from core.vfx import vfx_manager
+from core.profiler import startup_trace
+from combat.projectiles import ProjectileStore
 from entities.base import GridObject
 from entities.player import Player
 
@@ -24,13 +34,24 @@ from entities.player import Player
 class GameSetup:
     def __init__(self, game):
         self.game = game
+        self.pregenerator = LevelPregenerator()
+        # Seeds of the current and upcoming levels, in play order
+        self.upcoming_seeds = deque()
 
-    def perform_setup(self):
-        self._init_display()
+    def perform_setup(self, new_game=True):
+        with startup_trace.phase("display"):
+            self._init_display()
         self.game.clock = pygame.time.Clock()
-        self._load_resources()
-        self._init_level()
-        self._init_entities()
+        with startup_trace.phase("resources"):
+            self._load_resources()
+        if new_game:
+            self.new_game()
+
+    def new_game(self):
+        with startup_trace.phase("level"):
+            self.new_level()
+        with startup_trace.phase("entities"):
+            self._init_entities()
 
     def _init_display(self):
         self.game.screen = pygame.display.set_mode(
@@ -38,16 +59,73 @@ class GameSetup:
         )
 
     def _load_resources(self):
-        Registry.load_cells(os.path.join(BASE_DIR, "config", "environments.json"))
-        Registry.load_enemies(os.path.join(BASE_DIR, "config", "enemies.json"))
+        config_dir = os.path.join(BASE_DIR, "config")
+        # Textures of the first frame decode in parallel while the rest loads
+        image_cache.preload(texture_paths(os.path.join(config_dir, "environments.json"), config_dir))
+        image_cache.preload(texture_paths(os.path.join(config_dir, "weapons.json"), BASE_DIR))
+        Registry.load_cells(os.path.join(config_dir, "environments.json"))
+        Registry.load_enemies(os.path.join(config_dir, "enemies.json"))
+
+    def preload_assets(self):
+        """Starts decoding the textures that weren't needed for the first frame."""
+        config_dir = os.path.join(BASE_DIR, "config")
+        image_cache.preload(texture_paths(os.path.join(config_dir, "enemies.json"), config_dir))
+        image_cache.preload(texture_paths(os.path.join(config_dir, "items.json"), BASE_DIR))
+
+    def new_level(self):
+        while len(self.upcoming_seeds) <= self.pregenerator.lookahead:
+            self.upcoming_seeds.append(randint(0, 2**31 - 1))
+
+        seed = self.upcoming_seeds.popleft()
+        if CHUNKED_WORLD:
+            self.use_level(ChunkedWorld(seed))
+            return
+
+        loader = WorldLoader(seed)
+        self.pregenerator.load(loader)
+        self.use_level(loader)
+
+        # Generate what comes next while this level is played
+        self.pregenerator.schedule(self.upcoming_seeds)
+
+    def use_level(self, level):
+        """Makes `level` (a generated WorldLoader, or a ChunkedWorld) the current level."""
+        if isinstance(level, ChunkedWorld):
+            self._use_chunked_level(level)
+            return
+
+        self.world_loader = level
+        self.game.world = level.world
+        self.rooms = level.rooms
+        self.game.level_index = level.index
+
+    def _use_chunked_level(self, world):
+        # Chunks are generated around the player as they explore, starting
+        # from the middle of the map
+        cx, cy = world.chunks_x // 2, world.chunks_y // 2
+        self.world_loader = world.get_chunk(cx, cy)
+        self.rooms = world.chunk_rooms(cx, cy)
+        self.game.world = world
+        self.game.level_index = None  # Chunks are indexed in local coordinates
 
-    def _init_level(self):
-        self.world_loader = WorldLoader()
-        self.game.world = self.world_loader.generate()
+    def shutdown(self):
+        self.pregenerator.shutdown()
+        image_cache.shutdown()
+        from core.save_manager import SaveManager
+        SaveManager.shutdown()  # Finish writing pending saves
 
     def _init_entities(self):
+        # Entities of the previous run go back to their pools
+        pool_manager.release_all(getattr(self.game, "gridObjects", []))
+        if getattr(self.game, "player", None) is not None:
+            self.game.player.cancel_timers()
+        if getattr(self.game, "damage_texts", None) is not None:
+            self.game.damage_texts.clear()
+        vfx_manager.clear()
         self.game.gridObjects = []
-        rooms = self.world_loader.rooms
+        self.game.pickups = PickupStore()
+        self.game.projectiles = ProjectileStore()
+        rooms = self.rooms
         spawn_room = rooms[randint(0, len(rooms) - 1)]
         # INDEX FOR CLARITY
         MINX, MINY, HEIGHT, WIDTH = (0, 1, 2, 3)
@@ -62,3 +140,4 @@ class GameSetup:
             PLAYER_SIZE,  # Player size matches tile size
             PLAYER_SPEED,
         )
+        self.game.world.update_focus(self.game.player.x, self.game.player.y)
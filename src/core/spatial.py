@@ -0,0 +1,293 @@
+import math
+import numpy as np
+from bisect import bisect_left
+from operator import attrgetter
+from config.settings import SPATIAL_CELL_SIZE
+
+_get_x = attrgetter("x")
+_get_y = attrgetter("y")
+
+
+class SpatialIndex:
+    """
+    Uniform grid over the positions (x, y) of a list of entities.
+
+    Built lazily on the first query, for the entities as they are at that
+    moment: build one per tick and share it between every query of the
+    tick. `positions`, the entities' (N, 2) positions if the caller already
+    has them, skips reading them from the entities; `move` carries an index
+    over to the next tick when only some of the entities moved. Queries
+    return indices into `objects`; distances are measured between
+    positions, like CombatManager.get_distance_to.
+    """
+
+    def __init__(self, objects, cell_size=SPATIAL_CELL_SIZE, positions=None):
+        self.objects = objects
+        self.cell_size = cell_size
+        self._known_positions = positions
+        self.positions = None  # (N, 2) array, once built
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __iter__(self):
+        return iter(self.objects)
+
+    def _build(self):
+        count = len(self.objects)
+        if self._known_positions is not None:
+            self.positions = self._known_positions
+            xs, ys = self.positions[:, 0], self.positions[:, 1]
+        else:
+            xs = np.fromiter(map(_get_x, self.objects), dtype=np.float64, count=count)
+            ys = np.fromiter(map(_get_y, self.objects), dtype=np.float64, count=count)
+            self.positions = np.column_stack((xs, ys))
+        self._keys = np.empty(0, dtype=np.int64)
+        if not count:
+            return
+
+        cx = np.floor(xs / self.cell_size).astype(np.int64)
+        cy = np.floor(ys / self.cell_size).astype(np.int64)
+        self._min_cell = (int(cx.min()), int(cy.min()))
+        self._max_cell = (int(cx.max()), int(cy.max()))
+        self._width = self._max_cell[0] - self._min_cell[0] + 1
+        # Grid cell key of each entity, entities sorted by key
+        self._entity_keys = (cy - self._min_cell[1]) * self._width + (cx - self._min_cell[0])
+        self._order = np.argsort(self._entity_keys)
+        self._group()
+
+    def _group(self):
+        # Sorted keys of the occupied cells and their slices of _order
+        keys = self._entity_keys[self._order]
+        starts = np.concatenate(([0], np.flatnonzero(keys[1:] != keys[:-1]) + 1))
+        self._keys = keys[starts]
+        self._starts = starts
+        self._ends = np.append(starts[1:], len(keys))
+        self._key_list = None  # For point queries, see _cell_indices
+
+    def move(self, indices, positions):
+        """
+        Carries the index over to the new (N, 2) `positions` of the same
+        objects, of which only those at `indices` moved: just the ones that
+        changed grid cell are sorted again.
+        """
+        if self.positions is None:  # Never queried: nothing built to keep
+            self._known_positions = positions
+            return
+        self.positions = positions
+        if not len(indices):
+            return
+
+        cx = np.floor(positions[indices, 0] / self.cell_size).astype(np.int64)
+        cy = np.floor(positions[indices, 1] / self.cell_size).astype(np.int64)
+        min_x, min_y = self._min_cell
+        if (
+            cx.min() < min_x or cx.max() > self._max_cell[0]
+            or cy.min() < min_y or cy.max() > self._max_cell[1]
+        ):
+            # Out of the grid: build again on the next query
+            self.positions = None
+            self._known_positions = positions
+            return
+
+        keys = (cy - min_y) * self._width + (cx - min_x)
+        changed = keys != self._entity_keys[indices]
+        if changed.any():
+            self._entity_keys[indices[changed]] = keys[changed]
+            # Nearly sorted already: the stable sort (timsort) is about linear
+            self._order = self._order[np.argsort(self._entity_keys[self._order], kind="stable")]
+            self._group()
+
+    def _cell_indices(self, cx, cy):
+        """Entities of one grid cell, None if it is empty (binary search, no NumPy call)."""
+        min_x, min_y = self._min_cell
+        if not (min_x <= cx <= self._max_cell[0] and min_y <= cy <= self._max_cell[1]):
+            return None
+        keys = self._key_list
+        if keys is None:
+            keys = self._key_list = self._keys.tolist()
+        key = (cy - min_y) * self._width + (cx - min_x)
+        i = bisect_left(keys, key)
+        if i == len(keys) or keys[i] != key:
+            return None
+        return self._order[self._starts[i]:self._ends[i]]
+
+    def query_radius(self, x, y, radius):
+        """Indices of the entities within `radius` of (x, y)."""
+        if self.positions is None:
+            self._build()
+        if not len(self._keys):
+            return np.empty(0, dtype=np.intp)
+
+        size = self.cell_size
+        chunks = []
+        for cy in range(int(math.floor((y - radius) / size)), int(math.floor((y + radius) / size)) + 1):
+            for cx in range(int(math.floor((x - radius) / size)), int(math.floor((x + radius) / size)) + 1):
+                indices = self._cell_indices(cx, cy)
+                if indices is not None:
+                    chunks.append(indices)
+        if not chunks:
+            return np.empty(0, dtype=np.intp)
+
+        candidates = np.concatenate(chunks)
+        offsets = self.positions[candidates] - (x, y)
+        dist_sq = np.einsum("ij,ij->i", offsets, offsets)
+        return candidates[dist_sq <= radius * radius]
+
+    def query_segments(self, starts, ends, radius):
+        """
+        Swept circle test: entities within `radius` (scalar or one per
+        segment) of the segments starts[i] -> ends[i], given as (N, 2) arrays.
+
+        Returns three arrays (segment, entity, t), sorted by segment then by
+        t in [0, 1], the position along the segment where the swept circle
+        first touches the entity.
+        Segments are expected to be short compared to the grid cells: those
+        spanning more than 2x2 cells take a slower path.
+        """
+        if self.positions is None:
+            self._build()
+        empty = np.empty(0, dtype=np.intp)
+        if not len(self._keys) or not len(starts):
+            return empty, empty, np.empty(0)
+
+        starts = np.asarray(starts, dtype=np.float64)
+        ends = np.asarray(ends, dtype=np.float64)
+        radius = np.broadcast_to(np.asarray(radius, dtype=np.float64), (len(starts),))
+        size = self.cell_size
+        lo = np.floor((np.minimum(starts, ends) - radius[:, None]) / size).astype(np.int64)
+        hi = np.floor((np.maximum(starts, ends) + radius[:, None]) / size).astype(np.int64)
+        span = hi - lo
+
+        # Grid cells covered by each segment's bounding box
+        segments, cells_x, cells_y = [], [], []
+        small = np.flatnonzero((span <= 1).all(axis=1))
+        for ox in (0, 1):
+            for oy in (0, 1):
+                sel = small[(span[small, 0] >= ox) & (span[small, 1] >= oy)]
+                segments.append(sel)
+                cells_x.append(lo[sel, 0] + ox)
+                cells_y.append(lo[sel, 1] + oy)
+        for i in np.flatnonzero((span > 1).any(axis=1)).tolist():
+            for cy in range(int(lo[i, 1]), int(hi[i, 1]) + 1):
+                for cx in range(int(lo[i, 0]), int(hi[i, 0]) + 1):
+                    segments.append([i])
+                    cells_x.append([cx])
+                    cells_y.append([cy])
+        segment = np.concatenate(segments).astype(np.intp)
+        cx = np.concatenate(cells_x).astype(np.int64)
+        cy = np.concatenate(cells_y).astype(np.int64)
+
+        # Vectorized bucket lookup
+        min_x, min_y = self._min_cell
+        inside = (
+            (cx >= min_x) & (cx <= self._max_cell[0]) & (cy >= min_y) & (cy <= self._max_cell[1])
+        )
+        segment = segment[inside]
+        keys = (cy[inside] - min_y) * self._width + (cx[inside] - min_x)
+        found = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+        hit = self._keys[found] == keys
+        segment, bucket = segment[hit], found[hit]
+
+        # Expand (segment, bucket) into (segment, entity) candidate pairs
+        counts = self._ends[bucket] - self._starts[bucket]
+        total = int(counts.sum())
+        if not total:
+            return empty, empty, np.empty(0)
+        segment = np.repeat(segment, counts)
+        first = np.repeat(self._starts[bucket] - (np.cumsum(counts) - counts), counts)
+        entity = self._order[first + np.arange(total)]
+
+        # Exact distance from each entity to its segment
+        a = starts[segment]
+        d = ends[segment] - a
+        p = self.positions[entity]
+        length_sq = np.einsum("ij,ij->i", d, d)
+        t = np.divide(
+            np.einsum("ij,ij->i", p - a, d), length_sq,
+            out=np.zeros_like(length_sq), where=length_sq > 0,
+        )
+        np.clip(t, 0.0, 1.0, out=t)
+        offsets = p - (a + d * t[:, None])
+        dist_sq = np.einsum("ij,ij->i", offsets, offsets)
+        radius_sq = radius[segment] ** 2
+        close = dist_sq <= radius_sq
+
+        # Step back from the closest point to the first contact
+        segment, entity, t = segment[close], entity[close], t[close]
+        back = np.sqrt((radius_sq[close] - dist_sq[close]) / np.maximum(length_sq[close], 1e-12))
+        t = np.maximum(t - np.where(length_sq[close] > 0, back, 0.0), 0.0)
+        order = np.lexsort((t, segment))
+        return segment[order], entity[order], t[order]
+
+    def k_nearest(self, x, y, k, max_distance=math.inf):
+        """
+        Indices of the `k` entities closest to (x, y), nearest first, and
+        only those within `max_distance`. Searches rings of grid cells
+        outwards and stops as soon as no farther ring can do better.
+        """
+        if self.positions is None:
+            self._build()
+        if not len(self._keys) or k <= 0:
+            return []
+
+        size = self.cell_size
+        qx, qy = int(math.floor(x / size)), int(math.floor(y / size))
+        # Rings beyond this one contain no cell of the grid
+        last_ring = max(
+            abs(qx - self._min_cell[0]), abs(qx - self._max_cell[0]),
+            abs(qy - self._min_cell[1]), abs(qy - self._max_cell[1]),
+        )
+
+        chunks = []
+        found = 0
+        best = None
+        for ring in range(last_ring + 1):
+            if ring > 0 and (ring - 1) * size > max_distance:
+                break
+            for cx, cy in self._ring(qx, qy, ring):
+                indices = self._cell_indices(cx, cy)
+                if indices is not None:
+                    chunks.append(indices)
+                    found += len(indices)
+            if found >= k:
+                # Unvisited entities are at least `ring` cells away
+                candidates = np.concatenate(chunks)
+                dist_sq = self._dist_sq(candidates, x, y)
+                kth = np.partition(dist_sq, k - 1)[k - 1]
+                if kth <= (ring * size) ** 2:
+                    best = (candidates, dist_sq)
+                    break
+
+        if best is None:
+            if not chunks:
+                return []
+            candidates = np.concatenate(chunks)
+            best = (candidates, self._dist_sq(candidates, x, y))
+
+        candidates, dist_sq = best
+        order = np.argsort(dist_sq, kind="stable")[:k]
+        order = order[dist_sq[order] <= max_distance * max_distance]
+        return candidates[order].tolist()
+
+    def nearest(self, x, y, max_distance=math.inf):
+        """Closest entity to (x, y) within `max_distance`, None if there is none."""
+        found = self.k_nearest(x, y, 1, max_distance)
+        return self.objects[found[0]] if found else None
+
+    def _dist_sq(self, indices, x, y):
+        offsets = self.positions[indices] - (x, y)
+        return np.einsum("ij,ij->i", offsets, offsets)
+
+    @staticmethod
+    def _ring(qx, qy, ring):
+        """Cells at Chebyshev distance `ring` from (qx, qy)."""
+        if ring == 0:
+            yield qx, qy
+            return
+        for cx in range(qx - ring, qx + ring + 1):
+            yield cx, qy - ring
+            yield cx, qy + ring
+        for cy in range(qy - ring + 1, qy + ring):
+            yield qx - ring, cy
+            yield qx + ring, cy
@@ -0,0 +1,122 @@
+from collections import deque
+from random import choice, randint
+from config.settings import (
+    CELL_SIZE,
+    SCREEN_HEIGHT_PIX,
+    SCREEN_WIDTH_PIX,
+    SPAWN_BATCH_SIZE,
+    SPAWN_MAX_ENEMIES,
+    SPAWN_MAX_PER_WINDOW,
+    SPAWN_RADIUS,
+    SPAWN_VIEW_MARGIN,
+    SPAWN_WINDOW,
+)
+from core.pool import pool_manager
+from core.registry import Registry
+from entities.enemy import Enemy
+
+
+class SpawnDirector:
+    """
+    Spawns enemies under a budget.
+
+    - at most `max_enemies` enemies alive at once
+    - at most `max_per_window` spawns in any `window` ms
+    - at most `batch_size` enemies created per tick
+
+    Enemies are placed on walkable cells reachable from the player (doors
+    count as passable), within `radius` cells of them but outside the
+    camera view.
+    """
+
+    def __init__(self, game, max_enemies=SPAWN_MAX_ENEMIES, window=SPAWN_WINDOW,
+                 max_per_window=SPAWN_MAX_PER_WINDOW, batch_size=SPAWN_BATCH_SIZE,
+                 radius=SPAWN_RADIUS):
+        self.game = game
+        self.max_enemies = max_enemies
+        self.window = window
+        self.max_per_window = max_per_window
+        self.batch_size = batch_size
+        self.radius = radius
+        self._recent = deque()  # (time, count) of the batches in the window
+        self._recent_count = 0
+
+    def live_enemies(self):
+        return sum(1 for obj in self.game.gridObjects if isinstance(obj, Enemy))
+
+    def allowance(self, now, live=None):
+        """How many enemies may be spawned this tick."""
+        while self._recent and self._recent[0][0] <= now - self.window:
+            self._recent_count -= self._recent.popleft()[1]
+        if live is None:
+            live = self.live_enemies()
+        return max(0, min(
+            self.batch_size,
+            self.max_enemies - live,
+            self.max_per_window - self._recent_count,
+        ))
+
+    def update(self, now, live=None):
+        """Spawns this tick's batch, returns the new enemies."""
+        count = self.allowance(now, live)
+        enemy_types = Registry.get_enemy_types()
+        if not count or not enemy_types:
+            return []
+
+        exclude = self._view_cells()
+        spawned = []
+        configs = {}
+        for _ in range(count):
+            cell = self._find_spawn_cell(exclude)
+            if cell is None:
+                break
+            enemy_type = choice(enemy_types)
+            if enemy_type not in configs:
+                configs[enemy_type] = Registry.get_enemy_config(enemy_type)
+            spawned.append(pool_manager.acquire(
+                Enemy,
+                self.game,
+                cell[0] * CELL_SIZE,
+                cell[1] * CELL_SIZE,
+                enemy_type=enemy_type,
+                config=configs[enemy_type],
+            ))
+
+        if spawned:
+            self.game.gridObjects.extend(spawned)
+            self._recent.append((now, len(spawned)))
+            self._recent_count += len(spawned)
+        return spawned
+
+    def _view_cells(self):
+        """Cell rectangle (min_x, min_y, max_x, max_y) covered by the camera."""
+        camera = getattr(self.game, "camera", None)
+        if camera is None:
+            return None
+        return (
+            int(camera.x // CELL_SIZE) - SPAWN_VIEW_MARGIN,
+            int(camera.y // CELL_SIZE) - SPAWN_VIEW_MARGIN,
+            int((camera.x + SCREEN_WIDTH_PIX) // CELL_SIZE) + SPAWN_VIEW_MARGIN,
+            int((camera.y + SCREEN_HEIGHT_PIX) // CELL_SIZE) + SPAWN_VIEW_MARGIN,
+        )
+
+    def _find_spawn_cell(self, exclude):
+        """Random walkable cell, reachable from the player, out of `exclude`."""
+        player = self.game.player
+        px = int((player.x + player.w * CELL_SIZE / 2) // CELL_SIZE)
+        py = int((player.y + player.h * CELL_SIZE / 2) // CELL_SIZE)
+
+        index = self.game.level_index
+        if index is not None:
+            return index.sample_near(px, py, self.radius, exclude=exclude)
+
+        # Chunked worlds have no global index, try a few cells around instead
+        for _ in range(8):
+            x = px + randint(-self.radius, self.radius)
+            y = py + randint(-self.radius, self.radius)
+            if exclude and exclude[0] <= x <= exclude[2] and exclude[1] <= y <= exclude[3]:
+                continue
+            cell = self.game.world.get_cell(x, y)
+            if cell and cell.walkable:
+                return x, y
+        return None
@@ -0,0 +1,86 @@
+from config.constants import OP_ADD, OP_MULTIPLY
+
+
+class StatBlock:
+    """
+    Base values and modifier stacks of an entity's stats.
+
+    A stat's final value is (base + sum of its add modifiers) * product of
+    (1 + value) of its multiply modifiers. Removing a modifier recomputes
+    the stat from the remaining stack, so reverts are exact. Final values
+    are cached and only recomputed on the first read after a change.
+    """
+
+    def __init__(self, **base):
+        self.base = dict(base)
+        self.modifiers = {}  # stat -> {token: (op, value)}
+        self.values = dict(base)  # Cached final values; dirty stats are missing
+        self.owners = {}  # token -> stat
+        self.next_token = 1
+
+    def __contains__(self, stat):
+        return stat in self.base
+
+    def get(self, stat):
+        try:
+            return self.values[stat]
+        except KeyError:
+            pass
+        value = self.base[stat]
+        stack = self.modifiers.get(stat)
+        if stack:
+            multiplier = 1.0
+            for op, amount in stack.values():
+                if op == OP_ADD:
+                    value += amount
+                elif op == OP_MULTIPLY:
+                    multiplier *= 1 + amount
+            value *= multiplier
+        self.values[stat] = value
+        return value
+
+    def set_base(self, stat, value):
+        self.base[stat] = value
+        self.values.pop(stat, None)
+
+    def add_modifier(self, stat, op, value, token=None):
+        """
+        Stacks a modifier on `stat`; returns a token to remove it with.
+        `token` restores a saved modifier under its original token.
+        """
+        if token is None:
+            token = self.next_token
+        self.next_token = max(self.next_token, token + 1)
+        self.modifiers.setdefault(stat, {})[token] = (op, value)
+        self.owners[token] = stat
+        self.values.pop(stat, None)
+        return token
+
+    def remove_modifier(self, token):
+        stat = self.owners.pop(token, None)
+        if stat is None:
+            return
+        del self.modifiers[stat][token]
+        self.values.pop(stat, None)
+
+
+class Stat:
+    """
+    Class attribute exposing a StatBlock stat (in `self.stats`) as a plain
+    attribute: reads return the cached final value, writes set the base.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        stats = obj.stats
+        try:
+            return stats.values[self.name]
+        except KeyError:
+            return stats.get(self.name)
+
+    def __set__(self, obj, value):
+        obj.stats.set_base(self.name, value)
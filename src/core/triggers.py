@@ -1,7 +1,7 @@
 from core.debug import debug
 
 def trigger_door(game, x, y):
-    debug.log(f"Door triggered at {x}, {y}!")
+    debug.log("Door triggered at %s, %s!", x, y)
     # Example: Toggle door state (requires more complex state management)
     # For now, just print.
 
@@ -19,4 +19,4 @@ def execute_trigger(trigger_name, game, x, y):
     if trigger_name in TRIGGERS:
         TRIGGERS[trigger_name](game, x, y)
     else:
-        debug.log(f"Trigger '{trigger_name}' not found.")
+        debug.log("Trigger '%s' not found.", trigger_name)
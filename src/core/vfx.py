@@ -1,4 +1,6 @@
 import pygame
+from core.pool import pool_manager
+from core.scheduler import scheduler
 
 class VFXManager:
     _instance = None
@@ -6,18 +8,32 @@ class VFXManager:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(VFXManager, cls).__new__(cls)
-            cls._instance.effects = []
+            # id(effect) -> (effect, expiry Timer), in spawn order
+            cls._instance.effects = {}
         return cls._instance
 
     def add_effect(self, effect):
-        self.effects.append(effect)
+        timer = scheduler.schedule(effect.start_time + effect.duration, self._expire, effect)
+        self.effects[id(effect)] = (effect, timer)
 
-    def update(self):
-        current_time = pygame.time.get_ticks()
-        self.effects = [e for e in self.effects if e.is_active(current_time)]
+    def spawn(self, effect_class, *args, **kwargs):
+        """Adds an effect taken from the effect pool."""
+        effect = pool_manager.acquire(effect_class, *args, **kwargs)
+        self.add_effect(effect)
+        return effect
+
+    def _expire(self, effect):
+        del self.effects[id(effect)]
+        pool_manager.release(effect)
+
+    def clear(self):
+        for effect, timer in self.effects.values():
+            timer.cancel()
+            pool_manager.release(effect)
+        self.effects.clear()
 
     def draw(self, surface):
-        for effect in self.effects:
+        for effect, _ in self.effects.values():
             effect.draw(surface)
 
 class VisualEffect:
@@ -33,6 +49,9 @@ class VisualEffect:
 
 class ExplosionEffect(VisualEffect):
     def __init__(self, x, y, radius, color=(255, 100, 0), duration=500):
+        self.reset(x, y, radius, color, duration)
+
+    def reset(self, x, y, radius, color=(255, 100, 0), duration=500):
         super().__init__(duration)
         self.x = x
         self.y = y
@@ -60,6 +79,9 @@ class ExplosionEffect(VisualEffect):
 
 class SlashEffect(VisualEffect):
     def __init__(self, x, y, target_x, target_y, width=5, color=(255, 255, 255), duration=200):
+        self.reset(x, y, target_x, target_y, width, color, duration)
+
+    def reset(self, x, y, target_x, target_y, width=5, color=(255, 255, 255), duration=200):
         super().__init__(duration)
         self.x = x
         self.y = y
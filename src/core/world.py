@@ -1,4 +1,5 @@
 from typing import List, Optional, Tuple
+import numpy as np
 from config.settings import GRID_HEIGHT, GRID_WIDTH
 
 
@@ -33,9 +34,17 @@ class World:
         # Grid stores tuples: (Cell, (offset_x, offset_y))
         # Default empty cell
         empty_cell = Cell("Empty", color=(0, 0, 0))
+        self.empty_cell = empty_cell
         self.grid: List[List[Tuple[Cell, Tuple[int, int]]]] = [
             [(empty_cell, (0, 0)) for _ in range(width)] for _ in range(height)
         ]
+        # Walkability bitmask (row-major, 1 = walkable), kept in sync by
+        # set_cell. walkable_mask is a (height, width) NumPy view of it.
+        self.walkable = bytearray([1]) * (width * height)
+        self.walkable_mask = np.frombuffer(self.walkable, dtype=np.uint8).reshape(
+            height, width
+        )
+        self.version = 0  # Bumped on every change (see WorldLoader.pack)
 
     def set_cell(self, x, y, cell):
         if 0 <= x < self.width and 0 <= y < self.height:
@@ -45,9 +54,12 @@ class World:
                 return
 
             # Place the object
+            walkable = 1 if cell.walkable else 0
             for h in range(cell.height):
                 for w in range(cell.width):
                     self.grid[y + h][x + w] = (cell, (w, h))
+                    self.walkable[(y + h) * self.width + x + w] = walkable
+            self.version += 1
         else:
             print(f"Coordinates ({x}, {y}) are out of bounds.")
 
@@ -62,6 +74,26 @@ class World:
             return self.grid[y][x]
         return None
 
+    def load_ids(self, cell_ids, offsets, palette):
+        """
+        Bulk restore of the grid from flat, row-major cell ids and offsets
+        (offset_x | offset_y << 16). Id -1 restores the empty cell.
+        """
+        for y in range(self.height):
+            start = y * self.width
+            row = self.grid[y]
+            for x in range(self.width):
+                cell_id = cell_ids[start + x]
+                packed = offsets[start + x]
+                cell = palette[cell_id] if cell_id >= 0 else self.empty_cell
+                row[x] = (cell, (packed & 0xFFFF, packed >> 16))
+                self.walkable[start + x] = 1 if cell.walkable else 0
+        self.version += 1
+
+    def update_focus(self, x, y):
+        # A fixed-size world is always fully loaded (see levels.chunked)
+        pass
+
     def display(self):
         for row in self.grid:
             print(" ".join(str(cell[0]) for cell in row))
@@ -20,3 +20,35 @@ class GridObject:
 
     def update(self, target_pos=None):
         pass
+
+
+class EntityHandle:
+    """
+    Reference to an entity that stops resolving once the entity dies or is
+    recycled by its pool (its `generation` changes on every reset).
+    Handles are equal when they were taken on the same entity in the same
+    generation, so sets of them survive pool reuse.
+    """
+
+    __slots__ = ("entity", "generation", "key")
+
+    def __init__(self, entity):
+        self.entity = entity
+        self.generation = getattr(entity, "generation", 0)
+        self.key = (id(entity), self.generation)
+
+    def __eq__(self, other):
+        return isinstance(other, EntityHandle) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def get(self):
+        """The entity if it is still alive, else None."""
+        entity = self.entity
+        if entity is None:
+            return None
+        if getattr(entity, "generation", 0) != self.generation or getattr(entity, "health", 1) <= 0:
+            self.entity = None
+            return None
+        return entity
@@ -1,54 +1,50 @@
 import pygame
 from entities.base import GridObject
-from core.debug import debug
-from config.settings import (
-    CELL_SIZE,
-    ENEMY_SPEED,
-    ENEMY_HEALTH,
-    COLOR_ENEMY,
-    ENEMY_DAMAGE,
-)
+from core.archetypes import EnemyArchetype
+from core.assets import image_cache
+from core.debug import debug, DEBUG
+from core.registry import Registry
+from config.settings import CELL_SIZE
 
+# Enemies of an unknown type
+DEFAULT_ENEMY = EnemyArchetype("default")
 
-class Enemy(GridObject):
-    def __init__(self, game, x, y, enemy_type="basic_enemy"):
-        from core.registry import Registry
 
-        config = Registry.get_enemy_config(enemy_type)
-        if not config:
+class Enemy(GridObject):
+    def __init__(self, game, x, y, enemy_type="basic_enemy", config=None):
+        self.reset(game, x, y, enemy_type, config)
+
+    def reset(self, game, x, y, enemy_type="basic_enemy", config=None):
+        # `config` (the type's EnemyArchetype) skips the registry lookup when
+        # spawning in batches
+        if config is None:
+            config = Registry.get_enemy_config(enemy_type)
+        if config is None:
             print(f"Warning: Enemy type '{enemy_type}' not found. Using defaults.")
-            # Fallback defaults
-            w, h = 1, 1
-            color = COLOR_ENEMY
-            speed = ENEMY_SPEED
-            health = ENEMY_HEALTH
-            damage = ENEMY_DAMAGE
-            texture = None
-        else:
-            w = config.get("width", 1)
-            h = config.get("height", 1)
-            color = tuple(config.get("color", COLOR_ENEMY))
-            speed = config.get("speed", ENEMY_SPEED)
-            health = config.get("health", ENEMY_HEALTH)
-            damage = config.get("damage", ENEMY_DAMAGE)
-            xp_value = config.get("xp_value", 10)
-            texture = config.get("texture")
-
-        super().__init__(x, y, w, h, color=color)
+            config = DEFAULT_ENEMY
+
+        # Prototype copy: size, color, speed, health, damage and XP value
+        self.__dict__.update(config.state)
+        self.x = x
+        self.y = y
         self.game = game
-        self.speed = speed
-        self.health = health
-        self.max_health = health
-        self.damage = damage
-        self.xp_value = xp_value
-        self.texture = texture
+        self.texture = Registry.get_enemy_texture(config.name) if config.texture_file else None
         self.enemy_type = enemy_type
+        # Bumped on every reset so handles to a recycled enemy go stale
+        self.generation = getattr(self, "generation", 0) + 1
+        self.last_update = None  # UpdateLOD tick of the last update
+
+    def apply_archetype(self, config):
+        """Applies a reloaded EnemyArchetype in place, keeping the health ratio."""
+        ratio = self.health / self.max_health if self.max_health else 1
+        self.__dict__.update(config.state)
+        self.health = self.max_health * ratio
+        self.texture = Registry.get_enemy_texture(config.name) if config.texture_file else None
 
     def draw(self, screen):
         if self.texture:
-            # Scale texture if needed (or assume it's pre-scaled/correct size)
-            # For now, let's scale it to the entity size
-            scaled_texture = pygame.transform.scale(
+            # Scaled to the entity size, once per texture and size
+            scaled_texture = image_cache.scaled(
                 self.texture, (int(self.w * CELL_SIZE), int(self.h * CELL_SIZE))
             )
             screen.blit(scaled_texture, (self.x, self.y))
@@ -71,28 +67,35 @@ class Enemy(GridObject):
                 screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height)
             )
 
-    def take_damage(self, amount):
+    def take_damage(self, amount, show_text=True):
+        # show_text=False when the attack shows one text for all its targets
+        # (see CombatManager.apply_damage)
         self.health -= amount
 
         # Spawn floating damage text
-        self.game.damage_texts.spawn(self.x, self.y - 10, amount)
+        if show_text:
+            self.game.damage_texts.spawn(self.x, self.y - 10, amount)
 
         if self.health <= 0:
             self.die()
 
     def die(self):
-        debug.log("Enemy died!")
+        debug.log("Enemy died!", level=DEBUG, category="combat")
 
-    def update(self, target_pos):
+    def update(self, target_pos, dt=1):
+        """Moves towards target_pos; `dt` is the number of ticks covered."""
         super().update(target_pos)
 
         target = pygame.math.Vector2(target_pos)
         cur = pygame.math.Vector2(self.x, self.y)
 
-        if cur.distance_to(target) > 0:
+        distance = cur.distance_to(target)
+        if distance > 0:
             direction = (target - cur).normalize()
-            self.x += direction.x * self.speed
-            self.y += direction.y * self.speed
+            # Long steps (far LOD tiers) must not overshoot the target
+            step = min(self.speed * dt, distance) if dt > 1 else self.speed
+            self.x += direction.x * step
+            self.y += direction.y * step
 
     # Serialization
     def __getstate__(self):
@@ -111,8 +114,4 @@ class Enemy(GridObject):
     def post_load(self):
         # Restore texture
         if hasattr(self, "enemy_type"):
-            from core.registry import Registry
-
-            config = Registry.get_enemy_config(self.enemy_type)
-            if config:
-                self.texture = config.get("texture")
+            self.texture = Registry.get_enemy_texture(self.enemy_type)
@@ -0,0 +1,19 @@
+import math
+from entities.base import GridObject
+
+
+class Pickup(GridObject):
+    """Object collected by walking over it (items, XP orbs), pulled by the player's magnet."""
+
+    magnet_speed = 12  # Pixels per tick, high for a snappy pickup
+
+    def move_towards(self, target_x, target_y):
+        # Direct movement behavior (no inertia)
+        dx = target_x - self.x
+        dy = target_y - self.y
+        dist = math.hypot(dx, dy)
+
+        if dist > 0:
+            step = min(dist, self.magnet_speed) / dist
+            self.x += dx * step
+            self.y += dy * step
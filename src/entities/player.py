@@ -3,10 +3,6 @@
 from typing import Tuple
 import pygame
 
-# Initialize Pygame
-pygame.init()
-
-# Set up the display
 from config.settings import (
     CELL_SIZE,
     GRID_HEIGHT,
@@ -23,10 +19,21 @@ from combat.factory import WeaponFactory
 from entities.base import GridObject
 from core.physics import check_collision
 from core.physics import check_collision
-from core.debug import debug
+from core.assets import image_cache
+from core.debug import debug, DEBUG
+from core.scheduler import scheduler
+from core.stats import Stat, StatBlock
 from config.constants import OP_ADD, OP_MULTIPLY, STAT_HEAL, ITEM_TYPE_WEAPON, TAG_FIRE, TAG_RANGED
 
 class Player(GridObject):
+    # Stats Multipliers, with the modifier stacks of the collected items
+    speed_mult = Stat()
+    damage_mult = Stat()
+    defense_mult = Stat()
+    cooldown_mult = Stat()
+    luck_mult = Stat()
+    pickup_range = Stat()
+
     def __init__(self, game, x, y, size, speed):
         super().__init__(x, y, size, size, color=COLOR_PLAYER)
         self.game = game
@@ -38,19 +45,22 @@ class Player(GridObject):
         self.last_hit_time = 0
         
         # Stats Multipliers
-        self.speed_mult = 1.0
-        self.damage_mult = 1.0
-        self.defense_mult = 1.0
-        self.cooldown_mult = 1.0
-        self.luck_mult = 1.0
+        self.stats = StatBlock(
+            speed_mult=1.0,
+            damage_mult=1.0,
+            defense_mult=1.0,
+            cooldown_mult=1.0,
+            luck_mult=1.0,
+            pickup_range=100,  # Range in pixels for magnet effect
+        )
 
         # XP and Leveling
         self.xp = 0
         self.level = 1
         self.xp_to_next_level = 100
-        self.pickup_range = 100 # Range in pixels for magnet effect
         
         self.active_effects = []
+        self.timers = []  # Pending scheduler timers, cancelled with the player
         
         # Combat setup
         self.combat = CombatManager(self)
@@ -61,82 +71,92 @@ class Player(GridObject):
         except Exception as e:
             print(f"Failed to equip default weapons: {e}")
 
-    def _modify_stat(self, effect, op, value, revert=False):
+    def _modify_stat(self, effect, op, value):
+        """Applies an item effect; returns its modifier token, None if it can't be reverted."""
         if effect == STAT_HEAL:
-             if revert: return # Heal is instant, doesn't revert
-             
+             # Heal is instant, doesn't revert
              if op == OP_ADD:
                  self.health = min(self.max_health, self.health + value)
              elif op == OP_MULTIPLY:
                  self.health = min(self.max_health, self.health * (1 + value))
              
-             debug.log(f"Healed (Op: {op}, Val: {value}). Health: {self.health}/{self.max_health}")
-             return
+             debug.log("Healed (Op: %s, Val: %s). Health: %s/%s", op, value, self.health, self.max_health,
+                       category="items")
+             return None
 
         attr_name = f"{effect}_mult"
-        if hasattr(self, attr_name):
-            current_val = getattr(self, attr_name)
-            
-            if revert:
-                if op == OP_ADD:
-                    setattr(self, attr_name, current_val - value)
-                elif op == OP_MULTIPLY:
-                    setattr(self, attr_name, current_val / (1 + value))
-                debug.log(f"  -> {effect} reverted. Multiplier: {getattr(self, attr_name)}")
-            else:
-                if op == OP_ADD:
-                    setattr(self, attr_name, current_val + value)
-                elif op == OP_MULTIPLY:
-                    setattr(self, attr_name, current_val * (1 + value))
-                debug.log(f"{effect.capitalize()} modified (Op: {op}, Val: {value}). New multiplier: {getattr(self, attr_name)}")
-        else:
-             debug.log(f"Unknown stat upgrade: {effect}")
+        if attr_name not in self.stats:
+            attr_name = effect  # Stats that aren't multipliers, e.g. pickup_range
+        if attr_name in self.stats:
+            token = self.stats.add_modifier(attr_name, op, value)
+            debug.log("%s modified (Op: %s, Val: %s). New multiplier: %s", effect.capitalize(), op, value,
+                      self.stats.get(attr_name), category="items")
+            return token
+        debug.log("Unknown stat upgrade: %s", effect, category="items")
+        return None
 
     def collect_item(self, item):
-        debug.log(f"Collected item: {item.name}")
+        debug.log("Collected item: %s", item.name, category="items")
         
         if item.type == ITEM_TYPE_WEAPON:
             self.combat.apply_upgrade(item)
             return
 
+        # Apply effect immediately (revert logic will handle removal)
+        modifiers = []
+        for effect, data in item.effects.items():
+            op = data["op"]
+            val = data["value"]
+            token = self._modify_stat(effect, op, val)
+            if token is not None:
+                modifiers.append(token)
+
         # Check if temporary effect
         if item.duration > 0:
-            self.active_effects.append({
+            effect_data = {
                 "item": item,
                 "start_time": pygame.time.get_ticks(),
-                "duration": item.duration
-            })
-            debug.log(f"Applied temporary effect: {item.name} for {item.duration}ms")
+                "duration": item.duration,
+                "modifiers": modifiers,  # Removed from the stat stacks on expiry
+            }
+            self.active_effects.append(effect_data)
+            self._schedule_expiry(effect_data)
+            debug.log("Applied temporary effect: %s for %sms", item.name, item.duration, category="items")
 
-        # Apply effect immediately (revert logic will handle removal)
-        for effect, data in item.effects.items():
-            op = data["op"]
-            val = data["value"]
-            self._modify_stat(effect, op, val, revert=False)
+    def _schedule(self, deadline, callback, *args):
+        self.timers = [timer for timer in self.timers if timer.pending]
+        self.timers.append(scheduler.schedule(deadline, callback, *args))
 
-    def update(self, target_pos=None):
-        current_time = pygame.time.get_ticks()
-        
-        # Manage active effects
-        for effect_data in self.active_effects[:]: # Iterate copy to safe remove
-            if current_time - effect_data["start_time"] > effect_data["duration"]:
-                item = effect_data["item"]
-                debug.log(f"Effect expired: {item.name}")
-                
-                # Revert effects
-                for effect, data in item.effects.items():
-                    op = data["op"]
-                    val = data["value"]
-                    self._modify_stat(effect, op, val, revert=True)
-                
-                self.active_effects.remove(effect_data)
-        
-        # Handle invulnerability
-        if self.invulnerable:
-            if current_time - self.last_hit_time > self.invulnerability_duration:
-                self.invulnerable = False
+    def _schedule_expiry(self, effect_data):
+        self._schedule(
+            effect_data["start_time"] + effect_data["duration"], self._expire_effect, effect_data
+        )
 
-        self.combat.update(target_pos, current_time)
+    def _expire_effect(self, effect_data):
+        item = effect_data["item"]
+        debug.log("Effect expired: %s", item.name, category="items")
+
+        # Revert effects: dropping the modifiers restores the exact values
+        for token in effect_data["modifiers"]:
+            stat = self.stats.owners.get(token)
+            self.stats.remove_modifier(token)
+            if stat:
+                debug.log("  -> %s reverted. Multiplier: %s", stat, self.stats.get(stat), category="items")
+
+        self.active_effects.remove(effect_data)
+
+    def _end_invulnerability(self):
+        self.invulnerable = False
+
+    def cancel_timers(self):
+        """Drops the pending expiries, when this player is replaced."""
+        for timer in self.timers:
+            timer.cancel()
+        self.timers = []
+
+    def update(self, target_pos=None):
+        # Effect expiry and invulnerability are handled by the scheduler
+        self.combat.update(target_pos, pygame.time.get_ticks())
 
     def take_damage(self, amount):
         if self.invulnerable:
@@ -146,18 +166,21 @@ class Player(GridObject):
         self.game.damage_texts.spawn(self.x, self.y - 10, amount)
         self.invulnerable = True
         self.last_hit_time = pygame.time.get_ticks()
-        debug.log(f"Player took {amount} damage! Health: {self.health}/{self.max_health}")
+        self._schedule(self.last_hit_time + self.invulnerability_duration, self._end_invulnerability)
+        debug.log("Player took %s damage! Health: %s/%s", amount, self.health, self.max_health,
+                  category="combat")
         
         if self.health <= 0:
             self.die()
 
     def die(self):
-        debug.log("Player died!")
+        debug.log("Player died!", category="combat")
         # TODO: Handle player death (restart game, show game over screen, etc.)
 
     def gain_xp(self, amount):
         self.xp += amount
-        debug.log(f"Gained {amount} XP. Total: {self.xp}/{self.xp_to_next_level}")
+        debug.log("Gained %s XP. Total: %s/%s", amount, self.xp, self.xp_to_next_level,
+                  level=DEBUG, category="xp")
         
         if self.xp >= self.xp_to_next_level:
             self.level_up()
@@ -166,7 +189,7 @@ class Player(GridObject):
         self.xp -= self.xp_to_next_level
         self.level += 1
         self.xp_to_next_level = int(self.xp_to_next_level * 1.5)
-        debug.log(f"Level Up! New Level: {self.level}")
+        debug.log("Level Up! New Level: %s", self.level, category="xp")
         # TODO: Trigger level up UI or choices
 
     def move(self, keys, world):  # movement using arrow keys or WASD
@@ -232,7 +255,7 @@ class Player(GridObject):
             
             if weapon.image:
                  # Scale weapon image if needed (arbitrary size choice or based on tiles)
-                 scaled_weapon = pygame.transform.scale(weapon.image, (10, 20)) 
+                 scaled_weapon = image_cache.scaled(weapon.image, (10, 20))
                  screen.blit(scaled_weapon, (wx, wy))
             else:
                  pygame.draw.rect(screen, weapon_color, (wx, wy, 4, 10))
@@ -242,14 +265,22 @@ class Player(GridObject):
         state = self.__dict__.copy()
         # Exclude non-serializable game reference
         del state['game']
+        del state['timers']  # Rescheduled by post_load
         return state
 
     def __setstate__(self, state):
         self.__dict__.update(state)
         # 'game' will be re-assigned by SaveManager
         self.game = None 
+        self.timers = []
 
     def post_load(self):
+        # Timers aren't saved: schedule the pending expiries again
+        for effect_data in self.active_effects:
+            self._schedule_expiry(effect_data)
+        if self.invulnerable:
+            self._schedule(self.last_hit_time + self.invulnerability_duration, self._end_invulnerability)
+
         # Reload weapon images
         for weapon in self.combat.weapons:
             if hasattr(weapon, 'reload_texture'):
@@ -1,12 +1,39 @@
 import pygame
 import math
 from config.settings import CELL_SIZE
-from entities.base import GridObject
+from entities.pickup import Pickup
 from core.debug import debug
 
 
-class XPOrb(GridObject):
+def merge_orbs(orbs, bucket_size, max_orbs):
+    """
+    Merges orbs sharing a `bucket_size` pixel bucket into one orb carrying
+    their summed value. Buckets are doubled until at most `max_orbs` remain.
+    Returns the orbs merged away.
+    """
+    merged = []
+    while True:
+        survivors = {}
+        for orb in orbs:
+            key = (int(orb.x // bucket_size), int(orb.y // bucket_size))
+            survivor = survivors.get(key)
+            if survivor is None:
+                survivors[key] = orb
+            else:
+                survivor.value += orb.value
+                merged.append(orb)
+
+        orbs = list(survivors.values())
+        if len(orbs) <= max_orbs:
+            return merged
+        bucket_size *= 2
+
+
+class XPOrb(Pickup):
     def __init__(self, x, y, value):
+        self.reset(x, y, value)
+
+    def reset(self, x, y, value):
         # Initialize with a small size (e.g., 4x4 pixels or half tile)
         super().__init__(x, y, 0.5, 0.5, color=(0, 255, 255))
         self.value = value
@@ -21,24 +48,6 @@ class XPOrb(GridObject):
     def update(self, target_pos=None):
         pass
 
-    def move_towards(self, target_x, target_y):
-        # Direct movement behavior (no inertia)
-        target = pygame.math.Vector2(target_x, target_y)
-        pos = pygame.math.Vector2(self.x, self.y)
-
-        direction = target - pos
-        dist = direction.length()
-
-        if dist > 0:
-            direction = direction.normalize()
-
-            speed = 12  # Higher constant speed for snappy pickup
-
-            move_dist = min(dist, speed)
-
-            self.x += direction.x * move_dist
-            self.y += direction.y * move_dist
-
     def draw(self, surface):
         # Glittering effect
         current_time = pygame.time.get_ticks()
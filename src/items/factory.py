@@ -1,72 +1,52 @@
 import json
 import random
 import os
-import copy
-from config.settings import BASE_DIR, RARITY_WEIGHTS, RARITY_SCALING
+from config.settings import BASE_DIR, RARITY_WEIGHTS
 from config.constants import RARITY_COMMON, RARITY_RARE, RARITY_LEGENDARY
+from core.archetypes import load_archetypes
 from items.item import Item
+from core.pool import pool_manager
 
 class ItemFactory:
     _items = []
     _sorted_items = {}
+    _by_name = {}  # (name, rarity) -> ItemArchetype
     
     @staticmethod
     def load_items():
         items_path = os.path.join(BASE_DIR, "config", "items.json")
         try:
-            with open(items_path, "r") as f:
-                raw_items_data = json.load(f)
-            
-            # Sort items into buckets for faster access
-            ItemFactory._items = []
-            ItemFactory._sorted_items = {
-                RARITY_COMMON: [],
-                RARITY_RARE: [],
-                RARITY_LEGENDARY: []
-            }
-            
-            for raw_item in raw_items_data:
-                allowed_rarities = raw_item.get("allowed_rarities", [])
-                
-                # Legacy support or if no allowed_rarities defined
-                if not allowed_rarities and "rarity" in raw_item:
-                    allowed_rarities = [raw_item["rarity"]]
-                
-                for rarity in allowed_rarities:
-                    # Create base copy
-                    item_data = copy.deepcopy(raw_item)
-                    item_data["rarity"] = rarity
-                    
-                    # Scale effects
-                    multiplier = RARITY_SCALING.get(rarity, 1.0)
-                    for effect_name, effect_data in item_data["effects"].items():
-                         # Scaling only makes sense for numeric values (add/multiply)
-                         # We don't scale "op" obviously.
-                         if "value" in effect_data:
-                             original_val = effect_data["value"]
-                             # If it's a multiply op (e.g. 0.1 for 10%), we scale it directly?
-                             # Or for "add" 10 -> 15.
-                             if isinstance(original_val, (int, float)):
-                                  # Round to 2 decimal places to avoid floating point mess
-                                  item_data["effects"][effect_name]["value"] = round(original_val * multiplier, 2)
-                    
-                    # Add to main list and bucket
-                    ItemFactory._items.append(item_data)
-                    
-                    if rarity in ItemFactory._sorted_items:
-                        ItemFactory._sorted_items[rarity].append(item_data)
-                    else:
-                        pass # Should not happen if buckets are init correctly
-            
-            print(f"Loaded {len(ItemFactory._items)} items.")
+            # One archetype per item and allowed rarity, effects already scaled
+            archetypes = load_archetypes("items", items_path, base_dir=BASE_DIR)
         except FileNotFoundError:
             print(f"Error: items.json not found at {items_path}")
-            ItemFactory._items = []
-            ItemFactory._sorted_items = {}
+            return
         except json.JSONDecodeError:
+            # Keeps the items loaded before, if any (e.g. a file being edited)
             print(f"Error: items.json is not valid JSON.")
-            ItemFactory._items = []
-            ItemFactory._sorted_items = {}
+            return
+
+        # Sort items into buckets for faster access
+        ItemFactory._items = []
+        ItemFactory._sorted_items = {
+            RARITY_COMMON: [],
+            RARITY_RARE: [],
+            RARITY_LEGENDARY: []
+        }
+        ItemFactory._by_name = {}
+        for archetype in archetypes:
+            ItemFactory._items.append(archetype)
+            ItemFactory._sorted_items.setdefault(archetype.rarity, []).append(archetype)
+            ItemFactory._by_name[(archetype.name, archetype.rarity)] = archetype
+
+        print(f"Loaded {len(ItemFactory._items)} items.")
+
+    @staticmethod
+    def get_item_data(name, rarity):
+        """ItemArchetype of the item `name` at `rarity`, None if the config has no such item."""
+        if not ItemFactory._items:
+            ItemFactory.load_items()
+        return ItemFactory._by_name.get((name, rarity))
 
     @staticmethod
     def create_random_item(x, y, luck=1.0):
@@ -95,6 +75,6 @@ class ItemFactory:
             possible_items = ItemFactory._items
 
         # Select a random item
-        item_data = random.choice(possible_items)
+        archetype = random.choice(possible_items)
         
-        return Item(x, y, item_data)
+        return pool_manager.acquire(Item, x, y, archetype)
@@ -1,66 +1,59 @@
-from entities.base import GridObject
-from config.settings import CELL_SIZE, COLOR_RARITY, BASE_DIR
+from entities.pickup import Pickup
+from config.settings import CELL_SIZE, BASE_DIR
+from core.assets import image_cache
 from core.debug import debug
 import pygame
 import os
 
 
-class Item(GridObject):
-    def __init__(self, x, y, item_data):
-        self.rarity_color = COLOR_RARITY.get(item_data["rarity"], (255, 255, 255))
-        self.item_color = item_data.get(
-            "color", self.rarity_color
-        )  # Default to rarity color if not specified
-        super().__init__(x, y, 1.0, 1.0, color=self.item_color)
+# Loaded item textures by path, shared by every item using them
+_textures = {}
 
-        self.name = item_data["name"]
-        self.type = item_data["type"]
-        self.rarity = item_data["rarity"]
-        self.effects = item_data["effects"]
-        self.description = item_data["description"]
-        self.target_weapon = item_data.get("target_weapon", None)
-        self.target_tag = item_data.get("target_tag", None)
-        self.duration = item_data.get("duration", 0)
+
+def load_texture(texture_path):
+    if texture_path in _textures:
+        return _textures[texture_path]
+
+    image = None
+    full_path = os.path.join(BASE_DIR, texture_path)
+    if os.path.exists(full_path):
+        try:
+            image = image_cache.load(full_path)
+            debug.log("Loaded texture: %s", texture_path, category="items")
+        except Exception as e:
+            debug.log("Failed to load texture %s: %s", texture_path, e, category="items")
+    else:
+        debug.log("Texture not found: %s", full_path, category="items")
+    _textures[texture_path] = image
+    return image
+
+
+def clear_textures():
+    """Forgets the loaded item textures, so they are loaded again (hot reload)."""
+    _textures.clear()
+
+
+class Item(Pickup):
+    def __init__(self, x, y, archetype):
+        self.reset(x, y, archetype)
+
+    def reset(self, x, y, archetype):
+        # Prototype copy of the ItemArchetype (see core/archetypes.py): name,
+        # type, rarity, colors, effects, target, duration and texture path.
+        # The effects are read-only and shared by every item of the archetype
+        self.__dict__.update(archetype.state)
+        self.x = x
+        self.y = y
 
         # Texture handling
-        self.image = None
-        texture_path = item_data.get("texture_path", None)
-        if texture_path:
-            full_path = os.path.join(BASE_DIR, texture_path)
-            if os.path.exists(full_path):
-                try:
-                    loaded_image = pygame.image.load(full_path).convert_alpha()
-                    self.image = loaded_image
-                    debug.log(f"Loaded texture for {self.name}: {texture_path}")
-                except Exception as e:
-                    debug.log(f"Failed to load texture {texture_path}: {e}")
-            else:
-                debug.log(f"Texture not found: {full_path}")
-
-    def move_towards(self, target_x, target_y):
-        # Direct movement behavior (no inertia)
-        target = pygame.math.Vector2(target_x, target_y)
-        pos = pygame.math.Vector2(self.x, self.y)
-
-        direction = target - pos
-        dist = direction.length()
-
-        if dist > 0:
-            direction = direction.normalize()
-
-            speed = 12  # Higher constant speed for snappy pickup
-
-            move_dist = min(dist, speed)
-
-            self.x += direction.x * move_dist
-            self.y += direction.y * move_dist
+        self.image = load_texture(self.texture_path) if self.texture_path else None
 
     def draw(self, screen):
         rect = (self.x, self.y, self.w * CELL_SIZE, self.h * CELL_SIZE)
 
         if self.image:
-            # Scale image to fit item size
-            scaled_image = pygame.transform.scale(
+            # Scale image to fit item size (cached per image and size)
+            scaled_image = image_cache.scaled(
                 self.image, (int(self.w * CELL_SIZE), int(self.h * CELL_SIZE))
             )
             screen.blit(scaled_image, (self.x, self.y))
@@ -71,3 +64,15 @@ class Item(GridObject):
             # Draw rarity border
             border_width = 2
             pygame.draw.rect(screen, self.rarity_color, rect, border_width)
+
+    # Serialization
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["image"] = None  # Surfaces can't be pickled
+        state["effects"] = {effect: dict(data) for effect, data in self.effects.items()}  # Nor mapping proxies
+        return state
+
+    def post_load(self):
+        # Restore texture
+        texture_path = getattr(self, "texture_path", None)
+        self.image = load_texture(texture_path) if texture_path else None
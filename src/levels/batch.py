@@ -0,0 +1,190 @@
+"""
+Headless batch level generation, for tuning the generator.
+
+Generates many seeds in parallel and reports per-seed statistics
+(generation time, walkable ratio, rooms, junctions, connectivity).
+Run from src/:
+
+    python -m levels.batch --seeds 1000 --output stats.csv
+    python -m levels.batch --first-seed 500 --seeds 200 --room-amount 50 --format json
+    python -m levels.batch --generator cave --seeds 500
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Keep stdout clean for the JSON/CSV output
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+if __package__ in (None, ""):
+    # Allow running as a plain script too
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import (
+    GRID_HEIGHT,
+    GRID_WIDTH,
+    LEVEL_GENERATOR,
+    ROOM_AMOUNT,
+    ROOM_EXTRA_SIZE,
+)
+from core.registry import Registry
+from levels.cache import ENVIRONMENTS_PATH
+from levels.generators import GENERATORS
+from levels.index import label_components
+from levels.loader import WorldLoader
+
+FIELDS = [
+    "seed",
+    "generation_ms",
+    "walkable_ratio",
+    "room_count",
+    "junction_count",
+    "region_count",
+    "connected",
+    "walkable_components",
+]
+
+
+def count_components(passable, width, height):
+    """Number of 4-connected components of True cells in a flat row-major mask."""
+    return len(label_components(passable, width, height)[1])
+
+
+def level_stats(loader, generation_ms):
+    world = loader.world
+    walkable = []
+    passable = []  # Walkable or junction door
+    for row in world.grid:
+        for cell, _ in row:
+            walkable.append(cell.walkable)
+            passable.append(cell.walkable or cell.trigger == "door")
+
+    return {
+        "seed": loader.seed,
+        "generation_ms": round(generation_ms, 3),
+        "walkable_ratio": round(sum(walkable) / len(walkable), 4),
+        "room_count": len(loader.rooms),
+        "junction_count": len(loader.junctions),
+        "region_count": loader.current_region + 1,
+        # Every open cell reachable when doors are passable
+        "connected": count_components(passable, world.width, world.height) == 1,
+        "walkable_components": count_components(walkable, world.width, world.height),
+    }
+
+
+def _init_worker():
+    with contextlib.redirect_stdout(sys.stderr):
+        Registry.load_cells(ENVIRONMENTS_PATH, load_textures=False)
+
+
+def _run_seed(args):
+    seed, width, height, room_amount, room_extra_size, generator = args
+    loader = WorldLoader(
+        seed,
+        width=width,
+        height=height,
+        room_amount=room_amount,
+        room_extra_size=room_extra_size,
+        generator=generator,
+    )
+    start = time.perf_counter()
+    loader.generate()
+    generation_ms = (time.perf_counter() - start) * 1000
+    return level_stats(loader, generation_ms)
+
+
+def run_batch(seeds, width=GRID_WIDTH, height=GRID_HEIGHT, room_amount=ROOM_AMOUNT,
+              room_extra_size=ROOM_EXTRA_SIZE, generator=LEVEL_GENERATOR, workers=None):
+    """Generates every seed across `workers` processes, returns stats in seed order."""
+    jobs = [
+        (seed, width, height, room_amount, room_extra_size, generator) for seed in seeds
+    ]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        chunksize = max(1, len(jobs) // ((workers or os.cpu_count() or 1) * 8))
+        return list(executor.map(_run_seed, jobs, chunksize=chunksize))
+
+
+def summarize(results):
+    if not results:
+        return {"levels": 0}
+    times = sorted(r["generation_ms"] for r in results)
+    return {
+        "levels": len(results),
+        "generation_ms_mean": round(statistics.fmean(times), 3),
+        "generation_ms_p50": times[len(times) // 2],
+        "generation_ms_p95": times[min(len(times) - 1, int(len(times) * 0.95))],
+        "walkable_ratio_mean": round(statistics.fmean(r["walkable_ratio"] for r in results), 4),
+        "room_count_mean": round(statistics.fmean(r["room_count"] for r in results), 2),
+        "junction_count_mean": round(statistics.fmean(r["junction_count"] for r in results), 2),
+        "connected_ratio": round(sum(r["connected"] for r in results) / len(results), 4),
+    }
+
+
+def write_results(results, summary, output, fmt):
+    if fmt == "csv":
+        writer = csv.DictWriter(output, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+    else:
+        json.dump({"summary": summary, "levels": results}, output, indent=2)
+        output.write("\n")
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate levels headlessly and report statistics.")
+    parser.add_argument("--seeds", type=positive_int, default=100, help="Number of seeds to generate")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--width", type=int, default=GRID_WIDTH)
+    parser.add_argument("--height", type=int, default=GRID_HEIGHT)
+    parser.add_argument("--room-amount", type=int, default=ROOM_AMOUNT)
+    parser.add_argument("--room-extra-size", type=int, default=ROOM_EXTRA_SIZE)
+    parser.add_argument("--generator", choices=sorted(GENERATORS), default=LEVEL_GENERATOR)
+    parser.add_argument("--format", choices=("json", "csv"), default=None,
+                        help="Output format (default: from --output extension, else json)")
+    parser.add_argument("--output", default=None, help="Output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "csv" if args.output and args.output.endswith(".csv") else "json"
+
+    start = time.perf_counter()
+    results = run_batch(
+        range(args.first_seed, args.first_seed + args.seeds),
+        width=args.width,
+        height=args.height,
+        room_amount=args.room_amount,
+        room_extra_size=args.room_extra_size,
+        generator=args.generator,
+        workers=args.workers,
+    )
+    elapsed = time.perf_counter() - start
+    summary = summarize(results)
+
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write_results(results, summary, f, fmt)
+    else:
+        write_results(results, summary, sys.stdout, fmt)
+
+    print(f"Generated {len(results)} levels in {elapsed:.2f}s", file=sys.stderr)
+    for name, value in summary.items():
+        print(f"  {name}: {value}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
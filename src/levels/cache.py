@@ -0,0 +1,135 @@
+import hashlib
+import os
+import numpy as np
+from config.settings import (
+    BASE_DIR,
+    LEVEL_CACHE_DIR,
+    LEVEL_CACHE_ENABLED,
+    LEVEL_CACHE_MAX_BYTES,
+)
+from levels.loader import PACK_VERSION
+
+ENVIRONMENTS_PATH = os.path.join(BASE_DIR, "config", "environments.json")
+CACHE_EXTENSION = ".npy"
+
+
+class LevelCache:
+    """
+    Content-addressed on-disk cache of generated levels.
+
+    A level is stored as the int32 array produced by WorldLoader.pack, in a
+    file named after a hash of the generation parameters and environments.json.
+    Hits are memory-mapped instead of regenerated. The directory is kept under
+    `max_bytes` by evicting the least recently used files.
+    """
+
+    def __init__(self, directory=LEVEL_CACHE_DIR, max_bytes=LEVEL_CACHE_MAX_BYTES,
+                 enabled=LEVEL_CACHE_ENABLED):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._environments_digest = None  # (mtime_ns, size, sha256)
+
+    def _environments_hash(self):
+        # Re-hashed whenever the file changes (hot reload edits it in play)
+        try:
+            stat = os.stat(ENVIRONMENTS_PATH)
+        except OSError:
+            self._environments_digest = None
+            return ""
+        cached = self._environments_digest
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        try:
+            with open(ENVIRONMENTS_PATH, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return ""
+        self._environments_digest = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def key(self, loader):
+        h = hashlib.sha256()
+        h.update(f"v{PACK_VERSION}".encode())
+        h.update(repr(loader.generation_params()).encode())
+        h.update(self._environments_hash().encode())
+        return h.hexdigest()[:32]
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + CACHE_EXTENSION)
+
+    def load(self, key):
+        """Returns the memory-mapped packed level, or None on a miss."""
+        path = self._path(key)
+        try:
+            data = np.load(path, mmap_mode="r")
+            os.utime(path)  # Mark as recently used for eviction
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def store(self, key, packed):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.save(f, packed)
+            os.replace(tmp_path, path)  # Atomic, concurrent writers are safe
+        except OSError as e:
+            print(f"Failed to write level cache {path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self.evict()
+
+    def evict(self):
+        """Deletes least recently used entries until the cache fits max_bytes."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+
+        entries = []
+        total = 0
+        for name in names:
+            if not name.endswith(CACHE_EXTENSION):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass  # Still mapped somewhere (Windows) or already gone
+
+    def load_or_generate(self, loader):
+        """Fills `loader` from the cache, generating (and storing) on a miss."""
+        if not self.enabled:
+            return loader.generate()
+
+        key = self.key(loader)
+        data = self.load(key)
+        if data is not None:
+            try:
+                return loader.unpack(data)
+            except ValueError as e:
+                print(f"Ignoring invalid cached level {key}: {e}")
+
+        world = loader.generate()
+        self.store(key, loader.pack())
+        return world
+
+
+# Global accessor
+level_cache = LevelCache()
@@ -0,0 +1,193 @@
+import os
+import shutil
+from random import Random
+from typing import Dict, Optional, Tuple
+import numpy as np
+from config.settings import (
+    CELL_SIZE,
+    CHUNK_EVICT_RADIUS,
+    CHUNK_LOAD_RADIUS,
+    CHUNK_ROOM_AMOUNT,
+    CHUNK_SIZE,
+    CHUNK_SWAP_DIR,
+    GRID_HEIGHT,
+    GRID_WIDTH,
+)
+from core.world import Cell
+from levels.cache import level_cache
+from levels.loader import WorldLoader
+
+
+class ChunkedWorld:
+    """
+    World made of CHUNK_SIZE x CHUNK_SIZE chunks generated on demand.
+
+    Each chunk is a small maze + rooms level (WorldLoader) with openings on
+    its borders that line up with the openings of its neighbours. Chunks
+    around the focus (the player) are kept loaded; far chunks are swapped out
+    to disk and reloaded when the player comes back.
+
+    Exposes the same cell API as World, in global cell coordinates.
+    """
+
+    def __init__(self, seed, width=GRID_WIDTH, height=GRID_HEIGHT,
+                 chunk_size=CHUNK_SIZE, load_radius=CHUNK_LOAD_RADIUS,
+                 evict_radius=CHUNK_EVICT_RADIUS, swap_dir=CHUNK_SWAP_DIR):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.chunks_x = -(-width // chunk_size)
+        self.chunks_y = -(-height // chunk_size)
+        self.load_radius = load_radius
+        self.evict_radius = max(evict_radius, load_radius)
+
+        self.chunks: Dict[Tuple[int, int], WorldLoader] = {}
+        # Bumped on every change so renderers know when to re-bake a chunk
+        self.versions: Dict[Tuple[int, int], int] = {}
+        self._dirty = set()  # Chunks modified since they were generated
+        self.empty_cell = Cell("Empty", color=(0, 0, 0))
+        # Stands for the cells of chunks that aren't loaded: they block, and
+        # reading them never loads a chunk from disk mid-frame
+        self.unloaded_cell = Cell("Unloaded", walkable=False, color=(0, 0, 0))
+        # No global walkability bitmask: collisions use the cell lookups
+        self.walkable = None
+        self.walkable_mask = None
+
+        # Swap space belongs to this world only
+        self.swap_dir = os.path.join(swap_dir, str(seed))
+        shutil.rmtree(self.swap_dir, ignore_errors=True)
+
+    # -------------------------------------------------------------------------
+    # CHUNK MANAGEMENT
+    # -------------------------------------------------------------------------
+    def chunk_of(self, x, y):
+        return x // self.chunk_size, y // self.chunk_size
+
+    def _edge_opening(self, cx, cy, axis):
+        """Odd offset of the opening between chunk (cx, cy) and its east/south neighbour."""
+        rng = Random(f"{self.seed}:{cx}:{cy}:{axis}")
+        return rng.randint(0, (self.chunk_size - 3) // 2) * 2 + 1
+
+    def _exits(self, cx, cy):
+        last = self.chunk_size - 1
+        exits = []
+        if cx + 1 < self.chunks_x:
+            exits.append((last, self._edge_opening(cx, cy, "x")))
+        if cx > 0:
+            exits.append((0, self._edge_opening(cx - 1, cy, "x")))
+        if cy + 1 < self.chunks_y:
+            exits.append((self._edge_opening(cx, cy, "y"), last))
+        if cy > 0:
+            exits.append((self._edge_opening(cx, cy - 1, "y"), 0))
+        return exits
+
+    def _swap_path(self, key):
+        return os.path.join(self.swap_dir, f"{key[0]}_{key[1]}.npy")
+
+    def get_chunk(self, cx, cy) -> WorldLoader:
+        """Returns the chunk, loading it from swap or generating it if needed."""
+        key = (cx, cy)
+        loader = self.chunks.get(key)
+        if loader is not None:
+            return loader
+
+        loader = WorldLoader(
+            Random(f"{self.seed}:{cx}:{cy}").randint(0, 2**31 - 1),
+            width=self.chunk_size,
+            height=self.chunk_size,
+            room_amount=CHUNK_ROOM_AMOUNT,
+            exits=self._exits(cx, cy),
+        )
+        if key in self._dirty:
+            loader.unpack(np.load(self._swap_path(key)))
+        else:
+            level_cache.load_or_generate(loader)
+
+        self.chunks[key] = loader
+        self.versions[key] = self.versions.get(key, 0) + 1
+        return loader
+
+    def evict_chunk(self, key):
+        loader = self.chunks.pop(key)
+        if key in self._dirty:
+            # Modified chunks can't be regenerated, keep them on disk
+            os.makedirs(self.swap_dir, exist_ok=True)
+            np.save(self._swap_path(key), loader.pack())
+
+    def dirty_chunks(self):
+        """(key, packed chunk) of the chunks modified since they were generated."""
+        for key in sorted(self._dirty):
+            loader = self.chunks.get(key)
+            yield key, loader.pack() if loader is not None else np.load(self._swap_path(key))
+
+    def restore_chunk(self, key, packed):
+        """Replaces a chunk by a packed one (from a save), loaded when needed."""
+        os.makedirs(self.swap_dir, exist_ok=True)
+        np.save(self._swap_path(key), packed)
+        self._dirty.add(key)
+        if self.chunks.pop(key, None) is not None:
+            self.get_chunk(*key)
+
+    def update_focus(self, x, y):
+        """Loads chunks around the pixel position (x, y) and evicts far ones."""
+        fcx, fcy = self.chunk_of(int(x // CELL_SIZE), int(y // CELL_SIZE))
+
+        for cy in range(fcy - self.load_radius, fcy + self.load_radius + 1):
+            for cx in range(fcx - self.load_radius, fcx + self.load_radius + 1):
+                if 0 <= cx < self.chunks_x and 0 <= cy < self.chunks_y:
+                    self.get_chunk(cx, cy)
+
+        for key in list(self.chunks):
+            if max(abs(key[0] - fcx), abs(key[1] - fcy)) > self.evict_radius:
+                self.evict_chunk(key)
+
+    def chunk_rooms(self, cx, cy):
+        """Rooms of a chunk, in global cell coordinates."""
+        ox, oy = cx * self.chunk_size, cy * self.chunk_size
+        return [
+            (x + ox, y + oy, w, h) for x, y, w, h in self.get_chunk(cx, cy).rooms
+        ]
+
+    # -------------------------------------------------------------------------
+    # WORLD API (global cell coordinates)
+    # -------------------------------------------------------------------------
+    def set_cell(self, x, y, cell):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            if x + cell.width > self.width or y + cell.height > self.height:
+                print(f"Cannot place {cell.name} at ({x}, {y}): Out of bounds.")
+                return
+
+            for h in range(cell.height):
+                for w in range(cell.width):
+                    key = self.chunk_of(x + w, y + h)
+                    chunk = self.get_chunk(*key)
+                    lx = x + w - key[0] * self.chunk_size
+                    ly = y + h - key[1] * self.chunk_size
+                    chunk.world.grid[ly][lx] = (cell, (w, h))
+                    chunk.world.walkable[ly * chunk.world.width + lx] = (
+                        1 if cell.walkable else 0
+                    )
+                    chunk.world.version += 1
+                    self._dirty.add(key)
+                    self.versions[key] += 1
+        else:
+            print(f"Coordinates ({x}, {y}) are out of bounds.")
+
+    def get_cell(self, x, y) -> Optional[Cell]:
+        cell_data = self.get_cell_full(x, y)
+        return cell_data[0] if cell_data else None
+
+    def get_cell_full(self, x, y):
+        """
+        Returns (Cell, (offset_x, offset_y)). Cells of chunks that aren't
+        loaded (see update_focus) read as `unloaded_cell`, a wall.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            size = self.chunk_size
+            cx, cy = x // size, y // size
+            chunk = self.chunks.get((cx, cy))
+            if chunk is None:
+                return self.unloaded_cell, (0, 0)
+            return chunk.world.grid[y - cy * size][x - cx * size]
+        return None
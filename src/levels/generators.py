@@ -0,0 +1,408 @@
+from itertools import permutations
+import numpy as np
+from config.settings import CAVE_FILL_RATIO, CAVE_ITERATIONS, CAVE_MIN_REGION, CAVE_ROOM_SIZE
+from core.debug import debug
+from core.registry import Registry
+from levels.index import label_components
+
+# move 1 step; carve 2 steps
+DIRECTIONS = [(0, -1), (0, 1), (1, 0), (-1, 0)]
+DIRECTION_ORDERS = list(permutations(DIRECTIONS))
+
+
+def quadrangle_intersect(quadA, quadB):
+    ax, ay, aw, ah = quadA
+    bx, by, bw, bh = quadB
+
+    if ax + aw <= bx or bx + bw <= ax:
+        return False
+    if ay + ah <= by or by + bh <= ay:
+        return False
+
+    return True
+
+
+class LevelGenerator:
+    """
+    Base class of the level generation strategies.
+
+    A strategy fills its WorldLoader's world, rooms, regions (and
+    current_region/junctions) and must keep the loader's border exits open.
+    Bump `version` whenever the output for a given seed changes, so cached
+    levels are not reused.
+    """
+
+    name = None
+    version = 1
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.world = loader.world
+        self.rng = loader.rng
+        self.grass = loader.grass
+        self.wall = loader.wall
+        self.door = loader.door
+
+    def generate(self):
+        raise NotImplementedError
+
+
+class MazeGenerator(LevelGenerator):
+    """Rooms, growing-tree maze in between, connected by junctions."""
+
+    name = "maze"
+    version = 2
+
+    # -------------------------------------------------------------------------
+    # MAIN GENERATOR
+    # -------------------------------------------------------------------------
+    def generate(self):
+        # Fill background with wall
+        for y in range(self.world.height):
+            for x in range(self.world.width):
+                self.world.set_cell(x, y, self.wall)
+
+        self.__generate_rooms()
+
+        # Fill unused space with mazes
+        for x in range(1, self.world.width, 2):
+            for y in range(1, self.world.height, 2):
+                if self.world.get_cell(x, y) != self.wall:
+                    continue
+                self.__growMaze(x, y)
+
+        # Open the border exits; they count as exits for dead-end removal
+        for x, y in self.loader.exits:
+            self.world.set_cell(x, y, self.grass)
+
+        # Connect regions & remove dead ends
+        self.__connect_regions()
+        self.__remove_dead_ends()
+
+    # -------------------------------------------------------------------------
+    # GROWING TREE / MAZE
+    # -------------------------------------------------------------------------
+    def __growMaze(self, x, y):
+        """
+        Implements the growing tree algorithm for maze generation.
+        Starts at (x, y) and carves a maze using a depth-first approach.
+        """
+
+        self.loader._start_region()
+        self.loader._carve(x, y)
+
+        cells = [(x, y)]
+
+        while cells:
+            cx, cy = cells[-1]
+
+            # Shuffle directions: one random draw among all orders
+            shuffled = DIRECTION_ORDERS[self.rng.randrange(len(DIRECTION_ORDERS))]
+
+            carved = False
+            for dx, dy in shuffled:
+                if self._can_carve(cx, cy, dx, dy):
+                    # midpoint between cx,cy and destination
+                    mx = cx + dx
+                    my = cy + dy
+                    nx = cx + dx * 2
+                    ny = cy + dy * 2
+
+                    self.loader._carve(mx, my)
+                    self.loader._carve(nx, ny)
+
+                    cells.append((nx, ny))
+                    carved = True
+                    break
+
+            if not carved:
+                cells.pop()
+
+    def _can_carve(self, x, y, dx, dy):
+        # Destination 2 tiles away
+        nx = x + dx * 2
+        ny = y + dy * 2
+
+        if not (0 <= nx < self.world.width and 0 <= ny < self.world.height):
+            return False
+
+        return self.world.get_cell(nx, ny) == self.wall
+
+    # -------------------------------------------------------------------------
+    # ROOM GENERATOR
+    # -------------------------------------------------------------------------
+    def __generate_rooms(self):
+        self.loader.rooms = []
+
+        for _ in range(self.loader.room_amount):
+
+            size = self.rng.randint(1, 3 + self.loader.room_extra_size) * 2 + 1
+            width = size
+            height = size
+
+            rectangularity = self.rng.randint(0, 1 + size // 2) * 2
+            if self.rng.randint(0, 1) == 0:
+                width += rectangularity
+            else:
+                height += rectangularity
+
+            # Keep the room off the last row/column (matters for odd sizes)
+            max_x = (self.world.width - width - 1) // 2
+            max_y = (self.world.height - height - 1) // 2
+            if max_x < 0 or max_y < 0:
+                continue  # Room too big for this world
+
+            x = self.rng.randint(0, max_x) * 2 + 1
+            y = self.rng.randint(0, max_y) * 2 + 1
+            current = (x, y, width, height)
+
+            intersects = False
+            for other in self.loader.rooms:
+                if quadrangle_intersect(current, other):
+                    intersects = True
+                    break
+            if intersects:
+                continue
+
+            self.loader.rooms.append(current)
+
+            self.loader._start_region()
+            for dx in range(width):
+                for dy in range(height):
+                    self.loader._carve(x + dx, y + dy)
+
+    # -------------------------------------------------------------------------
+    # CONNECT REGIONS
+    # -------------------------------------------------------------------------
+    def __connect_regions(self):
+        connector_regions = {}
+
+        # Evaluate all possible connectors
+        for y in range(1, self.world.height - 1):
+            for x in range(1, self.world.width - 1):
+
+                if self.world.get_cell(x, y) != self.wall:
+                    continue
+
+                touching = set()
+                for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+                    rid = self.loader.regions[y + dy, x + dx]
+                    if rid >= 0:
+                        touching.add(int(rid))
+
+                if len(touching) >= 2:
+                    connector_regions[(x, y)] = touching
+
+        connectors = list(connector_regions.keys())
+
+        merged = {i: i for i in range(self.loader.current_region + 1)}
+        open_regions = set(merged.values())
+
+        while len(open_regions) > 1:
+            cx, cy = connectors[self.rng.randint(0, len(connectors) - 1)]
+
+            self.loader._add_junction(cx, cy)
+
+            regions_here = {merged[r] for r in connector_regions[(cx, cy)]}
+            dest = next(iter(regions_here))
+            sources = list(regions_here - {dest})
+
+            for i in merged:
+                if merged[i] in sources:
+                    merged[i] = dest
+
+            open_regions -= set(sources)
+
+            # Filter connectors
+            new_list = []
+            for (x, y) in connectors:
+
+                # Prevent connectors right next to each other
+                if abs(x - cx) + abs(y - cy) < 2:
+                    continue
+
+                rset = {merged[r] for r in connector_regions[(x, y)]}
+
+                if len(rset) == 1:
+                    # Optional loop creation
+                    if self.rng.randint(1, 20) == 1:
+                        self.loader._add_junction(x, y)
+                    continue
+
+                new_list.append((x, y))
+
+            connectors = new_list
+
+    # -------------------------------------------------------------------------
+    # DEAD-END REMOVAL
+    # -------------------------------------------------------------------------
+    def __remove_dead_ends(self):
+        done = False
+
+        while not done:
+            done = True
+            for y in range(1, self.world.height - 1):
+                for x in range(1, self.world.width - 1):
+
+                    if self.world.get_cell(x, y) == self.wall:
+                        continue
+
+                    exits = 0
+                    for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+                        if self.world.get_cell(x + dx, y + dy) != self.wall:
+                            exits += 1
+
+                    if exits == 1:  # dead end
+                        done = False
+                        self.world.set_cell(x, y, self.wall)
+
+
+class CaveGenerator(LevelGenerator):
+    """
+    Cellular-automata caves, vectorized with NumPy.
+
+    Random noise is smoothed into caves, tiny pockets are filled in and the
+    remaining caves are joined by straight tunnels. Open squares of
+    CAVE_ROOM_SIZE are reported as rooms.
+    """
+
+    name = "cave"
+    version = 1
+
+    def generate(self):
+        loader = self.loader
+        height, width = self.world.height, self.world.width
+        rng = np.random.default_rng(loader.seed)
+
+        wall = rng.random((height, width)) < CAVE_FILL_RATIO
+        self._close_border(wall)
+        for _ in range(CAVE_ITERATIONS):
+            wall = self._smooth(wall)
+
+        # Regions are the caves before they get connected
+        labels, sizes = label_components((~wall).astype(np.uint8).tobytes(), width, height)
+        sizes = np.array(sizes, dtype=np.int64)
+        kept = np.flatnonzero(sizes >= CAVE_MIN_REGION)
+        remap = np.full(len(sizes) + 1, -1, dtype=np.int32)
+        remap[kept] = np.arange(len(kept), dtype=np.int32)
+        labels = remap[labels]  # Label -1 maps to the last (-1) entry
+        wall = labels < 0
+
+        loader.regions = labels
+        loader.current_region = len(kept) - 1
+
+        self._connect_caves(wall, labels, sizes[kept])
+        for x, y in loader.exits:
+            wall[y, x] = False
+            self._tunnel(wall, (x, y), self._nearest_open(wall, x, y, exclude=(x, y)))
+
+        loader.rooms = self._find_rooms(wall, rng)
+
+        palette = Registry.get_cell_palette()
+        cell_ids = np.where(
+            wall, Registry.get_cell_id(self.wall.name), Registry.get_cell_id(self.grass.name)
+        )
+        self.world.load_ids(cell_ids.ravel().tolist(), [0] * (width * height), palette)
+
+    @staticmethod
+    def _close_border(wall):
+        wall[0, :] = wall[-1, :] = True
+        wall[:, 0] = wall[:, -1] = True
+
+    def _smooth(self, wall):
+        """One automaton step: a cell is a wall with 5+ wall neighbours (4+ if it was one)."""
+        height, width = wall.shape
+        padded = np.pad(wall, 1, constant_values=True).astype(np.uint8)
+        neighbours = sum(
+            padded[1 + dy:height + 1 + dy, 1 + dx:width + 1 + dx]
+            for dy in (-1, 0, 1)
+            for dx in (-1, 0, 1)
+            if dx or dy
+        )
+        wall = (neighbours >= 5) | (wall & (neighbours >= 4))
+        self._close_border(wall)
+        return wall
+
+    def _nearest_open(self, wall, x, y, exclude=None, mask=None):
+        """Closest open cell to (x, y), optionally restricted to `mask`."""
+        open_cells = ~wall if mask is None else mask
+        if exclude is not None:
+            open_cells = open_cells.copy()
+            open_cells[exclude[1], exclude[0]] = False
+        ys, xs = np.nonzero(open_cells)
+        if not len(xs):
+            return (self.world.width // 2, self.world.height // 2)
+        i = np.argmin((xs - x) ** 2 + (ys - y) ** 2)
+        return int(xs[i]), int(ys[i])
+
+    def _tunnel(self, wall, start, end):
+        """Carves an L-shaped corridor, recording where it leaves `start`."""
+        (x0, y0), (x1, y1) = start, end
+        horizontal_first = self.rng.randint(0, 1) == 0
+        corner = (x1, y0) if horizontal_first else (x0, y1)
+        for (ax, ay), (bx, by) in ((start, corner), (corner, end)):
+            wall[min(ay, by):max(ay, by) + 1, min(ax, bx):max(ax, bx) + 1] = False
+        self.loader.junctions.append((x0, y0))
+
+    def _connect_caves(self, wall, labels, sizes):
+        if not len(sizes):
+            # Nothing survived the smoothing: open a single cave in the middle
+            wall[self.world.height // 2, self.world.width // 2] = False
+            return
+
+        connected = labels == int(np.argmax(sizes))
+        for region in np.argsort(-sizes)[1:]:
+            region_mask = labels == region
+            ys, xs = np.nonzero(region_mask)
+            cx, cy = xs.mean(), ys.mean()
+            i = np.argmin((xs - cx) ** 2 + (ys - cy) ** 2)
+            start = (int(xs[i]), int(ys[i]))
+            before = wall.copy()
+            self._tunnel(wall, start, self._nearest_open(wall, *start, mask=connected))
+            connected |= region_mask | (before & ~wall)
+
+    def _find_rooms(self, wall, rng):
+        # Fall back to smaller squares in cramped caves, there must be a room
+        for size in (CAVE_ROOM_SIZE, 3, 1):
+            rooms = self._find_squares(wall, rng, size)
+            if rooms:
+                return rooms
+        return []
+
+    def _find_squares(self, wall, rng, size):
+        height, width = wall.shape
+        if height < size or width < size:
+            return []
+
+        # Summed-area table: open cells in every size x size window
+        table = np.zeros((height + 1, width + 1), dtype=np.int32)
+        table[1:, 1:] = (~wall).cumsum(axis=0).cumsum(axis=1)
+        windows = (
+            table[size:, size:] - table[:-size, size:]
+            - table[size:, :-size] + table[:-size, :-size]
+        )
+        ys, xs = np.nonzero(windows == size * size)
+
+        rooms = []
+        for i in rng.permutation(len(xs)):
+            room = (int(xs[i]), int(ys[i]), size, size)
+            if any(quadrangle_intersect(room, other) for other in rooms):
+                continue
+            rooms.append(room)
+            if len(rooms) >= self.loader.room_amount:
+                break
+        return rooms
+
+
+GENERATORS = {
+    MazeGenerator.name: MazeGenerator,
+    CaveGenerator.name: CaveGenerator,
+}
+
+
+def get_generator(name):
+    """Returns the generator class registered under `name`."""
+    if name in GENERATORS:
+        return GENERATORS[name]
+    debug.log("Warning: Level generator '%s' not found. Using maze.", name)
+    return MazeGenerator
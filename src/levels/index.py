@@ -0,0 +1,164 @@
+import random
+from collections import deque
+import numpy as np
+from config.settings import SPAWN_INDEX_BUCKET_SIZE
+
+
+def label_components(walkable, width, height):
+    """
+    4-connected components (BFS) of a flat, row-major walkability buffer.
+    Returns a (height, width) label array (-1 where blocked) and the size
+    of every component.
+    """
+    size = width * height
+    labels = [-1] * size
+    sizes = []
+    for start in range(size):
+        if not walkable[start] or labels[start] >= 0:
+            continue
+        label = len(sizes)
+        labels[start] = label
+        count = 0
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            count += 1
+            x = i % width
+            for n in (
+                i - 1 if x > 0 else -1,
+                i + 1 if x < width - 1 else -1,
+                i - width,
+                i + width if i + width < size else -1,
+            ):
+                if n >= 0 and walkable[n] and labels[n] < 0:
+                    labels[n] = label
+                    queue.append(n)
+        sizes.append(count)
+    return np.array(labels, dtype=np.int32).reshape(height, width), sizes
+
+
+class LevelIndex:
+    """
+    Precomputed walkability/connectivity data of a generated level.
+
+    - `cells`: (N, 2) array of every walkable cell (x, y), grouped by
+      connected component and spatial bucket
+    - `labels`: (height, width) connected component of each cell, -1 if blocked.
+      Doors are passable, so the rooms they join share a component
+    - `room_cells`: per room, the (M, 2) array of its walkable cells
+
+    Used to place things on reachable, walkable cells without rejection
+    sampling over the whole map.
+    """
+
+    def __init__(self, world, rooms, bucket_size=SPAWN_INDEX_BUCKET_SIZE):
+        self.width = world.width
+        self.height = world.height
+        self.bucket_size = bucket_size
+        self.buckets_x = -(-self.width // bucket_size)
+        self.buckets_y = -(-self.height // bucket_size)
+
+        mask = world.walkable_mask
+        passable = bytearray(world.walkable)  # Walkable or door
+        for y, row in enumerate(world.grid):
+            for x, (cell, _) in enumerate(row):
+                if cell.trigger == "door":
+                    passable[y * self.width + x] = 1
+        self.labels, self.component_sizes = label_components(
+            passable, self.width, self.height
+        )
+
+        flat = np.flatnonzero(mask.reshape(-1))
+        xs = flat % self.width
+        ys = flat // self.width
+        keys = self._bucket_key(self.labels.reshape(-1)[flat], xs // bucket_size, ys // bucket_size)
+        order = np.argsort(keys, kind="stable")
+        self.cells = np.column_stack((xs[order], ys[order])).astype(np.int32)
+
+        # bucket key -> (start, end) slice of self.cells
+        keys = keys[order]
+        unique, starts = np.unique(keys, return_index=True)
+        ends = np.append(starts[1:], len(keys))
+        self._buckets = dict(zip(unique.tolist(), zip(starts.tolist(), ends.tolist())))
+
+        self.room_cells = []
+        for x, y, w, h in rooms:
+            room_ys, room_xs = np.nonzero(mask[y:y + h, x:x + w])
+            self.room_cells.append(
+                np.column_stack((room_xs + x, room_ys + y)).astype(np.int32)
+            )
+
+    def _bucket_key(self, component, bx, by):
+        return (component * self.buckets_y + by) * self.buckets_x + bx
+
+    @property
+    def component_count(self):
+        return len(self.component_sizes)
+
+    def component_at(self, x, y):
+        """Component of cell (x, y), -1 if blocked or out of the level."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return int(self.labels[y, x])
+        return -1
+
+    def random_room_cell(self, room_index, rng=random):
+        cells = self.room_cells[room_index]
+        if not len(cells):
+            return None
+        x, y = cells[rng.randrange(len(cells))]
+        return int(x), int(y)
+
+    def sample_near(self, x, y, radius, rng=random, min_radius=0, exclude=None,
+                    component=None, attempts=16):
+        """
+        Random walkable cell within `radius` cells of (x, y), reachable from it
+        (through doors included).
+
+        Picks a spatial bucket around (x, y) weighted by its walkable cell
+        count, then a cell in it: the cost depends on the radius, not on the
+        level size. If a few such draws all miss, the candidate buckets are
+        filtered exactly instead. `exclude` is an optional (min_x, min_y, max_x, max_y) cell
+        rectangle to stay out of (e.g. the camera view). Returns None if
+        nothing suitable is found.
+        """
+        if component is None:
+            component = self.component_at(x, y)
+        if component < 0:
+            return None
+
+        size = self.bucket_size
+        candidates = []
+        for by in range(max(0, (y - radius) // size), min(self.buckets_y - 1, (y + radius) // size) + 1):
+            for bx in range(max(0, (x - radius) // size), min(self.buckets_x - 1, (x + radius) // size) + 1):
+                bucket = self._buckets.get(self._bucket_key(component, bx, by))
+                if bucket:
+                    candidates.append(bucket)
+        weights = [end - start for start, end in candidates]
+        if not candidates:
+            return None
+
+        max_sq, min_sq = radius * radius, min_radius * min_radius
+        for _ in range(attempts):
+            start, end = rng.choices(candidates, weights=weights)[0]
+            cx, cy = self.cells[rng.randrange(start, end)]
+            dx, dy = cx - x, cy - y
+            if not min_sq <= dx * dx + dy * dy <= max_sq:
+                continue
+            if exclude and exclude[0] <= cx <= exclude[2] and exclude[1] <= cy <= exclude[3]:
+                continue
+            return int(cx), int(cy)
+
+        # Unlucky draws: filter every candidate cell at once
+        cells = np.concatenate([self.cells[start:end] for start, end in candidates])
+        dist_sq = ((cells - (x, y)) ** 2).sum(axis=1)
+        valid = (dist_sq >= min_sq) & (dist_sq <= max_sq)
+        if exclude:
+            valid &= ~(
+                (cells[:, 0] >= exclude[0]) & (cells[:, 0] <= exclude[2])
+                & (cells[:, 1] >= exclude[1]) & (cells[:, 1] <= exclude[3])
+            )
+        valid = np.flatnonzero(valid)
+        if not len(valid):
+            return None
+        cx, cy = cells[valid[rng.randrange(len(valid))]]
+        return int(cx), int(cy)
@@ -1,25 +1,48 @@
-from config.settings import GRID_HEIGHT, GRID_WIDTH, ROOM_AMOUNT, ROOM_EXTRA_SIZE
+from config.settings import (
+    GRID_HEIGHT,
+    GRID_WIDTH,
+    LEVEL_GENERATOR,
+    ROOM_AMOUNT,
+    ROOM_EXTRA_SIZE,
+)
 from core.registry import Registry
-from random import randint
+from random import Random, randint
 from core.world import World
-from typing import List, Tuple
+from levels.generators import get_generator
+from levels.index import LevelIndex
+from typing import List, Optional, Tuple
+import numpy as np
 
-
-def quadrangle_intersect(quadA, quadB):
-    ax, ay, aw, ah = quadA
-    bx, by, bw, bh = quadB
-
-    if ax + aw <= bx or bx + bw <= ax:
-        return False
-    if ay + ah <= by or by + bh <= ay:
-        return False
-
-    return True
+# Layout version of the array produced by WorldLoader.pack
+PACK_VERSION = 2
+PACK_HEADER_SIZES = {1: 6, 2: 7}  # Version 1 had no junctions
 
 
 class WorldLoader:
-    def __init__(self):
-        self.world = World()
+    def __init__(self, seed=None, width=GRID_WIDTH, height=GRID_HEIGHT,
+                 room_amount=ROOM_AMOUNT, room_extra_size=ROOM_EXTRA_SIZE, exits=(),
+                 generator=LEVEL_GENERATOR):
+        # Every random choice goes through our own generator so that a seed
+        # fully determines the level (required by the level cache)
+        if seed is None:
+            seed = randint(0, 2**31 - 1)
+        self.seed = seed
+        self.rng = Random(seed)
+
+        self.room_amount = room_amount
+        self.room_extra_size = room_extra_size
+        # Border cells kept open so that neighbouring levels (chunks) connect
+        self.exits = tuple(exits)
+        # Generation strategy, see levels.generators
+        self.generator = get_generator(generator)
+
+        self.width = width
+        self.height = height
+        # Allocated by generate(), or replaced by unpack(): a level that
+        # comes from a cache or a save never pays for an empty grid
+        self.world: Optional[World] = None
+        self.rooms: List[Tuple[int, int, int, int]] = []
+        self.junctions: List[Tuple[int, int]] = []
 
         # Get cells from Registry
         self.grass = Registry.get_cell("Grass")
@@ -27,10 +50,31 @@ class WorldLoader:
         self.water = Registry.get_cell("Water")
         self.door = Registry.get_cell("Door")
 
-        # Region tracking (Option A)
-        self.regions = [[None for _ in range(self.world.width)]
-                        for _ in range(self.world.height)]
+        # Region tracking (Option A), -1 means "no region"
+        self.regions: Optional[np.ndarray] = None
         self.current_region = -1
+        self._index: Optional[LevelIndex] = None
+        self._packed = None  # (world, world version, array) of the last pack()
+
+    @property
+    def index(self) -> LevelIndex:
+        """Walkable cells / connectivity index of the level, built on first use."""
+        if self._index is None:
+            self._index = LevelIndex(self.world, self.rooms)
+        return self._index
+
+    def generation_params(self):
+        """Everything (besides environments.json) that shapes the output."""
+        return (
+            self.generator.name,
+            self.generator.version,
+            self.seed,
+            self.width,
+            self.height,
+            self.room_amount,
+            self.room_extra_size,
+            self.exits,
+        )
 
     # -------------------------------------------------------------------------
     # REGION HELPERS
@@ -42,193 +86,33 @@ class WorldLoader:
         if cell_type is None:
             cell_type = self.grass
         self.world.set_cell(x, y, cell_type)
-        self.regions[y][x] = self.current_region
+        self.regions[y, x] = self.current_region
 
     # -------------------------------------------------------------------------
     # MAIN GENERATOR
     # -------------------------------------------------------------------------
-    def generate(self):
-
-        # Fill background with wall
-        for y in range(self.world.height):
-            for x in range(self.world.width):
-                self.world.set_cell(x, y, self.wall)
-
-        self.__generate_rooms()
-
-        # Fill unused space with mazes
-        for x in range(1, GRID_WIDTH, 2):
-            for y in range(1, GRID_HEIGHT, 2):
-                if self.world.get_cell(x, y) != self.wall:
-                    continue
-                self.__growMaze(x, y)
-
-        # Connect regions & remove dead ends
-        self.__connect_regions()
-        self.__remove_dead_ends()
+    @classmethod
+    def from_packed(cls, data):
+        """A loader restored from an array made by pack(), see unpack()."""
+        loader = cls(int(data[1]))
+        loader.unpack(data)
+        return loader
 
+    def generate(self):
+        self._index = None
+        self.world = World(self.width, self.height)
+        self.regions = np.full((self.height, self.width), -1, dtype=np.int32)
+        self.generator(self).generate()
         return self.world
 
-    # -------------------------------------------------------------------------
-    # GROWING TREE / MAZE
-    # -------------------------------------------------------------------------
-    def __growMaze(self, x, y):
-        """
-        Implements the growing tree algorithm for maze generation.
-        Starts at (x, y) and carves a maze using a depth-first approach.
-        """
-
-        self._start_region()
-        self._carve(x, y)
-
-        cells = [(x, y)]
-
-        directions = [(0, -1), (0, 1), (1, 0), (-1, 0)]  # move 1 step; carve 2 steps
-
-        while cells:
-            cx, cy = cells[-1]
-
-            # Shuffle directions
-            shuffled = list(directions)
-            for i in range(len(shuffled)):
-                j = randint(0, len(shuffled) - 1)
-                shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
-
-            carved = False
-            for dx, dy in shuffled:
-                if self._can_carve(cx, cy, dx, dy):
-                    # midpoint between cx,cy and destination
-                    mx = cx + dx
-                    my = cy + dy
-                    nx = cx + dx * 2
-                    ny = cy + dy * 2
-
-                    self._carve(mx, my)
-                    self._carve(nx, ny)
-
-                    cells.append((nx, ny))
-                    carved = True
-                    break
-
-            if not carved:
-                cells.pop()
-
-    def _can_carve(self, x, y, dx, dy):
-        # Destination 2 tiles away
-        nx = x + dx * 2
-        ny = y + dy * 2
-
-        if not (0 <= nx < self.world.width and 0 <= ny < self.world.height):
-            return False
-
-        return self.world.get_cell(nx, ny) == self.wall
-
-    # -------------------------------------------------------------------------
-    # ROOM GENERATOR
-    # -------------------------------------------------------------------------
-    def __generate_rooms(self):
-        self.rooms: List[Tuple[int, int, int, int]] = []
-
-        for _ in range(ROOM_AMOUNT):
-
-            size = randint(1, 3 + ROOM_EXTRA_SIZE) * 2 + 1
-            width = size
-            height = size
-
-            rectangularity = randint(0, 1 + size // 2) * 2
-            if randint(0, 1) == 0:
-                width += rectangularity
-            else:
-                height += rectangularity
-
-            x = randint(0, (GRID_WIDTH - width) // 2) * 2 + 1
-            y = randint(0, (GRID_HEIGHT - height) // 2) * 2 + 1
-            current = (x, y, width, height)
-
-            intersects = False
-            for other in self.rooms:
-                if quadrangle_intersect(current, other):
-                    intersects = True
-                    break
-            if intersects:
-                continue
-
-            self.rooms.append(current)
-
-            self._start_region()
-            for dx in range(width):
-                for dy in range(height):
-                    self._carve(x + dx, y + dy)
-
-    # -------------------------------------------------------------------------
-    # CONNECT REGIONS
-    # -------------------------------------------------------------------------
-    def __connect_regions(self):
-        connector_regions = {}
-
-        # Evaluate all possible connectors
-        for y in range(1, self.world.height - 1):
-            for x in range(1, self.world.width - 1):
-
-                if self.world.get_cell(x, y) != self.wall:
-                    continue
-
-                touching = set()
-                for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                    rid = self.regions[y + dy][x + dx]
-                    if rid is not None:
-                        touching.add(rid)
-
-                if len(touching) >= 2:
-                    connector_regions[(x, y)] = touching
-
-        connectors = list(connector_regions.keys())
-
-        merged = {i: i for i in range(self.current_region + 1)}
-        open_regions = set(merged.values())
-
-        while len(open_regions) > 1:
-            cx, cy = connectors[randint(0, len(connectors) - 1)]
-
-            self._add_junction(cx, cy)
-
-            regions_here = {merged[r] for r in connector_regions[(cx, cy)]}
-            dest = next(iter(regions_here))
-            sources = list(regions_here - {dest})
-
-            for i in merged:
-                if merged[i] in sources:
-                    merged[i] = dest
-
-            open_regions -= set(sources)
-
-            # Filter connectors
-            new_list = []
-            for (x, y) in connectors:
-
-                # Prevent connectors right next to each other
-                if abs(x - cx) + abs(y - cy) < 2:
-                    continue
-
-                rset = {merged[r] for r in connector_regions[(x, y)]}
-
-                if len(rset) == 1:
-                    # Optional loop creation
-                    if randint(1, 20) == 1:
-                        self._add_junction(x, y)
-                    continue
-
-                new_list.append((x, y))
-
-            connectors = new_list
-
     # -------------------------------------------------------------------------
     # JUNCTION (DOOR OR OPENING)
     # -------------------------------------------------------------------------
     def _add_junction(self, x, y):
+        self.junctions.append((x, y))
         # 1/4 chance of being open path or open door
-        if randint(1, 4) == 1:
-            if randint(1, 3) == 1:
+        if self.rng.randint(1, 4) == 1:
+            if self.rng.randint(1, 3) == 1:
                 self.world.set_cell(x, y, self.door)
             else:
                 self.world.set_cell(x, y, self.grass)
@@ -237,25 +121,81 @@ class WorldLoader:
             self.world.set_cell(x, y, self.door)
 
     # -------------------------------------------------------------------------
-    # DEAD-END REMOVAL
+    # PACKING (compact level representation)
     # -------------------------------------------------------------------------
-    def __remove_dead_ends(self):
-        done = False
-
-        while not done:
-            done = True
-            for y in range(1, self.world.height - 1):
-                for x in range(1, self.world.width - 1):
-
-                    if self.world.get_cell(x, y) == self.wall:
-                        continue
-
-                    exits = 0
-                    for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                        if self.world.get_cell(x + dx, y + dy) != self.wall:
-                            exits += 1
-
-                    if exits == 1:  # dead end
-                        done = False
-                        self.world.set_cell(x, y, self.wall)
-
+    def pack(self):
+        """
+        Flattens the generated level into a single int32 array:
+        header, rooms (x, y, w, h), junctions (x, y), cell ids, cell offsets
+        and regions.
+        The array is reused until the world changes: don't modify it.
+        """
+        cached = self._packed
+        if cached is not None and cached[0] is self.world and cached[1] == self.world.version:
+            return cached[2]
+
+        width, height = self.world.width, self.world.height
+        header = [
+            PACK_VERSION,
+            self.seed,
+            width,
+            height,
+            len(self.rooms),
+            self.current_region,
+            len(self.junctions),
+        ]
+
+        cell_ids = []
+        offsets = []
+        for row in self.world.grid:
+            for cell, (ox, oy) in row:
+                cell_ids.append(Registry.get_cell_id(cell.name))
+                offsets.append(ox | oy << 16)
+
+        packed = np.concatenate(
+            (
+                np.array(header, dtype=np.int32),
+                np.array(self.rooms, dtype=np.int32).reshape(-1),
+                np.array(self.junctions, dtype=np.int32).reshape(-1),
+                np.array(cell_ids, dtype=np.int32),
+                np.array(offsets, dtype=np.int32),
+                self.regions.reshape(-1),
+            )
+        )
+        self._packed = (self.world, self.world.version, packed)
+        return packed
+
+    def unpack(self, data):
+        """
+        Restores world, rooms, junctions and regions from an array made by
+        pack(). `data` may be a read-only memory map: regions stay a view on it.
+        """
+        version = int(data[0])
+        if version not in PACK_HEADER_SIZES:
+            raise ValueError(f"Unsupported packed level version {version}")
+        header_size = PACK_HEADER_SIZES[version]
+        header = [int(v) for v in data[:header_size]]
+        _, seed, width, height, room_count, current_region = header[:6]
+        junction_count = header[6] if version >= 2 else 0
+
+        size = width * height
+        start = header_size
+        rooms = data[start:start + room_count * 4].reshape(-1, 4)
+        start += room_count * 4
+        junctions = data[start:start + junction_count * 2].reshape(-1, 2)
+        start += junction_count * 2
+        cell_ids = data[start:start + size].tolist()
+        start += size
+        offsets = data[start:start + size].tolist()
+        start += size
+
+        self.seed = seed
+        self.width, self.height = width, height
+        self._index = None
+        self.world = World(width, height)
+        self.world.load_ids(cell_ids, offsets, Registry.get_cell_palette())
+        self.rooms = [tuple(room) for room in rooms.tolist()]
+        self.junctions = [tuple(junction) for junction in junctions.tolist()]
+        self.regions = data[start:start + size].reshape(height, width)
+        self.current_region = current_region
+        return self.world
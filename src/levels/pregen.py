@@ -0,0 +1,89 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from config.settings import (
+    PREGEN_ENABLED,
+    PREGEN_LOOKAHEAD,
+    PREGEN_WAIT_TIMEOUT,
+    PREGEN_WORKERS,
+)
+from core.registry import Registry
+from levels.cache import ENVIRONMENTS_PATH, level_cache
+from levels.loader import WorldLoader
+
+
+def _generate_packed(seed):
+    """
+    Worker entry point: generates (or fetches from the cache) the level for
+    `seed` and returns it packed, which pickles as a single compact array.
+    """
+    if Registry.get_cell("Wall") is None:
+        # Fresh (spawned) worker: cells are needed, textures are not
+        Registry.load_cells(ENVIRONMENTS_PATH, load_textures=False)
+    loader = WorldLoader(seed)
+    level_cache.load_or_generate(loader)
+    return loader.pack()
+
+
+class LevelPregenerator:
+    """
+    Generates upcoming levels in a worker process while the current one is
+    played. `load` uses the worker's result when it is ready in time and
+    falls back to generating synchronously otherwise.
+    """
+
+    def __init__(self, workers=PREGEN_WORKERS, lookahead=PREGEN_LOOKAHEAD,
+                 wait_timeout=PREGEN_WAIT_TIMEOUT, enabled=PREGEN_ENABLED):
+        self.workers = workers
+        self.lookahead = lookahead
+        self.wait_timeout = wait_timeout
+        self.enabled = enabled
+        self._executor = None
+        self._pending = {}  # seed -> Future
+
+    def _get_executor(self):
+        if self._executor is None:
+            # Not "fork": the game already runs threads (debug console sink,
+            # texture decoding), and forking while one of them holds a lock
+            # can deadlock the worker. Workers load the cells headless
+            # (see _generate_packed); main.py only starts the game under
+            # its __main__ guard
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=context
+            )
+        return self._executor
+
+    def schedule(self, seeds):
+        """Starts generating the given seeds in the background."""
+        if not self.enabled:
+            return
+        for seed in seeds:
+            if seed in self._pending:
+                continue
+            try:
+                self._pending[seed] = self._get_executor().submit(_generate_packed, seed)
+            except RuntimeError as e:  # Pool broken or shut down
+                print(f"Level pregeneration unavailable: {e}")
+                self.enabled = False
+                return
+
+    def load(self, loader):
+        """Fills `loader` with its level, pregenerated if possible."""
+        future = self._pending.pop(loader.seed, None)
+        if future is not None:
+            try:
+                return loader.unpack(future.result(timeout=self.wait_timeout))
+            except TimeoutError:
+                print(f"Level {loader.seed} not pregenerated in time, generating now.")
+                future.cancel()
+            except Exception as e:
+                print(f"Level pregeneration failed for {loader.seed}: {e}")
+
+        return level_cache.load_or_generate(loader)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
@@ -1,8 +1,23 @@
+import argparse
 import random
 
+from core.profiler import startup_trace
+
 random.seed(39)
-from core.game import gameInstance
 
-if __name__ == "__main__":
 
-    gameInstance.run()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the game.")
+    parser.add_argument("--startup-trace", action="store_true",
+                        help="Print the time to the first frame, by startup phase")
+    args = parser.parse_args(argv)
+    startup_trace.enabled = args.startup_trace
+
+    with startup_trace.phase("imports"):
+        from core.game import Game
+    game = Game()
+    game.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import sys
+import os
+import math
+import random
+import unittest
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from combat.combat_manager import CombatManager
+from combat.weapon import Weapon
+from core.archetypes import EnemyArchetype
+from core.logic import GameLogic
+from core.pickups import PickupStore
+from core.pool import pool_manager
+from core.spatial import SpatialIndex
+from entities.enemy import Enemy
+from entities.xp_orb import XPOrb
+
+
+class FakeEnemy:
+    def __init__(self, x, y, health=100):
+        self.x = x
+        self.y = y
+        self.health = health
+
+    def take_damage(self, amount, show_text=True):
+        assert not show_text, "Attacks show one text for all their targets"
+        self.health -= amount
+
+
+class TestAreaOfEffect(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(8)
+        self.enemies = [FakeEnemy(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(300)]
+        self.weapon = Weapon("staff", "Staff", damage=30, range=400, cooldown=0, is_aoe=True, aoe_radius=150)
+
+    def test_targets_match_distance_check(self):
+        primary = self.enemies[0]
+        expected = {
+            id(e) for e in self.enemies
+            if math.hypot(primary.x - e.x, primary.y - e.y) <= self.weapon.aoe_radius
+        }
+        for enemies in (self.enemies, SpatialIndex(self.enemies)):
+            targets = self.weapon.get_targets(primary, enemies)
+            self.assertEqual({id(e) for e in targets}, expected)
+
+    def test_batched_damage_spawns_one_text(self):
+        spawned = []
+        game = SimpleNamespace(damage_texts=SimpleNamespace(
+            spawn=lambda x, y, amount, count=1: spawned.append((amount, count))
+        ))
+        combat = CombatManager(SimpleNamespace(x=0, y=0, damage_mult=2.0, game=game))
+        combat.weapons.append(self.weapon)
+        self.enemies[1].health = 50
+
+        primary = self.enemies[0]
+        targets = self.weapon.get_targets(primary, self.enemies)
+        killed = combat.apply_damage(targets, 60, primary)
+
+        self.assertEqual(spawned, [(60, len(targets))])
+        self.assertEqual(killed, sum(1 for e in targets if e.health <= 0))
+        self.assertTrue(all(e.health in (40, -10) for e in targets))
+
+    def test_batched_kill_drops_xp_and_releases_the_enemy(self):
+        texts = []
+        game = SimpleNamespace(
+            damage_texts=SimpleNamespace(spawn=lambda *args, **kwargs: texts.append(args)),
+            pickups=PickupStore(),
+            player=SimpleNamespace(luck_mult=0),  # No item drops
+        )
+        config = EnemyArchetype("test_slime", health=50, xp_value=7)
+        dead, alive = Enemy(game, 10, 20, config=config), Enemy(game, 40, 20, config=config)
+        alive.health = 500
+        game.gridObjects = [dead, alive]
+        combat = CombatManager(SimpleNamespace(x=0, y=0, damage_mult=1.0, game=game))
+        combat.weapons.append(self.weapon)
+
+        self.assertEqual(combat.apply_damage([dead, alive], 60, dead), 1)
+        GameLogic(game)._handle_spawning_and_drops()
+
+        self.assertEqual(len(texts), 1)
+        orbs = [obj for obj in game.gridObjects if isinstance(obj, XPOrb)]
+        self.assertEqual([(orb.x, orb.y, orb.value) for orb in orbs], [(10, 20, 7)])
+        self.assertNotIn(dead, game.gridObjects)
+        self.assertIn(alive, game.gridObjects)
+        self.assertIs(pool_manager.get_pool(Enemy).free[-1], dead)
+
+
+if __name__ == "__main__":
+    unittest.main()
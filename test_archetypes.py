@@ -0,0 +1,92 @@
+import sys
+import os
+import json
+import tempfile
+import unittest
+from dataclasses import FrozenInstanceError
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config.settings import BASE_DIR
+from core import archetypes
+from core.archetypes import EnemyArchetype, load_archetypes
+from entities.enemy import Enemy
+from items.item import Item
+
+
+class TestArchetypes(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.directory.name, "cache")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _write(self, name, data):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as f:
+            json.dump(data, f)
+        return path
+
+    def _load(self, kind, path, base_dir=None):
+        return load_archetypes(kind, path, base_dir, cache_dir=self.cache_dir)
+
+    def test_items_are_compiled_per_rarity(self):
+        path = os.path.join(BASE_DIR, "config", "items.json")
+        items = {(item.name, item.rarity): item for item in self._load("items", path, BASE_DIR)}
+
+        boots = items[("Speed Boots", "legendary")]
+        self.assertEqual(boots.effects["speed"]["value"], 0.3)
+        self.assertEqual(items[("Speed Boots", "common")].effects["speed"]["value"], 0.1)
+        with self.assertRaises(FrozenInstanceError):
+            boots.duration = 1
+        with self.assertRaises(TypeError):
+            boots.effects["speed"]["value"] = 1  # Shared by every item, read-only
+
+    def test_cache_matches_compilation_until_the_file_changes(self):
+        path = self._write("enemies.json", {"slime": {"health": 30, "color": [0, 255, 0]}})
+        compiled = self._load("enemies", path)
+        with mock.patch.object(archetypes, "_compile") as compile_:
+            cached = self._load("enemies", path)
+        compile_.assert_not_called()
+        self.assertEqual(cached, compiled)
+        self.assertEqual(cached[0].color, (0, 255, 0))
+
+        self._write("enemies.json", {"slime": {"health": 45}})
+        os.utime(path, ns=(0, 0))  # Same size, different modification time
+        self.assertEqual(self._load("enemies", path)[0].health, 45)
+
+    def test_invalid_entries_are_skipped(self):
+        path = self._write("weapons.json", {
+            "stick": {"name": "Stick", "damage": 1, "range": 10, "cooldown": 100},
+            "broken": {"name": "Broken", "damage": "a lot", "range": 10, "cooldown": 100},
+            "no_range": {"name": "No Range", "damage": 1, "cooldown": 100},
+        })
+        self.assertEqual([weapon.id for weapon in self._load("weapons", path)], ["stick"])
+
+    def test_spawning_copies_the_archetype(self):
+        archetype = EnemyArchetype("slime", health=30, width=2, height=2, xp_value=4)
+        enemy = Enemy(None, 5, 6, "slime", config=archetype)
+        self.assertEqual((enemy.x, enemy.y, enemy.w, enemy.h), (5, 6, 2, 2))
+        self.assertEqual((enemy.health, enemy.max_health, enemy.xp_value), (30, 30, 4))
+
+        enemy.health = 1
+        enemy.reset(None, 0, 0, "slime", config=archetype)
+        self.assertEqual(enemy.health, 30)
+        self.assertEqual(archetype.state["health"], 30)
+
+    def test_item_from_archetype(self):
+        path = self._write("items.json", [{
+            "name": "Feather", "type": "stat_upgrade", "allowed_rarities": ["rare"],
+            "effects": {"speed": {"op": "add", "value": 0.2}}, "description": "Light.",
+        }])
+        item = Item(1, 2, self._load("items", path)[0])
+        self.assertEqual((item.x, item.y, item.name, item.rarity), (1, 2, "Feather", "rare"))
+        self.assertEqual(item.effects["speed"]["value"], 0.3)
+        self.assertEqual(item.item_color, item.rarity_color)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import sys
+import os
+import tempfile
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config.settings import BASE_DIR, CELL_SIZE
+from core.physics import check_collision, check_collisions
+from core.registry import Registry
+from levels.chunked import ChunkedWorld
+
+Registry.load_cells(os.path.join(BASE_DIR, "config", "environments.json"), load_textures=False)
+
+
+class TestChunkedWorld(unittest.TestCase):
+    def setUp(self):
+        self.swap = tempfile.TemporaryDirectory()
+        self.world = ChunkedWorld(5, width=75, height=75, chunk_size=25,
+                                  load_radius=1, evict_radius=1, swap_dir=self.swap.name)
+
+    def tearDown(self):
+        self.swap.cleanup()
+
+    def test_borders_are_stitched(self):
+        world = self.world
+        world.update_focus(0, 0)
+        # The opening between chunks (0, 0) and (1, 0) is open on both sides
+        y = world._edge_opening(0, 0, "x")
+        self.assertTrue(world.get_cell(24, y).walkable)
+        self.assertTrue(world.get_cell(25, y).walkable)
+
+    def test_far_chunks_are_evicted_and_restored(self):
+        world = self.world
+        water = Registry.get_cell("Water")
+        world.set_cell(3, 3, water)
+
+        world.update_focus(70 * CELL_SIZE, 70 * CELL_SIZE)
+        self.assertNotIn((0, 0), world.chunks)
+        self.assertLessEqual(len(world.chunks), 4)
+
+        world.update_focus(0, 0)
+        self.assertIs(world.get_cell(3, 3), water)
+
+    def test_unloaded_chunks_read_as_walls(self):
+        world = self.world
+        world.update_focus(0, 0)  # (2, 2) stays out of the load radius
+        cell, offset = world.get_cell_full(60, 60)
+        self.assertIs(cell, world.unloaded_cell)
+        self.assertFalse(cell.walkable)
+        self.assertNotIn((2, 2), world.chunks)  # Not loaded by the lookup
+
+    def test_batch_collisions(self):
+        world = self.world
+        world.update_focus(0, 0)
+        y = world._edge_opening(0, 0, "x")
+        bounds = (0, 0, world.width * CELL_SIZE, world.height * CELL_SIZE)
+        boxes = [
+            (24 * CELL_SIZE, y * CELL_SIZE, 1, 1),  # Opening between two chunks
+            (60 * CELL_SIZE, 60 * CELL_SIZE, 1, 1),  # Chunk not loaded
+            (-CELL_SIZE, 0, 1, 1),  # Out of bounds
+        ]
+        blocked = check_collisions(boxes, bounds, world)
+        expected = [check_collision(*box, bounds, world) is not False for box in boxes]
+        self.assertEqual(blocked.tolist(), expected)
+        self.assertEqual(expected, [False, True, True])
+
+    def test_modified_chunks_restore_into_a_new_world(self):
+        water = Registry.get_cell("Water")
+        self.world.set_cell(3, 3, water)
+        self.world.update_focus(70 * CELL_SIZE, 70 * CELL_SIZE)  # (0, 0) swapped out
+        dirty = list(self.world.dirty_chunks())
+        self.assertEqual([key for key, _ in dirty], [(0, 0)])
+
+        with tempfile.TemporaryDirectory() as swap:
+            world = ChunkedWorld(5, width=75, height=75, chunk_size=25, swap_dir=swap)
+            for key, packed in dirty:
+                world.restore_chunk(key, packed)
+            world.update_focus(0, 0)
+            self.assertIs(world.get_cell(3, 3), water)
+
+
+if __name__ == "__main__":
+    unittest.main()
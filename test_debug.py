@@ -0,0 +1,97 @@
+import sys
+import os
+import io
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from core.debug import DebugOverlay, ConsoleSink, DEBUG, INFO, WARNING
+
+
+class CountingArg:
+    """Counts how many times the message was formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "arg"
+
+
+class TestDebugLog(unittest.TestCase):
+    def setUp(self):
+        self.debug = DebugOverlay()
+        self.saved = (self.debug.level, self.debug.categories, self.debug.sink, self.debug.messages)
+        self.stream = io.StringIO()
+        self.debug.sink = ConsoleSink(stream=self.stream)
+        self.debug.messages = []
+        self.debug.recent = {}
+        self.debug.level = INFO
+        self.debug.categories = None
+
+    def tearDown(self):
+        self.debug.sink.close()
+        self.debug.level, self.debug.categories, self.debug.sink, self.debug.messages = self.saved
+
+    def test_filtered_messages_are_not_formatted(self):
+        arg = CountingArg()
+        self.debug.log("hidden %s", arg, level=DEBUG)
+        self.debug.categories = {"save"}
+        self.debug.log("other category %s", arg, category="combat")
+        self.assertEqual(arg.formatted, 0)
+        self.assertEqual(self.debug.messages, [])
+
+        self.debug.log("shown %s", arg, level=WARNING, category="save")
+        self.assertEqual(arg.formatted, 1)
+        self.assertTrue(self.debug.enabled(WARNING, "save"))
+        self.assertFalse(self.debug.enabled(DEBUG, "save"))
+
+    def test_repeats_are_merged(self):
+        for _ in range(50):
+            self.debug.log("Enemy %s died", 3)
+        self.debug.flush()
+
+        self.assertEqual(len(self.debug.messages), 1)
+        self.assertEqual(self.debug.messages[0][0], "Enemy 3 died (x50)")
+        self.assertEqual(self.stream.getvalue(), "[DEBUG] Enemy 3 died\n")
+
+        self.debug.recent[("general", "Enemy %s died", (3,))][0] -= 10  # Window over
+        self.debug.log("Enemy %s died", 3)
+        self.debug.flush()
+        self.assertIn("repeated 49 more times", self.stream.getvalue())
+
+    def test_console_sink_writes_in_background(self):
+        self.debug.log(lambda: "built lazily")
+        self.debug.sink.close()
+        self.assertEqual(self.stream.getvalue(), "[DEBUG] built lazily\n")
+
+    def test_console_sink_drops_oldest(self):
+        sink = ConsoleSink(stream=io.StringIO(), max_lines=2)
+        sink._closed = True  # No background thread, flush by hand
+        for i in range(5):
+            sink.write(str(i))
+        sink.flush()
+        self.assertEqual(sink.stream.getvalue(), "3\n4\n[DEBUG] 3 log lines dropped\n")
+
+    def test_console_sink_counts_drops_while_flushing(self):
+        sink = ConsoleSink(stream=io.StringIO(), interval=0, max_lines=4)
+        for i in range(20000):  # Background thread flushes meanwhile
+            sink.write(str(i))
+        sink.close()
+        lines = sink.stream.getvalue().splitlines()
+        written = [line for line in lines if not line.startswith("[DEBUG]")]
+        dropped = sum(int(line.split()[1]) for line in lines if line.startswith("[DEBUG]"))
+        self.assertEqual(len(written) + dropped, 20000)
+
+    def test_callable_repeats_are_merged(self):
+        for _ in range(3):
+            self.debug.log(lambda: "built lazily")
+        self.debug.flush()
+        self.assertEqual(self.stream.getvalue(), "[DEBUG] built lazily\n")
+        self.assertEqual(self.debug.messages[0][0], "built lazily (x3)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config.settings import BASE_DIR
+from core.registry import Registry
+from levels.generators import GENERATORS
+from levels.index import label_components
+from levels.loader import WorldLoader
+
+Registry.load_cells(os.path.join(BASE_DIR, "config", "environments.json"), load_textures=False)
+
+
+class TestGenerators(unittest.TestCase):
+    def test_output_contract(self):
+        for name in GENERATORS:
+            with self.subTest(generator=name):
+                loader = WorldLoader(seed=4, width=41, height=41, room_amount=5, generator=name)
+                world = loader.generate()
+
+                self.assertTrue(loader.rooms)
+                for x, y, w, h in loader.rooms:
+                    self.assertTrue(world.walkable_mask[y:y + h, x:x + w].all())
+                self.assertEqual(loader.regions.shape, (41, 41))
+                self.assertEqual(loader.regions.max(), loader.current_region)
+
+                # Everything open is reachable through junctions
+                passable = bytearray(
+                    cell.walkable or cell.trigger == "door"
+                    for row in world.grid
+                    for cell, _ in row
+                )
+                _, sizes = label_components(passable, 41, 41)
+                self.assertEqual(len(sizes), 1)
+
+    def test_exits_stay_open(self):
+        for name in GENERATORS:
+            with self.subTest(generator=name):
+                loader = WorldLoader(seed=2, width=25, height=25, room_amount=3,
+                                     exits=[(0, 7), (24, 13)], generator=name)
+                world = loader.generate()
+                self.assertTrue(world.get_cell(0, 7).walkable)
+                self.assertTrue(world.get_cell(1, 7).walkable)
+                self.assertTrue(world.get_cell(24, 13).walkable)
+
+
+if __name__ == "__main__":
+    unittest.main()
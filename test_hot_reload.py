@@ -0,0 +1,101 @@
+import sys
+import os
+import json
+import tempfile
+import unittest
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from combat.factory import WeaponFactory
+from core import hot_reload
+from core.hot_reload import FileWatcher, HotReloader
+from core.registry import Registry
+from entities.enemy import Enemy
+
+
+class TestHotReload(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self._enemies = dict(Registry._enemies)
+
+    def tearDown(self):
+        Registry._enemies = self._enemies
+        self.directory.cleanup()
+
+    def _write(self, name, data, mtime):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as f:
+            f.write(data if isinstance(data, str) else json.dumps(data))
+        os.utime(path, ns=(mtime, mtime))  # Distinct even on coarse clocks
+        return path
+
+    def test_watcher_reports_changes(self):
+        config = self._write("a.json", "{}", 1)
+        missing = os.path.join(self.directory.name, "b.png")
+        watcher = FileWatcher([config, missing])
+        self.assertEqual(watcher.changed(), [])
+
+        self._write("a.json", "{}", 2)
+        self._write("b.png", "", 1)
+        self.assertEqual(sorted(watcher.changed()), sorted([config, missing]))
+        os.remove(missing)
+        self.assertEqual(watcher.changed(), [missing])
+
+    def test_poll_reloads_configs_using_a_changed_texture(self):
+        texture = self._write("slime.png", "", 1)
+        config = self._write("enemies.json", {"slime": {"texture_path": "slime.png"}}, 1)
+        reloader = HotReloader(SimpleNamespace(), interval=100, enabled=True)
+        reloaded = []
+        reloader.configs = {config: ("enemies", None, reloaded.append)}
+        reloader.watcher = FileWatcher(reloader.configs)
+        reloader._watch_textures()
+
+        self._write("slime.png", "", 2)
+        reloader.poll(50)  # Before the interval
+        self.assertEqual(reloaded, [])
+        reloader.poll(100)
+        self.assertEqual(reloaded, [config])
+        reloader.poll(200)
+        self.assertEqual(reloaded, [config])
+        self.assertIn(texture, reloader.textures)
+
+    def test_textures_are_listed_on_the_first_poll(self):
+        with mock.patch.object(hot_reload, "load_archetypes", return_value=[]) as load:
+            reloader = HotReloader(SimpleNamespace(), interval=100, enabled=True)
+            self.assertEqual(load.call_count, 0)  # Startup stays lazy
+            self.assertIsNone(reloader.textures)
+
+            reloader.poll(100)
+            self.assertEqual(load.call_count, len(reloader.configs))
+            self.assertEqual(reloader.textures, {})
+
+    def test_live_enemies_are_patched(self):
+        config = self._write("enemies.json", {"slime": {"health": 40, "speed": 1}}, 1)
+        Registry.load_enemies(config)
+        enemy = Enemy(None, 3, 4, "slime")
+        enemy.health = 10
+        game = SimpleNamespace(gridObjects=[enemy])
+
+        self._write("enemies.json", {"slime": {"health": 80, "speed": 3, "width": 2}}, 2)
+        HotReloader(game, enabled=False).reload_enemies(config)
+
+        self.assertEqual((enemy.x, enemy.y, enemy.w), (3, 4, 2))
+        self.assertEqual((enemy.speed, enemy.max_health, enemy.health), (3, 80, 20))
+
+    def test_weapon_keeps_its_upgrades(self):
+        weapon = WeaponFactory.create_weapon("basic_sword")
+        weapon.stats.add_modifier("damage", "add", 5)
+        archetype = WeaponFactory.get_archetype("basic_sword")
+
+        weapon.apply_archetype(replace(archetype, damage=archetype.damage * 2, tags=("melee",)))
+        self.assertEqual(weapon.damage, archetype.damage * 2 + 5)
+        self.assertEqual(weapon.tags, ["melee"])
+        self.assertIs(weapon.behavior_func, archetype.behavior_func)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import sys
+import os
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from levels.batch import FIELDS, main, summarize
+
+
+class TestLevelBatch(unittest.TestCase):
+    def test_small_run_writes_levels_and_summary(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "stats.json")
+            with contextlib.redirect_stderr(io.StringIO()):
+                main(["--seeds", "2", "--first-seed", "3", "--workers", "1", "--width", "30",
+                      "--height", "30", "--room-amount", "4", "--output", output])
+            with open(output) as f:
+                data = json.load(f)
+
+        self.assertEqual([level["seed"] for level in data["levels"]], [3, 4])
+        self.assertEqual(set(data["levels"][0]), set(FIELDS))
+        summary = data["summary"]
+        self.assertEqual(summary["levels"], 2)
+        for key in ("generation_ms_mean", "generation_ms_p50", "generation_ms_p95",
+                    "walkable_ratio_mean", "room_count_mean", "junction_count_mean",
+                    "connected_ratio"):
+            self.assertIn(key, summary)
+
+    def test_no_levels(self):
+        self.assertEqual(summarize([]), {"levels": 0})
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["--seeds", "0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
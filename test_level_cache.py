@@ -0,0 +1,130 @@
+import sys
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config.settings import BASE_DIR
+from core.registry import Registry
+from core.world import World
+from levels.loader import WorldLoader
+from levels import cache as cache_module
+from levels.cache import LevelCache
+from levels.pregen import LevelPregenerator
+
+Registry.load_cells(os.path.join(BASE_DIR, "config", "environments.json"))
+
+
+def cell_names(world):
+    return [[cell.name for cell, _ in row] for row in world.grid]
+
+
+class TestLevelCache(unittest.TestCase):
+    def test_pack_roundtrip(self):
+        loader = WorldLoader(seed=7)
+        world = loader.generate()
+
+        restored = WorldLoader(seed=0)
+        restored.unpack(loader.pack())
+
+        self.assertEqual(restored.seed, 7)
+        self.assertEqual(restored.rooms, loader.rooms)
+        self.assertEqual(cell_names(restored.world), cell_names(world))
+        self.assertTrue((restored.regions == loader.regions).all())
+        self.assertTrue(loader.junctions)
+        self.assertEqual(restored.junctions, loader.junctions)
+
+    def test_from_packed_skips_the_empty_grid(self):
+        loader = WorldLoader(seed=7)
+        self.assertIsNone(loader.world)  # Allocated by generate()
+        world = loader.generate()
+
+        with mock.patch("levels.loader.World", wraps=World) as world_class:
+            restored = WorldLoader.from_packed(loader.pack())
+        self.assertEqual(world_class.call_count, 1)  # Only the unpacked world
+        self.assertEqual(restored.seed, 7)
+        self.assertEqual(cell_names(restored.world), cell_names(world))
+
+    def test_unpacks_version_1(self):
+        loader = WorldLoader(seed=7)
+        world = loader.generate()
+        packed = loader.pack()
+        # Version 1: no junction count in the header, no junctions section
+        old = np.concatenate((packed[:6], packed[7:7 + len(loader.rooms) * 4],
+                              packed[7 + len(loader.rooms) * 4 + len(loader.junctions) * 2:]))
+        old[0] = 1
+
+        restored = WorldLoader(seed=0)
+        restored.unpack(old)
+        self.assertEqual(restored.rooms, loader.rooms)
+        self.assertEqual(restored.junctions, [])
+        self.assertEqual(cell_names(restored.world), cell_names(world))
+
+    def test_key_follows_environments_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "environments.json")
+            with open(path, "w") as f:
+                f.write("[]")
+            with mock.patch.object(cache_module, "ENVIRONMENTS_PATH", path):
+                cache = LevelCache(directory, enabled=True)
+                loader = WorldLoader(seed=3)
+                before = cache.key(loader)
+                self.assertEqual(cache.key(loader), before)
+
+                with open(path, "w") as f:
+                    f.write('[{"name": "Grass"}]')  # Hot reloaded
+                self.assertNotEqual(cache.key(loader), before)
+
+    def test_hit_uses_cached_level(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = LevelCache(directory, max_bytes=10**9, enabled=True)
+            first = WorldLoader(seed=3)
+            world = cache.load_or_generate(first)
+
+            second = WorldLoader(seed=3)
+            second.generate = None  # A hit must not regenerate
+            cached = cache.load_or_generate(second)
+
+            self.assertEqual(cell_names(cached), cell_names(world))
+            self.assertEqual(second.rooms, first.rooms)
+
+    def test_eviction_bounds_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = LevelCache(directory, max_bytes=1, enabled=True)
+            for seed in range(3):
+                cache.load_or_generate(WorldLoader(seed=seed))
+            self.assertLessEqual(len(os.listdir(directory)), 1)
+
+
+class TestLevelPregenerator(unittest.TestCase):
+    def test_pregenerated_level_matches_synchronous(self):
+        pregen = LevelPregenerator(workers=1, wait_timeout=60, enabled=True)
+        try:
+            pregen.schedule([11])
+            background = WorldLoader(seed=11)
+            pregen.load(background)
+        finally:
+            pregen.shutdown()
+
+        direct = WorldLoader(seed=11)
+        direct.generate()
+        self.assertEqual(cell_names(background.world), cell_names(direct.world))
+        self.assertEqual(background.rooms, direct.rooms)
+
+    def test_workers_are_not_forked(self):
+        # The game runs threads by then, a forked worker could deadlock
+        pregen = LevelPregenerator(workers=1, enabled=True)
+        try:
+            context = pregen._get_executor()._mp_context
+        finally:
+            pregen.shutdown()
+        self.assertNotEqual(context.get_start_method(), "fork")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import sys
+import os
+import random
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from core.world import Cell, World
+from levels.index import LevelIndex
+
+GRASS = Cell("Grass")
+WALL = Cell("Wall", walkable=False)
+
+
+class TestLevelIndex(unittest.TestCase):
+    def setUp(self):
+        # Two open areas split by a wall column at x = 10
+        self.world = World(20, 20)
+        for y in range(20):
+            self.world.set_cell(10, y, WALL)
+        self.index = LevelIndex(self.world, [(0, 0, 3, 3), (12, 12, 2, 2)], bucket_size=4)
+
+    def test_components(self):
+        self.assertEqual(self.index.component_count, 2)
+        self.assertEqual(self.index.component_at(10, 5), -1)
+        self.assertNotEqual(self.index.component_at(0, 0), self.index.component_at(19, 0))
+        self.assertEqual(len(self.index.cells), 20 * 20 - 20)
+
+    def test_room_cells(self):
+        self.assertEqual(len(self.index.room_cells[0]), 9)
+        self.assertEqual(len(self.index.room_cells[1]), 4)
+
+    def test_sample_near_is_reachable_and_in_radius(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            cell = self.index.sample_near(8, 8, 5, rng=rng)
+            self.assertIsNotNone(cell)
+            x, y = cell
+            self.assertLess(x, 10)  # Never across the wall
+            self.assertLessEqual((x - 8) ** 2 + (y - 8) ** 2, 25)
+
+    def test_sample_near_respects_exclusion(self):
+        rng = random.Random(2)
+        for _ in range(50):
+            cell = self.index.sample_near(5, 5, 4, rng=rng, exclude=(3, 3, 7, 7))
+            if cell:
+                self.assertFalse(3 <= cell[0] <= 7 and 3 <= cell[1] <= 7)
+
+    def test_doors_join_components(self):
+        door = Cell("Door", walkable=False, height=2, trigger="door")
+        self.world.set_cell(10, 8, door)
+        index = LevelIndex(self.world, [], bucket_size=4)
+        self.assertEqual(index.component_count, 1)
+        self.assertEqual(len(index.cells), 20 * 20 - 20)  # Doors aren't spawn cells
+
+        rng = random.Random(3)
+        sides = set()
+        for _ in range(200):
+            x, y = index.sample_near(8, 8, 5, rng=rng)
+            self.assertNotEqual(x, 10)
+            sides.add(x < 10)
+        self.assertEqual(sides, {True, False})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import sys
+import os
+import unittest
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config.settings import CELL_SIZE
+from core.archetypes import EnemyArchetype
+from core.lod import UpdateLOD
+from core.logic import GameLogic
+from core.pool import pool_manager
+from core.profiler import profiler
+from entities.enemy import Enemy
+
+
+class FakeEnemy:
+    def __init__(self, x):
+        self.x = x
+        self.y = 0
+        self.last_update = None
+        self.steps = []
+
+    def update(self, target_pos, dt=1):
+        self.steps.append(dt)
+        self.x -= dt
+
+
+class TestUpdateLOD(unittest.TestCase):
+    def setUp(self):
+        self.lod = UpdateLOD(tiers=((10, 1), (20, 2), (float("inf"), 4)))
+
+    def run_ticks(self, enemies, ticks):
+        for _ in range(ticks):
+            self.lod.update(enemies, (0, 0))
+
+    def test_tiers_cover_every_tick(self):
+        near, mid, far = (FakeEnemy(d * CELL_SIZE) for d in (5, 15, 80))
+        self.run_ticks([near, mid, far], 41)
+
+        self.assertEqual(near.steps, [1] * 41)
+        # After the first update, steps add up to the ticks elapsed
+        self.assertTrue(set(mid.steps[1:]) == {2} and set(far.steps[1:]) == {4})
+        self.assertIn(len(far.steps), (10, 11))
+        self.assertEqual(self.lod.counts, [1, 1, 1])
+        self.assertEqual(profiler.counters["lod.tier2"], 1)
+
+    def test_far_tier_is_staggered(self):
+        enemies = [FakeEnemy(100 * CELL_SIZE + i) for i in range(400)]
+        updated = []
+        for _ in range(8):
+            self.lod.update(enemies, (0, 0))
+            updated.append(profiler.counters["lod.updated"])
+        # Roughly a quarter of the tier per tick
+        for count in updated:
+            self.assertTrue(50 < count < 150, updated)
+        self.assertEqual(sum(updated), 800)
+
+    def test_tier_change_keeps_elapsed_time(self):
+        enemy = FakeEnemy(100 * CELL_SIZE)
+        self.run_ticks([enemy], 8)
+        enemy.x = 0
+        before = self.lod.tick - enemy.last_update
+        self.lod.update([enemy], (0, 0))
+        self.assertEqual(enemy.steps[-1], before + 1)
+
+    def test_pool_reuse_resets_last_update(self):
+        config = EnemyArchetype("test_slime")
+        enemy = pool_manager.acquire(Enemy, None, 0, 0, config=config)
+        self.lod.update([enemy], (0, 0))
+        self.assertEqual(enemy.last_update, 1)
+
+        pool_manager.release(enemy)
+        recycled = pool_manager.acquire(Enemy, None, 0, 0, config=config)
+        self.assertIs(recycled, enemy)
+        self.assertIsNone(recycled.last_update)
+
+    def test_reset(self):
+        enemies = [FakeEnemy(5 * CELL_SIZE)]
+        self.run_ticks(enemies, 3)
+        self.lod.reset()
+        self.assertEqual((self.lod.tick, self.lod.enemies, len(self.lod.positions)), (0, [], 0))
+
+    def test_positions_follow_the_moves(self):
+        enemies = [FakeEnemy(d * CELL_SIZE) for d in (5, 15, 80, 90)]
+        for _ in range(6):
+            self.lod.update(enemies, (0, 0))
+            self.assertEqual(self.lod.positions.tolist(), [[e.x, e.y] for e in enemies])
+
+    def test_next_tick_index_reuses_positions(self):
+        logic = GameLogic(SimpleNamespace())
+        logic.lod = self.lod
+        enemies = [FakeEnemy(d * CELL_SIZE) for d in (5, 15, 80)]
+        self.run_ticks(enemies, 3)
+
+        spawned = FakeEnemy(7 * CELL_SIZE)
+        index = logic._enemy_index(enemies + [spawned])
+        self.assertIs(index.nearest(0, 0), enemies[0])
+        self.assertEqual(index.positions.tolist(), [[e.x, e.y] for e in enemies + [spawned]])
+        self.assertIsNotNone(index._known_positions)
+
+        # Anything but spawns reads the positions again
+        index = logic._enemy_index(enemies[1:])
+        self.assertIsNone(index._known_positions)
+        self.assertIs(index.nearest(0, 0), enemies[1])
+
+    def test_unchanged_enemies_keep_the_index(self):
+        logic = GameLogic(SimpleNamespace())
+        logic.lod = self.lod
+        enemies = [FakeEnemy(d * CELL_SIZE) for d in (5, 15, 80, 90)]
+        self.run_ticks(enemies, 1)
+        index = logic._enemy_index(list(enemies))
+        index.nearest(0, 0)
+        for _ in range(12):
+            self.run_ticks(enemies, 1)
+            self.assertIs(logic._enemy_index(list(enemies)), index)  # Carried over
+            self.assertEqual(index.positions.tolist(), [[e.x, e.y] for e in enemies])
+            self.assertIs(index.nearest(0, 0), enemies[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config.settings import CELL_SIZE
+from core.world import Cell, World
+from core.physics import check_collision, check_collisions
+
+GRASS = Cell("Grass")
+WALL = Cell("Wall", walkable=False)
+BOUNDS = (0, 0, 10 * CELL_SIZE, 10 * CELL_SIZE)
+
+
+class TestPhysics(unittest.TestCase):
+    def setUp(self):
+        self.world = World(10, 10)
+        for y in range(10):
+            for x in range(10):
+                self.world.set_cell(x, y, GRASS)
+        self.world.set_cell(5, 5, WALL)
+
+    def test_bitmask_follows_set_cell(self):
+        self.assertEqual(self.world.walkable_mask[5, 5], 0)
+        self.world.set_cell(5, 5, GRASS)
+        self.assertEqual(self.world.walkable_mask[5, 5], 1)
+
+    def test_check_collision_reports_cell_origin(self):
+        self.assertFalse(check_collision(0, 0, 1, 1, BOUNDS, self.world))
+        hit = check_collision(4.5 * CELL_SIZE, 4.5 * CELL_SIZE, 1, 1, BOUNDS, self.world)
+        self.assertEqual(hit, (WALL, 5, 5))
+        self.assertIs(check_collision(-1, 0, 1, 1, BOUNDS, self.world), True)
+
+    def test_batch_matches_single_queries(self):
+        boxes = [
+            (x * 17.0, y * 23.0, 1, 1)
+            for x in range(30)
+            for y in range(22)
+        ]
+        expected = [
+            bool(check_collision(x, y, w, h, BOUNDS, self.world)) for x, y, w, h in boxes
+        ]
+        self.assertEqual(check_collisions(boxes, BOUNDS, self.world).tolist(), expected)
+
+    def test_batch_uses_the_same_units(self):
+        # Width and height in cells for both: from (4, 4), a 1.5 cell box
+        # reaches the wall at (5, 5) and a 1 cell box does not; from (9, 0),
+        # a 1.5 cell box leaves the bounds
+        boxes = [
+            (4 * CELL_SIZE, 4 * CELL_SIZE, 1.5, 1.5),
+            (4 * CELL_SIZE, 4 * CELL_SIZE, 1, 1),
+            (9 * CELL_SIZE, 0, 1.5, 0.5),
+        ]
+        single = [bool(check_collision(*box, BOUNDS, self.world)) for box in boxes]
+        self.assertEqual(single, [True, False, True])
+        self.assertEqual(check_collisions(boxes, BOUNDS, self.world).tolist(), single)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config.settings import CELL_SIZE
+from core.pickups import PickupStore
+from entities.pickup import Pickup
+from entities.xp_orb import XPOrb
+
+
+class TestPickupStore(unittest.TestCase):
+    def test_magnet_matches_move_towards(self):
+        orbs = [XPOrb(x, y, 1) for x, y in ((150, 100), (100, 160), (400, 400), (100, 100))]
+        expected = [XPOrb(orb.x, orb.y, 1) for orb in orbs]
+        store = PickupStore(orbs)
+
+        store.update(100, 100, CELL_SIZE, CELL_SIZE, magnet_range=100)
+
+        for orb, reference in zip(orbs, expected):
+            if reference.x != 400:  # Out of the magnet range
+                reference.move_towards(100, 100)
+            self.assertAlmostEqual(orb.x, reference.x)
+            self.assertAlmostEqual(orb.y, reference.y)
+
+    def test_collects_touching_pickups(self):
+        near, far = XPOrb(110, 110, 1), XPOrb(1000, 1000, 1)
+        store = PickupStore([near, "not a pickup", far])
+        self.assertEqual(len(store), 2)
+
+        collected = store.update(100, 100, CELL_SIZE, CELL_SIZE, magnet_range=0)
+        self.assertEqual(store.pop(collected), [near])
+        self.assertEqual(store.objects, [far])
+        self.assertEqual(store.x[0], 1000)
+
+    def test_grows_and_removes(self):
+        orbs = [XPOrb(i, 0, 1) for i in range(200)]
+        store = PickupStore(orbs)
+        store.remove(orbs[::2])
+        self.assertEqual(store.objects, orbs[1::2])
+        self.assertEqual(store.x[:len(store)].tolist(), [float(i) for i in range(1, 200, 2)])
+
+    def test_pickups_share_move_towards(self):
+        orb = XPOrb(0, 0, 1)
+        self.assertIsInstance(orb, Pickup)
+        orb.move_towards(30, 40)
+        self.assertAlmostEqual(orb.x, 12 * 0.6)
+        self.assertAlmostEqual(orb.y, 12 * 0.8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import sys
+import os
+import pickle
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from core.archetypes import EnemyArchetype
+from core.pool import ObjectPool
+from core.registry import Registry
+from entities.enemy import Enemy
+from entities.xp_orb import XPOrb
+
+
+class TestObjectPool(unittest.TestCase):
+    def test_reuse_and_stats(self):
+        pool = ObjectPool(XPOrb, max_size=1)
+        first = pool.acquire(0, 0, 5)
+        second = pool.acquire(10, 10, 5)
+        pool.release(first)
+        pool.release(second)  # Pool full, dropped
+
+        orb = pool.acquire(3, 4, 20)
+        self.assertIs(orb, first)
+        self.assertEqual((orb.x, orb.y, orb.value), (3, 4, 20))
+        self.assertEqual(pool.stats()["hits"], 1)
+        self.assertEqual(pool.stats()["misses"], 2)
+        self.assertEqual(pool.stats()["dropped"], 1)
+        self.assertAlmostEqual(pool.hit_rate, 1 / 3)
+
+
+class TestPooledEnemy(unittest.TestCase):
+    def setUp(self):
+        self._enemies = Registry._enemies
+        Registry._enemies = {
+            "basic_enemy": EnemyArchetype("basic_enemy", health=10, xp_value=3),
+            "tank": EnemyArchetype("tank", health=50, width=2, height=2),
+        }
+
+    def tearDown(self):
+        Registry._enemies = self._enemies
+
+    def test_reset_matches_fresh_enemy(self):
+        pool = ObjectPool(Enemy)
+        enemy = pool.acquire(None, 0, 0, enemy_type="tank")
+        enemy.health = -5
+        enemy.speed = 99
+        pool.release(enemy)
+
+        reused = pool.acquire(None, 50, 100, enemy_type="basic_enemy")
+        fresh = Enemy(None, 50, 100, enemy_type="basic_enemy")
+        self.assertIs(reused, enemy)
+        self.assertEqual(reused.generation, 2)  # Stale handles can tell
+        reused.generation = fresh.generation
+        self.assertEqual(reused.__dict__, fresh.__dict__)
+
+    def test_pooled_enemy_survives_save_load(self):
+        pool = ObjectPool(Enemy)
+        pool.release(pool.acquire(None, 0, 0, enemy_type="tank"))
+        enemy = pool.acquire(None, 50, 100, enemy_type="basic_enemy")
+
+        loaded = pickle.loads(pickle.dumps(enemy))
+        loaded.post_load()
+        self.assertEqual((loaded.x, loaded.y, loaded.health), (50, 100, 10))
+        self.assertEqual(loaded.enemy_type, "basic_enemy")
+
+        # Loaded entities can be released and reused like pooled ones
+        pool.release(loaded)
+        self.assertIs(pool.acquire(None, 0, 0), loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
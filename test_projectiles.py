@@ -0,0 +1,119 @@
+import sys
+import os
+import random
+import unittest
+from types import SimpleNamespace
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from combat.projectiles import ProjectileStore
+from config.settings import CELL_SIZE
+from core.spatial import SpatialIndex
+from core.world import Cell, World
+
+WALL = Cell("Wall", walkable=False)
+
+
+def enemy(x, y):
+    return SimpleNamespace(x=x, y=y, health=100)
+
+
+def fly(store, world, enemies, ticks=100):
+    impacts = []
+    for _ in range(ticks):
+        impacts.extend(store.update(world, SpatialIndex(enemies)))
+    return impacts
+
+
+class TestSegmentQuery(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = random.Random(5)
+        objects = [enemy(rng.uniform(0, 2000), rng.uniform(0, 2000)) for _ in range(400)]
+        index = SpatialIndex(objects, cell_size=200)
+        starts = np.array([(rng.uniform(0, 2000), rng.uniform(0, 2000)) for _ in range(100)])
+        ends = starts + np.array([(rng.uniform(-300, 300), rng.uniform(-300, 300)) for _ in range(100)])
+
+        segment, entity, t = index.query_segments(starts, ends, 40)
+
+        expected = set()
+        for i, (a, b) in enumerate(zip(starts, ends)):
+            for j, obj in enumerate(objects):
+                p = np.array((obj.x, obj.y))
+                d = b - a
+                u = np.clip(np.dot(p - a, d) / np.dot(d, d), 0, 1)
+                if np.linalg.norm(p - (a + d * u)) <= 40:
+                    expected.add((i, j))
+        self.assertEqual(set(zip(segment.tolist(), entity.tolist())), expected)
+        for i in range(100):
+            self.assertEqual(sorted(t[segment == i].tolist()), t[segment == i].tolist())
+
+
+class TestProjectiles(unittest.TestCase):
+    def setUp(self):
+        self.world = World(40, 10)
+
+    def test_pierce_hits_nearest_first(self):
+        enemies = [enemy(x * CELL_SIZE, 2 * CELL_SIZE) for x in (8, 4, 12, 6, 10)]
+        store = ProjectileStore()
+        store.fire(CELL_SIZE * 1.5, CELL_SIZE * 2.5, CELL_SIZE * 30, CELL_SIZE * 2.5,
+                   speed=20, damage=5, max_distance=2000, pierce=3)
+
+        impacts = fly(store, self.world, enemies)
+        hit = [targets[0].x // CELL_SIZE for _, _, _, targets, _, _ in impacts]
+        self.assertEqual(hit, [4, 6, 8])
+        self.assertEqual(len(store), 0)
+
+    def test_recycled_enemy_can_be_hit_again(self):
+        target = enemy(6 * CELL_SIZE, 2 * CELL_SIZE)
+        target.generation = 1
+        store = ProjectileStore()
+        store.fire(CELL_SIZE * 1.5, CELL_SIZE * 2.5, CELL_SIZE * 30, CELL_SIZE * 2.5,
+                   speed=20, damage=5, max_distance=2000, pierce=3)
+
+        hit = []
+        for _ in range(100):
+            for _, _, _, targets, _, _ in store.update(self.world, SpatialIndex([target])):
+                hit.append(targets[0].x // CELL_SIZE)
+                if target.generation == 1:
+                    # Killed and respawned by its pool further along the path
+                    target.generation += 1
+                    target.x = 14 * CELL_SIZE
+        self.assertEqual(hit, [6, 14])
+
+    def test_stops_at_walls(self):
+        for y in range(10):
+            self.world.set_cell(6, y, WALL)
+        enemies = [enemy(10 * CELL_SIZE, 2 * CELL_SIZE)]
+        store = ProjectileStore()
+        store.fire(CELL_SIZE * 1.5, CELL_SIZE * 2.5, CELL_SIZE * 30, CELL_SIZE * 2.5,
+                   speed=20, damage=5, max_distance=2000)
+
+        self.assertEqual(fly(store, self.world, enemies), [])
+        self.assertEqual(len(store), 0)
+
+    def test_explodes_on_first_enemy(self):
+        enemies = [enemy(x * CELL_SIZE, 2 * CELL_SIZE) for x in (8, 9, 20)]
+        store = ProjectileStore()
+        store.fire(CELL_SIZE * 1.5, CELL_SIZE * 2.5, CELL_SIZE * 30, CELL_SIZE * 2.5,
+                   speed=20, damage=5, max_distance=2000, aoe_radius=CELL_SIZE * 2)
+
+        impacts = fly(store, self.world, enemies)
+        self.assertEqual(len(impacts), 1)
+        x, _, _, targets, aoe_radius, _ = impacts[0]
+        self.assertLess(x, 8 * CELL_SIZE)
+        self.assertEqual({t.x // CELL_SIZE for t in targets}, {8, 9})
+        self.assertEqual(aoe_radius, CELL_SIZE * 2)
+
+    def test_range_limit(self):
+        store = ProjectileStore()
+        store.fire(0, 0, 100, 0, speed=30, damage=1, max_distance=100)
+        store.update(self.world, SpatialIndex([]))
+        for _ in range(3):
+            store.update(self.world, SpatialIndex([]))
+        self.assertEqual(len(store), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import sys
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config.settings import BASE_DIR
+from config.constants import OP_MULTIPLY
+from core.registry import Registry
+from core.save_format import encode, decode, SaveFormatError, VERSION, FLAG_ZLIB
+from core.save_manager import snapshot_game, restore_game, restore_level, write_save_file
+from core.camera import Camera
+from entities.enemy import Enemy
+from entities.player import Player
+from entities.xp_orb import XPOrb
+from items.factory import ItemFactory
+from items.item import Item
+from levels.loader import WorldLoader
+
+
+class TestSaveFormat(unittest.TestCase):
+    def test_round_trip(self):
+        tables = {
+            "enemies": {
+                "type": ["tank", "basic_enemy", "tank"],
+                "x": np.array([1.5, 2.5, 3.5]),
+                "alive": np.array([1, 0, 1], dtype="u1"),
+            },
+            "empty": {"x": np.empty(0), "name": []},
+        }
+        version, flags, loaded = decode(encode(tables, flags=6))
+
+        self.assertEqual((version, flags), (VERSION, 6))
+        self.assertEqual(loaded["enemies"]["type"], ["tank", "basic_enemy", "tank"])
+        np.testing.assert_array_equal(loaded["enemies"]["x"], [1.5, 2.5, 3.5])
+        self.assertEqual(loaded["enemies"]["alive"].dtype, np.uint8)
+        self.assertEqual(len(loaded["empty"]["x"]), 0)
+        self.assertEqual(loaded["empty"]["name"], [])
+
+    def test_rejects_bad_files(self):
+        data = encode({"t": {"x": np.arange(10.0)}})
+        with self.assertRaises(SaveFormatError):
+            decode(b"PK\x03\x04" + data[4:])
+        with self.assertRaises(SaveFormatError):
+            decode(data[:-8])
+        newer = bytearray(data)
+        newer[4:6] = (VERSION + 1).to_bytes(2, "little")
+        with self.assertRaises(SaveFormatError):
+            decode(bytes(newer))
+
+    def test_compressed_round_trip(self):
+        tables = {"t": {"x": np.zeros(1000), "name": ["a"] * 1000}}
+        data = encode(tables, compress_level=1)
+        version, flags, loaded = decode(data)
+
+        self.assertTrue(flags & FLAG_ZLIB)
+        self.assertLess(len(data), len(encode(tables)))
+        self.assertEqual(loaded["t"]["name"], ["a"] * 1000)
+        with self.assertRaises(SaveFormatError):
+            decode(data[:-8])
+
+    def test_atomic_write(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "save.sav")
+            write_save_file(path, {"t": {"x": np.arange(3.0)}})
+            write_save_file(path, {"t": {"x": np.arange(5.0)}})
+
+            self.assertEqual(os.listdir(directory), ["save.sav"])  # No temporary file left
+            with open(path, "rb") as f:
+                self.assertEqual(len(decode(f.read())[2]["t"]["x"]), 5)
+
+
+class TestGameRoundTrip(unittest.TestCase):
+    def setUp(self):
+        Registry.load_enemies(os.path.join(BASE_DIR, "config", "enemies.json"))
+
+    def test_snapshot_and_restore(self):
+        game = SimpleNamespace(gridObjects=[], camera=Camera())
+        player = Player(game, 100, 200, 1, 5)
+        game.player = player
+        token = player.stats.add_modifier("speed_mult", OP_MULTIPLY, 0.5)
+        player.combat.weapons[0].stats.add_modifier("damage", OP_MULTIPLY, 0.25)
+        player.collect_item(Item(0, 0, ItemFactory.get_item_data("Speed Potion", "common")))
+        player.xp = 42
+        game.camera.x = 64
+        enemy = Enemy(game, 10, 20, "basic_enemy")
+        enemy.health = 3
+        enemy.last_update = 50  # UpdateLOD tick of this session
+        game.gridObjects = [enemy, XPOrb(5, 6, 7)]
+
+        restored, camera, objects = restore_game(game, decode(encode(snapshot_game(game)))[2])
+
+        self.assertEqual((restored.x, restored.y, restored.xp), (100, 200, 42))
+        self.assertEqual(restored.speed_mult, player.speed_mult)
+        self.assertEqual(restored.combat.weapons[0].damage, player.combat.weapons[0].damage)
+
+        # Modifier tokens survive the save: the timed effect still reverts exactly
+        self.assertEqual([e["item"].name for e in restored.active_effects], ["Speed Potion"])
+        restored._expire_effect(restored.active_effects[0])
+        restored.stats.remove_modifier(token)
+        self.assertEqual(restored.speed_mult, 1.0)
+        self.assertEqual(camera.x, 64)
+        loaded_enemy, orb = objects
+        self.assertEqual((loaded_enemy.x, loaded_enemy.y, loaded_enemy.health), (10, 20, 3))
+        self.assertEqual(loaded_enemy.enemy_type, "basic_enemy")
+        self.assertIsNone(loaded_enemy.last_update)
+        self.assertEqual((orb.x, orb.y, orb.value), (5, 6, 7))
+
+    def test_mixed_enemy_types_keep_their_order(self):
+        game = SimpleNamespace(gridObjects=[], camera=Camera())
+        game.player = Player(game, 0, 0, 1, 5)
+        types = ["basic_enemy", "basic_enemy", "fast_enemy", "basic_enemy", "fast_enemy"]
+        game.gridObjects = [Enemy(game, i, i, enemy_type) for i, enemy_type in enumerate(types)]
+
+        _, _, objects = restore_game(game, decode(encode(snapshot_game(game)))[2])
+
+        self.assertEqual([enemy.enemy_type for enemy in objects], types)
+        self.assertEqual([enemy.x for enemy in objects], [0, 1, 2, 3, 4])
+        self.assertEqual([enemy.speed for enemy in objects], [e.speed for e in game.gridObjects])
+        self.assertIsNot(objects[0].__dict__, objects[1].__dict__)
+
+    def test_level_round_trip(self):
+        Registry.load_cells(os.path.join(BASE_DIR, "config", "environments.json"), load_textures=False)
+        loader = WorldLoader(1234, width=21, height=21, room_amount=3)
+        loader.generate()
+        game = SimpleNamespace(gridObjects=[], camera=Camera(), world=loader.world,
+                               setup=SimpleNamespace(world_loader=loader))
+        game.player = Player(game, 0, 0, 1, 5)
+
+        level = restore_level(decode(encode(snapshot_game(game), compress_level=1))[2])
+
+        self.assertIsNot(level.world, loader.world)
+        self.assertEqual(level.rooms, loader.rooms)
+        np.testing.assert_array_equal(level.pack(), loader.pack())
+        self.assertIsNone(restore_level({}))  # Saves without a level
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import sys
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config.settings import BASE_DIR
+from core.registry import Registry
+from core.save_format import decode
+from core.save_journal import SaveJournal, append_record, replay
+from core.save_manager import snapshot_game, write_save_file
+from core.camera import Camera
+from entities.enemy import Enemy
+from entities.player import Player
+from entities.xp_orb import XPOrb
+
+
+class TestSaveJournal(unittest.TestCase):
+    def setUp(self):
+        Registry.load_enemies(os.path.join(BASE_DIR, "config", "enemies.json"))
+        self.game = SimpleNamespace(gridObjects=[], camera=Camera())
+        self.game.player = Player(self.game, 100, 200, 1, 5)
+        self.enemies = [Enemy(self.game, i, i, "basic_enemy") for i in range(5)]
+        self.game.gridObjects = list(self.enemies)
+
+    def _snapshot(self, generation=1):
+        tables = snapshot_game(self.game)
+        tables["meta"] = {"generation": np.array([generation], dtype="<u8")}
+        return tables
+
+    def _play(self):
+        """Moves an enemy, kills another, drops an orb and gains XP."""
+        self.enemies[0].x = 50
+        self.game.gridObjects.remove(self.enemies[1])
+        self.game.gridObjects.append(XPOrb(7, 8, 9))
+        self.game.player.xp = 12
+
+    def test_diff_only_holds_changes(self):
+        journal = SaveJournal()
+        journal.reset(self._snapshot(), 1)
+        self.assertIsNone(journal.diff(snapshot_game(self.game)))
+
+        self._play()
+        delta = journal.diff(snapshot_game(self.game))
+
+        self.assertEqual(list(delta["player"]), ["xp"])
+        np.testing.assert_array_equal(delta["enemies"]["x"], [50])
+        np.testing.assert_array_equal(delta["enemies.removed"]["key"], [id(self.enemies[1])])
+        np.testing.assert_array_equal(delta["xp_orbs"]["value"], [9])
+        self.assertNotIn("camera", delta)
+        self.assertEqual(delta["meta"]["sequence"][0], 1)
+
+    def test_replay_restores_latest_state(self):
+        with tempfile.TemporaryDirectory() as directory:
+            save_path = os.path.join(directory, "save.sav")
+            journal_path = save_path + ".journal"
+            journal = SaveJournal()
+            base = self._snapshot()
+            journal.reset(base, 1)
+            write_save_file(save_path, base)
+
+            self._play()
+            append_record(journal_path, journal.diff(snapshot_game(self.game)))
+            self.enemies[2].health = 1
+            append_record(journal_path, journal.diff(snapshot_game(self.game)))
+            with open(journal_path, "ab") as f:
+                f.write(b"\x40\x00\x00\x00torn")  # Crash mid-append
+
+            with open(save_path, "rb") as f:
+                tables = decode(f.read())[2]
+            self.assertEqual(replay(tables, journal_path), 2)
+
+            expected = snapshot_game(self.game)
+            order = np.argsort(tables["enemies"]["key"])
+            expected_order = np.argsort(expected["enemies"]["key"])
+            for field in ("key", "x", "health"):
+                np.testing.assert_array_equal(
+                    tables["enemies"][field][order], expected["enemies"][field][expected_order]
+                )
+            self.assertEqual(tables["player"]["xp"][0], 12)
+            np.testing.assert_array_equal(tables["xp_orbs"]["value"], [9])
+
+    def test_ignores_journal_of_another_save(self):
+        with tempfile.TemporaryDirectory() as directory:
+            journal_path = os.path.join(directory, "save.sav.journal")
+            journal = SaveJournal()
+            journal.reset(self._snapshot(generation=1), 1)
+            self._play()
+            append_record(journal_path, journal.diff(snapshot_game(self.game)))
+
+            self.assertEqual(replay(self._snapshot(generation=2), journal_path), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
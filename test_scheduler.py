@@ -0,0 +1,92 @@
+import sys
+import os
+import unittest
+from types import SimpleNamespace
+import pygame
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from core.damages_text import DamageText, DamageTexts
+from core.pool import pool_manager
+from core.scheduler import Scheduler, scheduler
+
+
+class TestScheduler(unittest.TestCase):
+    def test_fires_in_deadline_order(self):
+        scheduler = Scheduler()
+        fired = []
+        for deadline in (300, 100, 200, 100):
+            scheduler.schedule(deadline, fired.append, deadline)
+
+        self.assertEqual(scheduler.update(50), 0)
+        self.assertEqual(scheduler.update(200), 3)
+        self.assertEqual(fired, [100, 100, 200])
+        self.assertEqual(len(scheduler), 1)
+
+    def test_cancel(self):
+        scheduler = Scheduler()
+        fired = []
+        timers = [scheduler.schedule(i, fired.append, i) for i in range(200)]
+        for timer in timers[::2]:
+            timer.cancel()
+        timers[0].cancel()  # Twice is harmless
+
+        self.assertEqual(len(scheduler), 100)
+        scheduler.update(99)
+        self.assertEqual(fired, list(range(1, 100, 2)))
+        self.assertEqual(len(scheduler), 50)
+        self.assertFalse(timers[1].pending)
+
+    def test_tick_only_touches_expired_timers(self):
+        scheduler = Scheduler()
+        calls = []
+        for i in range(10_000):
+            scheduler.schedule(1_000 + i, calls.append, i)
+        scheduler.schedule(10, calls.append, "soon")
+
+        scheduler.update(10)
+        self.assertEqual(calls, ["soon"])
+        self.assertEqual(len(scheduler), 10_000)
+
+    def test_callbacks_can_schedule(self):
+        scheduler = Scheduler()
+        fired = []
+        scheduler.schedule(10, lambda: scheduler.schedule(15, fired.append, "chained"))
+        scheduler.update(20)
+        self.assertEqual(fired, ["chained"])
+
+
+class TestDamageTexts(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.game = SimpleNamespace(current_time=1000)
+        self.texts = DamageTexts(self.game)
+
+    def test_texts_use_game_time(self):
+        self.texts.spawn(0, 0, 5)
+        (text, _), = self.texts.texts.values()
+        self.assertEqual(text.start_time, 1000)
+
+        self.game.current_time = 60_000  # Paused: no logic update
+        screen = pygame.Surface((100, 100))
+        text.draw(screen, SimpleNamespace(x=0, y=0), self.texts.now)
+        self.assertEqual(self.texts.now, 1000)
+
+        self.texts.update()
+        scheduler.update(self.game.current_time)
+        self.assertEqual(self.texts.texts, {})
+
+    def test_clear_releases_and_cancels(self):
+        for amount in range(3):
+            self.texts.spawn(0, 0, amount)
+        free = len(pool_manager.get_pool(DamageText).free)
+        self.texts.clear()
+
+        self.assertEqual(self.texts.texts, {})
+        self.assertEqual(len(pool_manager.get_pool(DamageText).free), free + 3)
+        scheduler.update(self.game.current_time + DamageText.DURATION)  # Timers cancelled
+
+
+if __name__ == "__main__":
+    unittest.main()
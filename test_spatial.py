@@ -0,0 +1,113 @@
+import sys
+import os
+import math
+import random
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from combat.combat_manager import CombatManager
+from core.archetypes import EnemyArchetype
+from core.pool import ObjectPool
+from core.registry import Registry
+from core.spatial import SpatialIndex
+from entities.base import EntityHandle
+from entities.enemy import Enemy
+
+
+def brute_force(points, x, y):
+    return sorted(range(len(points)), key=lambda i: (math.dist(points[i], (x, y)), i))
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(4)
+        self.points = [(rng.uniform(-500, 3000), rng.uniform(0, 2000)) for _ in range(500)]
+        self.objects = [SimpleNamespace(x=x, y=y) for x, y in self.points]
+        self.index = SpatialIndex(self.objects, cell_size=100)
+        self.queries = [(rng.uniform(-1000, 4000), rng.uniform(-500, 2500)) for _ in range(50)]
+
+    def test_k_nearest_matches_brute_force(self):
+        for x, y in self.queries:
+            expected = brute_force(self.points, x, y)[:5]
+            self.assertEqual(self.index.k_nearest(x, y, 5), expected)
+
+    def test_max_distance(self):
+        for x, y in self.queries:
+            expected = [
+                i for i in brute_force(self.points, x, y)[:3]
+                if math.dist(self.points[i], (x, y)) <= 150
+            ]
+            self.assertEqual(self.index.k_nearest(x, y, 3, max_distance=150), expected)
+
+    def test_query_radius(self):
+        for x, y in self.queries:
+            expected = {i for i, p in enumerate(self.points) if math.dist(p, (x, y)) <= 250}
+            self.assertEqual(set(self.index.query_radius(x, y, 250).tolist()), expected)
+
+    def test_move_matches_a_new_index(self):
+        rng = random.Random(5)
+        positions = np.array(self.points)
+        self.index.nearest(0, 0)  # Built
+        for step in range(20):
+            moved = np.array(sorted(rng.sample(range(len(self.points)), 40)), dtype=np.intp)
+            positions = positions.copy()
+            # Small steps (mostly within a cell), and once out of the grid
+            scale = 5000 if step == 10 else 60
+            positions[moved] += [(rng.uniform(-scale, scale), rng.uniform(-scale, scale)) for _ in moved]
+            self.index.move(moved, positions)
+
+            fresh = SpatialIndex(self.objects, cell_size=100, positions=positions)
+            for x, y in self.queries[:10]:
+                self.assertEqual(self.index.k_nearest(x, y, 5), fresh.k_nearest(x, y, 5))
+                self.assertEqual(
+                    sorted(self.index.query_radius(x, y, 250).tolist()),
+                    sorted(fresh.query_radius(x, y, 250).tolist()),
+                )
+
+    def test_empty(self):
+        index = SpatialIndex([])
+        self.assertIsNone(index.nearest(0, 0))
+        self.assertEqual(len(index.query_radius(0, 0, 10)), 0)
+
+
+class TestTargeting(unittest.TestCase):
+    def setUp(self):
+        self._enemies = Registry._enemies
+        Registry._enemies = {"basic_enemy": EnemyArchetype("basic_enemy", health=10)}
+
+    def tearDown(self):
+        Registry._enemies = self._enemies
+
+    def test_handle_goes_stale_when_recycled(self):
+        pool = ObjectPool(Enemy)
+        enemy = pool.acquire(None, 0, 0)
+        handle = EntityHandle(enemy)
+        self.assertIs(handle.get(), enemy)
+
+        enemy.health = 0
+        pool.release(enemy)
+        self.assertIs(pool.acquire(None, 5, 5), enemy)
+        self.assertIsNone(handle.get())
+
+    def test_retargets_when_target_dies(self):
+        owner = SimpleNamespace(x=0, y=0, damage_mult=1.0)
+        combat = CombatManager(owner)
+        combat.weapons.append(SimpleNamespace(range=100, can_attack=lambda t: False))
+
+        near, other = Enemy(None, 10, 0), Enemy(None, 50, 0)
+        combat.update([near, other], current_time=1000)
+        self.assertIs(combat.target, near)
+
+        near.health = 0
+        combat.update([other], current_time=1001)
+        self.assertIs(combat.target, other)
+        self.assertEqual(combat.find_nearest_targets([near, other], 2), [near, other])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import sys
+import os
+import unittest
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config.settings import CELL_SIZE
+from core.archetypes import EnemyArchetype
+from core.registry import Registry
+from core.spawner import SpawnDirector
+from core.world import Cell, World
+from entities.enemy import Enemy
+from levels.index import LevelIndex
+
+
+class TestSpawnDirector(unittest.TestCase):
+    def setUp(self):
+        self._enemies = Registry._enemies
+        Registry._enemies = {"basic_enemy": EnemyArchetype("basic_enemy", health=10)}
+
+        world = World(80, 80)
+        for y in range(80):
+            for x in range(80):
+                world.set_cell(x, y, Cell("Grass"))
+        self.game = SimpleNamespace(
+            world=world,
+            level_index=LevelIndex(world, []),
+            gridObjects=[],
+            player=SimpleNamespace(x=40 * CELL_SIZE, y=40 * CELL_SIZE, w=1, h=1),
+            camera=SimpleNamespace(x=25 * CELL_SIZE, y=30 * CELL_SIZE),
+        )
+
+    def tearDown(self):
+        Registry._enemies = self._enemies
+
+    def test_batch_and_window_limits(self):
+        director = SpawnDirector(self.game, max_enemies=100, window=1000,
+                                 max_per_window=12, batch_size=5)
+        self.assertEqual(len(director.update(0)), 5)
+        self.assertEqual(len(director.update(16)), 5)
+        self.assertEqual(len(director.update(32)), 2)  # Window exhausted
+        self.assertEqual(director.update(48), [])
+        self.assertEqual(len(director.update(1000)), 5)  # First batch expired
+
+    def test_live_enemy_budget(self):
+        director = SpawnDirector(self.game, max_enemies=7, max_per_window=100, batch_size=5)
+        for tick in range(10):
+            director.update(tick * 16)
+        self.assertEqual(director.live_enemies(), 7)
+
+        self.game.gridObjects.pop()
+        self.assertEqual(len(director.update(1000)), 1)
+
+    def test_spawns_outside_camera_view(self):
+        director = SpawnDirector(self.game, max_per_window=100, batch_size=50)
+        min_x, min_y, max_x, max_y = director._view_cells()
+        for enemy in director.update(0):
+            self.assertIsInstance(enemy, Enemy)
+            x, y = enemy.x // CELL_SIZE, enemy.y // CELL_SIZE
+            self.assertFalse(min_x <= x <= max_x and min_y <= y <= max_y)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import sys
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+import pygame
+from config.settings import BASE_DIR
+from core.assets import ImageCache
+from core.profiler import StartupTrace
+
+
+class TestStartup(unittest.TestCase):
+    def test_imports_have_no_side_effects(self):
+        if pygame.get_init():
+            self.skipTest("pygame already initialized in this process")
+        import core.game
+        import entities.player
+
+        self.assertFalse(pygame.get_init())
+        self.assertFalse(hasattr(core.game, "gameInstance"))
+
+    def test_trace_reports_phases_until_the_first_frame(self):
+        trace = StartupTrace()
+        with trace.phase("setup"):
+            with trace.phase("level"):
+                pass
+        trace.mark_first_frame()
+        with trace.phase("restart"):
+            pass
+
+        report = trace.report()
+        self.assertIn("  setup", report)
+        self.assertIn("    level", report)
+        self.assertNotIn("restart", report)
+
+
+class TestImageCache(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def tearDown(self):
+        pygame.display.quit()
+
+    def test_preloaded_images_are_decoded_once(self):
+        cache = ImageCache(workers=2)
+        path = os.path.join(BASE_DIR, "assets", "images", "wall.jpg")
+        cache.preload([path, os.path.join(BASE_DIR, "missing.png")])
+
+        image = cache.load(path)
+        self.assertIs(cache.load(os.path.join(BASE_DIR, "assets", "..", "assets", "images", "wall.jpg")), image)
+        self.assertEqual(image.get_size(), (641, 641))
+        cache.shutdown()
+
+    def test_scaled_copies_are_cached_until_invalidated(self):
+        cache = ImageCache(workers=1)
+        path = os.path.join(BASE_DIR, "assets", "images", "wall.jpg")
+        image = cache.load(path)
+
+        scaled = cache.scaled(image, (32, 32))
+        self.assertEqual(scaled.get_size(), (32, 32))
+        self.assertIs(cache.scaled(image, (32, 32)), scaled)
+        self.assertIsNot(cache.scaled(image, (16, 32)), scaled)
+
+        cache.invalidate(path)  # The file changed
+        reloaded = cache.load(path)
+        self.assertIsNot(reloaded, image)
+        self.assertEqual(cache._scaled, {})
+        self.assertIsNot(cache.scaled(reloaded, (32, 32)), scaled)
+        cache.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
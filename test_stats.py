@@ -0,0 +1,77 @@
+import sys
+import os
+import random
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from config.constants import OP_ADD, OP_MULTIPLY
+from core.stats import Stat, StatBlock
+from combat.weapon import Weapon
+from combat.combat_manager import CombatManager
+
+
+class Holder:
+    speed = Stat()
+
+    def __init__(self):
+        self.stats = StatBlock(speed=1.0)
+
+
+class TestStatBlock(unittest.TestCase):
+    def test_stacks_and_exact_reverts(self):
+        stats = StatBlock(speed=1.0)
+        rng = random.Random(3)
+        tokens = [
+            stats.add_modifier("speed", rng.choice((OP_ADD, OP_MULTIPLY)), rng.uniform(-0.3, 0.7))
+            for _ in range(500)
+        ]
+        self.assertNotEqual(stats.get("speed"), 1.0)
+        rng.shuffle(tokens)
+        for token in tokens:
+            stats.remove_modifier(token)
+        self.assertEqual(stats.get("speed"), 1.0)  # No drift
+
+    def test_adds_before_multipliers(self):
+        stats = StatBlock(damage=10)
+        stats.add_modifier("damage", OP_MULTIPLY, 0.5)
+        stats.add_modifier("damage", OP_ADD, 5)
+        self.assertEqual(stats.get("damage"), 22.5)
+
+    def test_lazy_recompute_through_attribute(self):
+        holder = Holder()
+        token = holder.stats.add_modifier("speed", OP_MULTIPLY, 0.5)
+        self.assertNotIn("speed", holder.stats.values)  # Dirty until read
+        self.assertEqual(holder.speed, 1.5)
+        self.assertIn("speed", holder.stats.values)
+
+        holder.speed = 2.0  # Writes set the base
+        self.assertEqual(holder.speed, 3.0)
+        holder.stats.remove_modifier(token)
+        self.assertEqual(holder.speed, 2.0)
+
+
+class Upgrade:
+    def __init__(self, effects):
+        self.name = "Upgrade"
+        self.target_weapon = "staff"
+        self.target_tag = None
+        self.effects = effects
+
+
+class TestWeaponUpgrades(unittest.TestCase):
+    def test_upgrades_stack_on_base_values(self):
+        weapon = Weapon("staff", "Staff", damage=10, range=100, cooldown=1000, aoe_radius=50)
+        combat = CombatManager(owner=None)
+        combat.add_weapon(weapon)
+
+        combat.apply_upgrade(Upgrade({"damage": {"op": OP_ADD, "value": 5}}))
+        combat.apply_upgrade(Upgrade({"cooldown": {"op": OP_MULTIPLY, "value": -0.1}}))
+        self.assertEqual(weapon.damage, 15)
+        self.assertEqual(weapon.cooldown, 900)
+        self.assertEqual(weapon.stats.base["damage"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
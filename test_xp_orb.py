@@ -0,0 +1,31 @@
+import sys
+import os
+import unittest
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+from entities.xp_orb import XPOrb, merge_orbs
+
+
+class TestMergeOrbs(unittest.TestCase):
+    def test_merges_orbs_sharing_a_bucket(self):
+        orbs = [XPOrb(0, 0, 1), XPOrb(10, 20, 2), XPOrb(60, 0, 4)]
+        merged = merge_orbs(orbs, 50, max_orbs=10)
+
+        self.assertEqual(merged, [orbs[1]])
+        self.assertEqual(orbs[0].value, 3)
+        self.assertEqual(orbs[2].value, 4)
+
+    def test_cap_keeps_total_value(self):
+        orbs = [XPOrb(x * 50, y * 50, 1) for x in range(20) for y in range(20)]
+        merged = merge_orbs(orbs, 50, max_orbs=30)
+
+        merged_ids = {id(orb) for orb in merged}
+        survivors = [orb for orb in orbs if id(orb) not in merged_ids]
+        self.assertLessEqual(len(survivors), 30)
+        self.assertEqual(sum(orb.value for orb in survivors), 400)
+
+
+if __name__ == "__main__":
+    unittest.main()